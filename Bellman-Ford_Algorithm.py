@@ -5,7 +5,11 @@
 
 
 import tkinter as tk  # Import the Tkinter library for GUI creation
+from tkinter import filedialog  # File picker for loading graph files
 import math  # Import math module to use infinity representation
+from Bellman_Ford_Solver import IncrementalBellmanFord, format_cycle  # Headless solver shared with the CLI
+from Graph_IO import read_edges  # Edge-list, CSV, DIMACS and binary graph loaders
+from Vertex_Index import VertexIndex  # Shared name <-> id interning table
 
 class BellmanFordApp:
     """GUI-based application for implementing the Bellman-Ford algorithm."""
@@ -16,8 +20,9 @@ class BellmanFordApp:
         self.root.title("Bellman-Ford Algorithm (GUI)")  # Set window title
         self.root.geometry("1200x700")  # Set full-screen size for better readability
 
-        self.vertices = []  # List to store vertices entered by the user
+        self.vertices = VertexIndex()  # Vertices entered by the user, with O(1) name lookups
         self.edges = []  # List to store edges along with weights
+        self.solver = None  # Shortest-path state of the last run, updated incrementally as edges are added
 
         # Labels and input fields for user interaction
         tk.Label(root, text="Enter Vertices (Comma-separated):", font=("Arial", 12)).grid(row=0, column=0, sticky="w", padx=10)
@@ -36,6 +41,7 @@ class BellmanFordApp:
         tk.Button(root, text="Set Vertices", font=("Arial", 12), command=self.set_vertices, width=15).grid(row=0, column=2, padx=10)
         tk.Button(root, text="Add Edge", font=("Arial", 12), command=self.add_edge, width=15).grid(row=1, column=2, padx=10)
         tk.Button(root, text="Run Bellman-Ford", font=("Arial", 12), command=self.run_bellman_ford, width=15).grid(row=2, column=2, padx=10)
+        tk.Button(root, text="Load Graph File", font=("Arial", 12), command=self.load_file, width=15).grid(row=3, column=1, padx=10)  # Bulk import from a file
         tk.Button(root, text="Clear Output", font=("Arial", 12), command=self.clear_output, width=15).grid(row=3, column=2, padx=10)  # Button to clear output
 
         # Output text box to display results
@@ -44,8 +50,9 @@ class BellmanFordApp:
 
     def set_vertices(self):
         """Extract and store vertices from user input."""
-        self.vertices = self.vertices_entry.get().split(",")  # Split input string by commas
-        self.vertices = [v.strip() for v in self.vertices]  # Remove extra spaces around vertices
+        names = self.vertices_entry.get().split(",")  # Split input string by commas
+        self.vertices = VertexIndex(v.strip() for v in names)  # Remove extra spaces around vertices and intern names to ids
+        self.solver = None  # New vertex set: the next run starts from scratch
         self.output_box.insert(tk.END, f"Vertices set: {', '.join(self.vertices)}\n")  # Display confirmation in output
 
     def add_edge(self):
@@ -62,15 +69,54 @@ class BellmanFordApp:
             if u in self.vertices and v in self.vertices:  # Ensure vertices exist
                 self.edges.append((u, v, weight))  # Store edge in list
                 self.output_box.insert(tk.END, f"Added Edge: {u} → {v} = {weight}\n")  # Confirm addition
+                if self.solver is not None:  # Repair the last run instead of recomputing everything
+                    report = self.solver.add_edge(u, v, weight)
+                    self.output_box.insert(tk.END, f"{report}\n")
+                    self.show_result(self.solver.result)
             else:
                 self.output_box.insert(tk.END, "Invalid vertices! Make sure they exist.\n")  # Error message for non-existent vertices
         except ValueError:
             self.output_box.insert(tk.END, "Weight must be an integer!\n")  # Error message for invalid weight input
 
+    def load_file(self):
+        """Load vertices and edges from an edge-list, CSV, DIMACS .gr or binary graph file."""
+        path = filedialog.askopenfilename(title="Open graph file")
+        if not path:
+            return
+        try:
+            self.vertices, edges = read_edges(path)
+        except (OSError, ValueError) as error:
+            self.output_box.insert(tk.END, f"Could not load {path}: {error}\n")
+            return
+        self.edges = edges
+        self.solver = None  # New graph: the next run starts from scratch
+        self.output_box.insert(tk.END, f"Loaded {len(self.vertices)} vertices and {len(edges)} edges from {path}\n")
+
     def clear_output(self):
         """Clears the output box for new inputs."""
         self.output_box.delete("1.0", tk.END)  # Clears all output text
 
+    def show_update(self, u, v, cost):
+        """Displays one successful relaxation."""
+        self.output_box.insert(tk.END, f"Updated Distance: {u} → {v}, New Cost: {cost}\n")  # Display update
+
+    def show_result(self, result):
+        """Displays final shortest paths; returns False if a negative cycle made them undefined."""
+        # Detect negative-weight cycles
+        if result.has_negative_cycle:
+            self.output_box.insert(tk.END, "\n⚠️ Graph contains a negative weight cycle!\n")  # Display cycle warning
+            self.output_box.insert(tk.END, "Cycle: " + format_cycle(result.negative_cycle, result.negative_cycle_weight) + "\n")
+            return False
+
+        # Display final shortest paths
+        self.output_box.insert(tk.END, "\n🔹 Final Shortest Paths from Source:\n")
+        for vertex in self.vertices:
+            if result.distances[vertex] == math.inf:
+                self.output_box.insert(tk.END, f"{result.source} → {vertex}: ∞ (No Path)\n")  # No valid path
+            else:
+                self.output_box.insert(tk.END, f"{result.source} → {vertex}: {result.distances[vertex]}\n")  # Display shortest path result
+        return True
+
     def run_bellman_ford(self):
         """Executes the Bellman-Ford algorithm and displays results."""
         source = self.source_entry.get().strip()  # Get source vertex from user input
@@ -78,31 +124,11 @@ class BellmanFordApp:
             self.output_box.insert(tk.END, "Invalid source vertex!\n")  # Error message
             return
 
-        num_vertices = len(self.vertices)  # Get number of vertices
-        distance = {vertex: math.inf for vertex in self.vertices}  # Initialize distances with infinity
-        distance[source] = 0  # Set source vertex distance to 0
-
-        # Execute Bellman-Ford Algorithm
+        # Execute Bellman-Ford Algorithm through the headless solver
         self.output_box.insert(tk.END, "\nStep-by-step Bellman-Ford execution:\n")
-        for _ in range(num_vertices - 1):  # Iterate |V| - 1 times
-            for u, v, weight in self.edges:  # Traverse all edges
-                if distance[u] != math.inf and distance[u] + weight < distance[v]:  # Relaxation condition
-                    distance[v] = distance[u] + weight  # Update distance
-                    self.output_box.insert(tk.END, f"Updated Distance: {u} → {v}, New Cost: {distance[v]}\n")  # Display update
-
-        # Detect negative-weight cycles
-        for u, v, weight in self.edges:
-            if distance[u] != math.inf and distance[u] + weight < distance[v]:  # If relaxation still occurs
-                self.output_box.insert(tk.END, "\n⚠️ Graph contains a negative weight cycle!\n")  # Display cycle warning
-                return
-
-        # Display final shortest paths
-        self.output_box.insert(tk.END, "\n🔹 Final Shortest Paths from Source:\n")
-        for vertex in self.vertices:
-            if distance[vertex] == math.inf:
-                self.output_box.insert(tk.END, f"{source} → {vertex}: ∞ (No Path)\n")  # No valid path
-            else:
-                self.output_box.insert(tk.END, f"{source} → {vertex}: {distance[vertex]}\n")  # Display shortest path result
+        self.solver = IncrementalBellmanFord(self.vertices, self.edges, source, on_relax=self.show_update)
+        if not self.show_result(self.solver.result):
+            return
 
         # Bellman-Ford Algorithm Explanation
         bellman_ford_explanation = f"""
@@ -126,6 +152,7 @@ class BellmanFordApp:
         self.output_box.insert(tk.END, bellman_ford_explanation)  # Add explanation to output
 
 # Run Tkinter App
-root = tk.Tk()  # Initialize Tkinter
-app = BellmanFordApp(root)  # Create an instance of the BellmanFordApp class
-root.mainloop()  # Run the GUI loop
\ No newline at end of file
+if __name__ == "__main__":
+    root = tk.Tk()  # Initialize Tkinter
+    app = BellmanFordApp(root)  # Create an instance of the BellmanFordApp class
+    root.mainloop()  # Run the GUI loop
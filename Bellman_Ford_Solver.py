@@ -0,0 +1,627 @@
+#code by Kartheek Vikash Meesala
+#email: letter2kartheekvikashmeesala@gmail.com
+#Headless Bellman-Ford engine, usable as a library or from the command line
+#https://github.com/kartheekvikash/Algorithms.git
+
+import argparse  # Import argparse for the command line interface
+import math  # Import math module to use infinity representation
+import sys  # Import sys for reading edge lists from stdin
+from collections import deque  # FIFO queue for the SPFA strategy
+from Graph_IO import FORMATS, read_edges  # Graph file loaders for the command line
+from Graph_Representations import convert, format_weight  # Backend conversion and weight display
+from Vertex_Index import VertexIndex  # Shared name <-> id interning table
+
+try:
+    import numpy as np  # Optional: only needed for the vectorized solver
+except ImportError:
+    np = None
+
+
+STRATEGIES = ("full", "early_exit", "spfa", "yen")  # Selectable relaxation strategies
+
+
+class BellmanFordResult:
+    """Outcome of a single-source Bellman-Ford run."""
+
+    def __init__(self, source, distances, predecessors, negative_cycles=(), unbounded=(), passes=0, edge_scans=0, relaxations=0):
+        self.source = source  # Source vertex the distances are measured from
+        self.distances = distances  # Vertex -> shortest distance (math.inf if unreachable)
+        self.predecessors = predecessors  # Vertex -> previous vertex on the shortest path
+        self.negative_cycles = list(negative_cycles)  # (vertices, total weight) for each negative cycle found
+        self.unbounded = set(unbounded)  # Vertices reachable from a reported negative cycle (distance is -∞)
+        self.passes = passes  # Number of relaxation passes (dequeued vertices for SPFA)
+        self.edge_scans = edge_scans  # Number of edges examined
+        self.relaxations = relaxations  # Number of successful distance updates
+
+    @property
+    def has_negative_cycle(self):
+        """True when a negative-weight cycle is reachable from the source."""
+        return bool(self.negative_cycles)
+
+    @property
+    def negative_cycle(self):
+        """Vertices of the first negative cycle found (in edge direction), or None."""
+        return self.negative_cycles[0][0] if self.negative_cycles else None
+
+    @property
+    def negative_cycle_weight(self):
+        """Total weight of the first negative cycle found, or None."""
+        return self.negative_cycles[0][1] if self.negative_cycles else None
+
+    def path_to(self, target):
+        """Returns the shortest path from the source to target as a list of vertices."""
+        if self.has_negative_cycle:
+            raise ValueError("Shortest paths are undefined: graph contains a negative weight cycle")
+        if self.distances.get(target, math.inf) == math.inf:
+            return []  # No path exists
+        path = [target]
+        while path[-1] != self.source:
+            path.append(self.predecessors[path[-1]])
+        path.reverse()
+        return path
+
+
+def _predecessor_cycles(predecessors, starts):
+    """
+    Follows predecessor links from every start vertex and returns each distinct cycle they run
+    into (in edge direction). Walks share their visited marks, so the total work is O(V).
+    """
+    reached_by = {}  # Vertex -> index of the walk that first reached it
+    cycles = []
+    for walk, start in enumerate(starts):
+        vertex = start
+        while vertex is not None and vertex not in reached_by:
+            reached_by[vertex] = walk
+            vertex = predecessors[vertex]
+        if vertex is None or reached_by[vertex] != walk:
+            continue  # Chain ends at the source or joins a chain an earlier walk explored
+        cycle = [vertex]
+        current = predecessors[vertex]
+        while current != vertex:
+            cycle.append(current)
+            current = predecessors[current]
+        cycle.reverse()  # Report the cycle in edge direction
+        cycles.append(cycle)
+    return cycles
+
+
+def _cycle_weights(cycles, edges):
+    """Total weight of each cycle, taking the cheapest of any parallel edges; one pass over the edges."""
+    cheapest = {}
+    for cycle in cycles:
+        for i, u in enumerate(cycle):
+            cheapest[(u, cycle[(i + 1) % len(cycle)])] = math.inf
+    for u, v, weight in edges:
+        if weight < cheapest.get((u, v), -math.inf):
+            cheapest[(u, v)] = weight
+    return [sum(cheapest[(u, cycle[(i + 1) % len(cycle)])] for i, u in enumerate(cycle)) for cycle in cycles]
+
+
+def _reachable_from(starts, edges):
+    """Vertices reachable from any of the start vertices (breadth-first, O(V + E))."""
+    outgoing = {}
+    for u, v, _ in edges:
+        outgoing.setdefault(u, []).append(v)
+    reached = set(starts)
+    queue = deque(reached)
+    while queue:
+        for v in outgoing.get(queue.popleft(), ()):
+            if v not in reached:
+                reached.add(v)
+                queue.append(v)
+    return reached
+
+
+class _Relaxer:
+    """Shared relaxation state and counters used by every strategy."""
+
+    def __init__(self, vertices, source, on_relax):
+        self.source = source
+        self.distance = {vertex: math.inf for vertex in vertices}  # Initialize distances with infinity
+        self.predecessor = {vertex: None for vertex in vertices}
+        self.distance[source] = 0  # Set source vertex distance to 0
+        self.on_relax = on_relax
+        self.passes = 0
+        self.edge_scans = 0
+        self.relaxations = 0
+
+    def sweep(self, edges):
+        """Relaxes every edge of the sequence once; returns True if any distance changed."""
+        distance, predecessor, on_relax = self.distance, self.predecessor, self.on_relax
+        changed = False
+        for u, v, weight in edges:  # Traverse all edges
+            du = distance[u]
+            if du != math.inf and du + weight < distance[v]:  # Relaxation condition
+                distance[v] = du + weight  # Update distance
+                predecessor[v] = u
+                self.relaxations += 1
+                changed = True
+                if on_relax is not None:
+                    on_relax(u, v, distance[v])
+        self.edge_scans += len(edges)
+        return changed
+
+    def violating_vertices(self, edges, first_only=True):
+        """
+        Returns the vertices that can still be relaxed after convergence (only the first by default),
+        pointing each one's predecessor at the violating edge.
+        """
+        distance, predecessor = self.distance, self.predecessor
+        violating = []
+        self.edge_scans += len(edges)
+        for u, v, weight in edges:
+            if distance[u] != math.inf and distance[u] + weight < distance[v]:  # If relaxation still occurs
+                predecessor[v] = u
+                violating.append(v)
+                if first_only:
+                    break
+        return violating
+
+    def negative_cycles(self, edges, starts):
+        """Recovers the negative cycles that the predecessor chains from starts lead into."""
+        cycles = _predecessor_cycles(self.predecessor, starts)
+        while not cycles:
+            # The predecessor chain can still lead back to the source when few passes ran;
+            # keep relaxing until the cycle shows up in the predecessor graph.
+            self.sweep(edges)
+            self.passes += 1
+            cycles = _predecessor_cycles(self.predecessor, self.distance)
+        return cycles
+
+
+def _run_full(relaxer, vertices, edges):
+    """Classic Bellman-Ford: always performs |V| - 1 passes over every edge."""
+    for _ in range(len(vertices) - 1):  # Iterate |V| - 1 times
+        relaxer.sweep(edges)
+        relaxer.passes += 1
+    return relaxer.violating_vertices(edges)
+
+
+def _run_early_exit(relaxer, vertices, edges):
+    """Bellman-Ford that stops as soon as a pass changes nothing."""
+    for _ in range(len(vertices) - 1):
+        relaxer.passes += 1
+        if not relaxer.sweep(edges):
+            return []  # Converged: no negative cycle can be reachable
+    return relaxer.violating_vertices(edges)
+
+
+def _run_yen(relaxer, vertices, edges):
+    """
+    Yen's ordering: edges are split into those going to a later vertex and those going to an
+    earlier one, and each pass relaxes the first group in vertex order and the second in reverse.
+    Any shortest path is covered after about |V| / 2 passes instead of |V| - 1.
+    """
+    position = {vertex: index for index, vertex in enumerate(vertices)}
+    forward = sorted((e for e in edges if position[e[0]] <= position[e[1]]), key=lambda e: position[e[0]])
+    backward = sorted((e for e in edges if position[e[0]] > position[e[1]]), key=lambda e: -position[e[0]])
+    for _ in range(len(vertices) // 2 + 1):
+        relaxer.passes += 1
+        changed = relaxer.sweep(forward)
+        changed = relaxer.sweep(backward) or changed
+        if not changed:
+            return []
+    return relaxer.violating_vertices(edges)
+
+
+def _run_spfa(relaxer, vertices, edges):
+    """
+    Shortest Path Faster Algorithm: a FIFO queue holds vertices whose distance changed,
+    and only their outgoing edges are rescanned.
+    """
+    outgoing = {vertex: [] for vertex in vertices}
+    for u, v, weight in edges:
+        outgoing[u].append((v, weight))
+
+    distance, predecessor, on_relax = relaxer.distance, relaxer.predecessor, relaxer.on_relax
+    num_vertices = len(vertices)
+    source = relaxer.source
+    hops = {source: 0}  # Edge count of the path that produced each distance
+    queue = deque([source])
+    queued = {source}
+    while queue:
+        relaxer.passes += 1
+        u = queue.popleft()
+        queued.discard(u)
+        du = distance[u]
+        relaxer.edge_scans += len(outgoing[u])
+        for v, weight in outgoing[u]:
+            if du + weight < distance[v]:
+                distance[v] = du + weight
+                predecessor[v] = u
+                relaxer.relaxations += 1
+                if on_relax is not None:
+                    on_relax(u, v, distance[v])
+                hops[v] = hops[u] + 1
+                if hops[v] >= num_vertices:
+                    # A simple path has at most |V| - 1 edges, so a longer one must loop
+                    if _predecessor_cycles(predecessor, [v]):
+                        return [v]
+                if v not in queued:
+                    queue.append(v)
+                    queued.add(v)
+    return []
+
+
+_RUNNERS = {"full": _run_full, "early_exit": _run_early_exit, "spfa": _run_spfa, "yen": _run_yen}
+
+
+def bellman_ford(vertices, edges, source, on_relax=None, strategy="early_exit", find_all_cycles=False):
+    """
+    Runs the Bellman-Ford algorithm without any GUI dependency.
+    :param vertices: Iterable of vertex names.
+    :param edges: Iterable of (u, v, weight) tuples.
+    :param source: Vertex to measure distances from.
+    :param on_relax: Optional callback(u, v, new_distance) invoked on every successful relaxation.
+    :param strategy: One of STRATEGIES: "full" (|V| - 1 passes), "early_exit" (stop on a quiet pass),
+        "spfa" (FIFO queue of changed vertices) or "yen" (two-pass vertex ordering).
+    :param find_all_cycles: Report every negative cycle in the predecessor graph instead of the first one.
+        Either way cycle recovery costs one extra pass over the edges plus O(V), not a second solve.
+    :return: BellmanFordResult with distances, predecessors, negative cycles and work counters.
+    """
+    if strategy not in _RUNNERS:
+        raise ValueError(f"Unknown strategy {strategy!r}, expected one of {', '.join(STRATEGIES)}")
+    index = VertexIndex.of(vertices)
+    vertices = list(index)
+    edges = list(edges)
+    if source not in index:
+        raise ValueError(f"Invalid source vertex: {source!r}")
+    for u, v, _ in edges:
+        if u not in index or v not in index:
+            raise ValueError(f"Edge {u} → {v} references an unknown vertex")
+
+    relaxer = _Relaxer(vertices, source, on_relax)
+    violating = _RUNNERS[strategy](relaxer, vertices, edges)
+    negative_cycles, unbounded = [], ()
+    if violating:
+        if find_all_cycles:
+            # Point every still-relaxable vertex at its violating edge, then walk the whole predecessor graph
+            violating += relaxer.violating_vertices(edges, first_only=False) + vertices
+        cycles = relaxer.negative_cycles(edges, violating)
+        negative_cycles = list(zip(cycles, _cycle_weights(cycles, edges)))
+        unbounded = _reachable_from([vertex for cycle in cycles for vertex in cycle], edges)
+    return BellmanFordResult(
+        source, relaxer.distance, relaxer.predecessor, negative_cycles=negative_cycles, unbounded=unbounded,
+        passes=relaxer.passes, edge_scans=relaxer.edge_scans, relaxations=relaxer.relaxations,
+    )
+
+
+# ---------------------------- Incremental Updates ---------------------------- #
+
+class UpdateReport:
+    """Work done by one incremental update, next to the cost of the last full solve."""
+
+    def __init__(self, relaxations, edge_scans, recomputed, full_relaxations, full_edge_scans):
+        self.relaxations = relaxations  # Distance updates made by this update
+        self.edge_scans = edge_scans  # Edges examined by this update
+        self.recomputed = recomputed  # True if the update fell back to a full solve
+        self.full_relaxations = full_relaxations  # Relaxations of the last full solve
+        self.full_edge_scans = full_edge_scans  # Edge scans of the last full solve
+
+    def __str__(self):
+        mode = "Full recompute" if self.recomputed else "Incremental update"
+        return (f"{mode}: {self.relaxations} relaxations, {self.edge_scans} edge scans "
+                f"(full solve: {self.full_relaxations} relaxations, {self.full_edge_scans} edge scans)")
+
+
+class IncrementalBellmanFord:
+    """
+    Keeps the distances and predecessors of the last solve and repairs them as edges change.
+    New edges and lowered weights only relax the vertices downstream of the changed edge;
+    weight increases and deletions of shortest-path tree edges fall back to a full solve.
+    """
+
+    def __init__(self, vertices, edges, source, on_relax=None, strategy="early_exit"):
+        self.vertices = list(vertices)
+        self.edges = list(edges)
+        self.source = source
+        self.on_relax = on_relax
+        self.strategy = strategy
+        self.outgoing = {vertex: [] for vertex in self.vertices}  # u -> [(v, weight), ...]
+        for u, v, weight in self.edges:
+            self.outgoing[u].append((v, weight))
+        self.result = None
+        self.recompute()
+
+    def recompute(self):
+        """Runs a full solve from scratch and returns its UpdateReport."""
+        self.result = bellman_ford(self.vertices, self.edges, self.source, self.on_relax, self.strategy)
+        return UpdateReport(self.result.relaxations, self.result.edge_scans, True,
+                            self.result.relaxations, self.result.edge_scans)
+
+    def _report(self, relaxations, edge_scans):
+        return UpdateReport(relaxations, edge_scans, False, self.result.relaxations, self.result.edge_scans)
+
+    def _is_tree_edge(self, u, v, weight):
+        """True if the edge u → v with this weight is the one the shortest path to v currently uses."""
+        distance = self.result.distances
+        return self.result.predecessors[v] == u and distance[u] + weight == distance[v]
+
+    def _propagate(self, u, v, weight):
+        """Relaxes the edge u → v, then everything downstream of v with a FIFO queue."""
+        distance, predecessor, on_relax = self.result.distances, self.result.predecessors, self.on_relax
+        if self.result.has_negative_cycle or distance[u] == math.inf or distance[u] + weight >= distance[v]:
+            return self._report(0, 1)  # Nothing downstream can change
+        distance[v] = distance[u] + weight
+        predecessor[v] = u
+        if on_relax is not None:
+            on_relax(u, v, distance[v])
+        relaxations, edge_scans = 1, 1
+        num_vertices = len(self.vertices)
+        hops = {v: 1}  # Edges after u on the improved path to each vertex
+        queue = deque([v])
+        queued = {v}
+        cycles = [[u]] if u == v else []
+        while queue and not cycles:
+            x = queue.popleft()
+            queued.discard(x)
+            dx = distance[x]
+            edge_scans += len(self.outgoing[x])
+            for y, w in self.outgoing[x]:
+                if dx + w < distance[y]:
+                    distance[y] = dx + w
+                    predecessor[y] = x
+                    relaxations += 1
+                    if on_relax is not None:
+                        on_relax(x, y, distance[y])
+                    hops[y] = hops[x] + 1
+                    # Improving the new edge's own tail, or a path longer than |V| edges, means a negative
+                    # cycle: either closed by the new edge or made reachable through it
+                    if y == u or hops[y] >= num_vertices:
+                        cycles = _predecessor_cycles(predecessor, [y])
+                        if cycles:
+                            break
+                    if y not in queued:
+                        queue.append(y)
+                        queued.add(y)
+        if cycles:
+            self.result.negative_cycles = list(zip(cycles, _cycle_weights(cycles, self.edges)))
+            self.result.unbounded = _reachable_from(cycles[0], self.edges)
+        return self._report(relaxations, edge_scans)
+
+    def add_edge(self, u, v, weight):
+        """Adds the edge u → v and repairs only the distances it improves."""
+        if u not in self.outgoing or v not in self.outgoing:
+            raise ValueError(f"Edge {u} → {v} references an unknown vertex")
+        self.edges.append((u, v, weight))
+        self.outgoing[u].append((v, weight))
+        return self._propagate(u, v, weight)
+
+    def update_edge(self, u, v, weight):
+        """Sets the weight of the edge u → v (adding it if missing)."""
+        for i, (target, old_weight) in enumerate(self.outgoing.get(u, ())):
+            if target == v:
+                break
+        else:
+            return self.add_edge(u, v, weight)
+        self.outgoing[u][i] = (v, weight)
+        self.edges[self.edges.index((u, v, old_weight))] = (u, v, weight)
+        if weight < old_weight:
+            return self._propagate(u, v, weight)
+        if self.result.has_negative_cycle or self._is_tree_edge(u, v, old_weight):
+            return self.recompute()
+        return self._report(0, 0)  # A heavier edge off the shortest-path tree changes nothing
+
+    def remove_edge(self, u, v):
+        """Removes one edge u → v; only a shortest-path tree edge forces a full solve."""
+        for i, (target, weight) in enumerate(self.outgoing.get(u, ())):
+            if target == v:
+                break
+        else:
+            raise ValueError(f"No edge {u} → {v}")
+        del self.outgoing[u][i]
+        self.edges.remove((u, v, weight))
+        if self.result.has_negative_cycle or self._is_tree_edge(u, v, weight):
+            return self.recompute()
+        return self._report(0, 0)
+
+
+# ---------------------------- Vectorized (NumPy) Solver ---------------------------- #
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("The vectorized Bellman-Ford solver requires NumPy (pip install numpy)")
+
+
+class EdgeArrays:
+    """
+    Edge list stored as contiguous arrays over interned integer vertex ids.
+    Edges are grouped by destination (offsets into src/weight per target vertex),
+    so a relaxation pass is one gather, one add and one segmented minimum.
+    """
+
+    def __init__(self, vertices, src, dst, weight):
+        _require_numpy()
+        self.vertices = VertexIndex.of(vertices)  # Vertex names <-> ids
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        weight = np.asarray(weight, dtype=np.float64)
+        order = np.argsort(dst, kind="stable")
+        self.src = src[order]
+        self.dst = dst[order]
+        self.weight = weight[order]
+        self.targets, self.offsets = np.unique(self.dst, return_index=True)  # Segment start per target
+
+    @classmethod
+    def from_edges(cls, vertices, edges):
+        """Interns vertex names to ids and packs (u, v, weight) tuples into arrays."""
+        vertices = VertexIndex.of(vertices)
+        src, dst, weight = vertices.intern_edges(edges)
+        return cls(vertices, src, dst, weight)
+
+    @classmethod
+    def from_graph(cls, graph):
+        """Builds edge arrays from any Graph_Representations backend, e.g. a memory-mapped binary file."""
+        graph = convert(graph, "csr")
+        degrees = np.diff(np.asarray(graph.offsets))
+        src = np.repeat(np.arange(len(graph.vertices)), degrees)
+        return cls(graph.vertices, src, np.asarray(graph.indices), np.asarray(graph.weights))
+
+    def __len__(self):
+        return len(self.src)
+
+
+class BatchedBellmanFordResult:
+    """Distance matrix for several sources computed in one vectorized run."""
+
+    def __init__(self, vertices, sources, distances, negative_cycle, passes):
+        self.vertices = vertices  # Column order of the distance matrix
+        self.sources = sources  # Row order of the distance matrix
+        self.distances = distances  # |S| x |V| float array, np.inf where unreachable
+        self.negative_cycle = negative_cycle  # Per-source flag: a negative cycle is reachable
+        self.passes = passes  # Relaxation passes performed
+
+    def distances_from(self, source):
+        """Returns the row for one source as a vertex -> distance dict."""
+        row = self.distances[self.sources.index(source)]
+        return {vertex: (math.inf if d == np.inf else d.item()) for vertex, d in zip(self.vertices, row)}
+
+
+def bellman_ford_vectorized(graph, sources, chunk_size=64):
+    """
+    Runs Bellman-Ford from every source at once over an EdgeArrays graph.
+    Each pass relaxes all edges for a whole chunk of sources with array operations,
+    and a chunk stops as soon as a pass changes none of its distances.
+    :param graph: EdgeArrays instance.
+    :param sources: Iterable of source vertex names.
+    :param chunk_size: Sources relaxed together; bounds the |S| x |E| temporary to chunk_size rows.
+    :return: BatchedBellmanFordResult.
+    """
+    _require_numpy()
+    sources = list(sources)
+    for source in sources:
+        if source not in graph.vertices:
+            raise ValueError(f"Invalid source vertex: {source!r}")
+
+    num_vertices = len(graph.vertices)
+    distances = np.full((len(sources), num_vertices), np.inf)
+    distances[np.arange(len(sources)), [graph.vertices.id_of(s) for s in sources]] = 0.0
+    negative = np.zeros(len(sources), dtype=bool)
+    passes = 0
+    if len(graph) == 0:
+        return BatchedBellmanFordResult(graph.vertices, sources, distances, negative, passes)
+
+    weight = graph.weight[:, None]
+    for start in range(0, len(sources), chunk_size):
+        # Vertex-major block (|V| x chunk): gathering by edge source then reads contiguous rows
+        block = np.ascontiguousarray(distances[start:start + chunk_size].T)
+        gathered = np.empty((len(graph), block.shape[1]))  # Reused per pass to avoid |E| x chunk allocations
+        for _ in range(num_vertices):  # |V| - 1 relaxation passes plus one detection pass
+            np.take(block, graph.src, axis=0, out=gathered)
+            np.add(gathered, weight, out=gathered)
+            candidate = np.minimum.reduceat(gathered, graph.offsets, axis=0)
+            current = block[graph.targets]
+            improved = candidate < current
+            if not improved.any():
+                break
+            block[graph.targets] = np.minimum(candidate, current, out=candidate)
+            passes += 1
+        else:
+            negative[start:start + chunk_size] = improved.any(axis=0)  # Still improving after |V| passes
+        distances[start:start + chunk_size] = block.T
+    return BatchedBellmanFordResult(graph.vertices, sources, distances, negative, passes)
+
+
+def parse_edge_lines(lines):
+    """Parses 'u v weight' lines (blank lines and '#' comments are skipped) into edge tuples."""
+    edges = []
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        data = line.split()
+        if len(data) != 3:
+            raise ValueError(f"Line {line_number}: invalid format, use: A B -2")
+        u, v, w = data
+        try:
+            weight = int(w)
+        except ValueError:
+            try:
+                weight = float(w)
+            except ValueError:
+                raise ValueError(f"Line {line_number}: invalid weight {w!r}, use: A B -2") from None
+        edges.append((u, v, weight))
+    return edges
+
+
+def format_cycle(cycle, weight):
+    """Renders a cycle as 'A → B → C → A (weight -3)'."""
+    return " → ".join(cycle + cycle[:1]) + f" (weight {weight})"
+
+
+def format_result(result, vertices):
+    """Renders a BellmanFordResult in the same layout as the GUI output."""
+    if result.has_negative_cycle:
+        lines = ["Graph contains a negative weight cycle!"]
+        for cycle, weight in result.negative_cycles:
+            lines.append(format_cycle(cycle, weight))
+        return "\n".join(lines) + "\n"
+    lines = ["Final Shortest Paths from Source:"]
+    for vertex in vertices:
+        if result.distances[vertex] == math.inf:
+            lines.append(f"{result.source} → {vertex}: ∞ (No Path)")  # No valid path
+        else:
+            lines.append(f"{result.source} → {vertex}: {format_weight(result.distances[vertex])}")
+    return "\n".join(lines) + "\n"
+
+
+def format_matrix(result):
+    """Renders a BatchedBellmanFordResult as one line of distances per source."""
+    lines = ["source\t" + "\t".join(result.vertices)]
+    for source, row, negative in zip(result.sources, result.distances, result.negative_cycle):
+        if negative:
+            lines.append(f"{source}\tnegative weight cycle")
+        else:
+            lines.append(source + "\t" + "\t".join("∞" if d == np.inf else f"{d:g}" for d in row))
+    return "\n".join(lines) + "\n"
+
+
+def main(argv=None):
+    """Command line entry point: reads an edge list and prints shortest paths."""
+    parser = argparse.ArgumentParser(description="Run Bellman-Ford on an edge list ('u v weight' per line).")
+    parser.add_argument("edges", nargs="?", default="-",
+                        help="Graph file (edge list, CSV, DIMACS .gr or binary), or '-' for an edge list on stdin (default)")
+    parser.add_argument("--format", choices=FORMATS, help="Graph file format (default: by extension)")
+    parser.add_argument("--source", required=True, help="Source vertex (comma-separated list with --vectorized)")
+    parser.add_argument("--vertices", help="Comma-separated vertex list (default: vertices seen in the edges)")
+    parser.add_argument("--strategy", choices=STRATEGIES, default="early_exit", help="Relaxation strategy")
+    parser.add_argument("--all-cycles", action="store_true", help="Report every negative cycle, not just the first")
+    parser.add_argument("--vectorized", action="store_true", help="Use the NumPy solver and print a distance matrix")
+    args = parser.parse_args(argv)
+
+    if args.edges == "-":
+        try:
+            edges = parse_edge_lines(sys.stdin)
+        except ValueError as error:
+            parser.error(str(error))
+        known = VertexIndex(x for u, v, _ in edges for x in (u, v))
+    else:
+        try:
+            known, edges = read_edges(args.edges, args.format or "auto")
+        except (OSError, ValueError) as error:
+            parser.error(f"Could not load {args.edges}: {error}")
+
+    if args.vertices:
+        vertices = VertexIndex(v.strip() for v in args.vertices.split(","))
+    else:
+        vertices = VertexIndex(args.source.split(","))
+        vertices.add_many(known)
+
+    if args.vectorized:
+        try:
+            result = bellman_ford_vectorized(EdgeArrays.from_edges(vertices, edges), args.source.split(","))
+        except ValueError as error:
+            parser.error(str(error))
+        sys.stdout.write(format_matrix(result))
+        return 1 if result.negative_cycle.any() else 0
+
+    try:
+        result = bellman_ford(vertices, edges, args.source, strategy=args.strategy, find_all_cycles=args.all_cycles)
+    except ValueError as error:
+        parser.error(str(error))
+    sys.stdout.write(format_result(result, vertices))
+    return 1 if result.has_negative_cycle else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+#code by Kartheek Vikash Meesala
+#email: letter2kartheekvikashmeesala@gmail.com
+#Thread-safe skip list: lock-free searches and range scans, per-node locks with optimistic validation for writers
+#https://github.com/kartheekvikash/Algorithms.git
+
+import threading  # Per-node locks for writers
+import time  # Yield while waiting for a concurrent insert to finish linking
+
+from Skip_List import SkipList
+
+# ---------------------------- Concurrent Node Definition ---------------------------- #
+
+class ConcurrentNode:
+    """
+    Skip list node for concurrent use. A node is logically in the list once fully_linked is set
+    and until marked is set; only its own lock protects marked and value.
+    """
+    __slots__ = ("key", "value", "forward", "lock", "marked", "fully_linked")
+
+    def __init__(self, key, level, value=None):
+        self.key = key
+        self.value = value
+        self.forward = [None] * (level + 1)  # Pointers to next nodes at different levels
+        self.lock = threading.Lock()
+        self.marked = False  # Logically deleted
+        self.fully_linked = False  # Linked on every level it belongs to
+
+# ---------------------------- Concurrent Skip List ---------------------------- #
+
+class ConcurrentSkipList:
+    """
+    Lazy concurrent skip list (Herlihy, Lev, Luchangco and Shavit): an ordered map that many threads
+    can read and write at once, on GIL and free-threaded builds alike.
+    - get, search, range and iteration take no locks. They may run over nodes being removed, whose
+      forward pointers are left intact, and skip any node that is marked or not yet fully linked.
+    - insert and delete search without locks, then lock only the predecessors they change and
+      validate that these are unmarked and still point where the search saw them; on a conflict they retry.
+    Scans are weakly consistent: keys inserted or deleted during a scan may or may not be seen.
+    The level cap is fixed (the header cannot grow under lock-free readers), and there is no rank/select,
+    since span counts cannot be kept without locking whole search paths.
+    """
+    p = SkipList.p  # Same validation and random-bit fast path as SkipList
+    random_level = SkipList.random_level
+
+    def __init__(self, max_level=24, p=0.5):
+        """
+        Initializes the Concurrent Skip List.
+        :param max_level: Maximum level allowed; about log_{1/p} of the largest expected size.
+        :param p: Probability factor for level increment.
+        """
+        self.max_level = max_level
+        self.p = p
+        self.header = ConcurrentNode(None, max_level)  # Header (sentinel) node with max levels
+        self.size = 0  # Number of keys, updated under size_lock
+        self.size_lock = threading.Lock()
+
+    def __len__(self):
+        return self.size
+
+    def _find(self, key, preds, succs):
+        """
+        Lock-free descent: fills preds[i] (last node with key < key on level i) and succs[i] (the node after it).
+        :return: Highest level on which a node with key was found, or -1.
+        """
+        found = -1
+        pred = self.header
+        for i in range(self.max_level, -1, -1):
+            current = pred.forward[i]
+            while current is not None and current.key < key:
+                pred = current
+                current = pred.forward[i]
+            if found == -1 and current is not None and current.key == key:
+                found = i
+            preds[i] = pred
+            succs[i] = current
+        return found
+
+    @staticmethod
+    def _lock_preds(preds, level, locked):
+        """Locks the distinct preds[0..level] from the bottom up (highest key first), recording them in locked."""
+        previous = None
+        for i in range(level + 1):
+            if preds[i] is not previous:
+                preds[i].lock.acquire()
+                locked.append(preds[i])
+                previous = preds[i]
+
+    def insert(self, key, value=None):
+        """
+        Inserts a key, or updates its value if it is already present (upsert).
+        :return: True if a new key was added, False if an existing key was updated.
+        """
+        level = self.random_level()
+        preds = [None] * (self.max_level + 1)
+        succs = [None] * (self.max_level + 1)
+        while True:
+            found = self._find(key, preds, succs)
+            if found != -1:
+                node = succs[found]
+                if node.marked:
+                    continue  # Being deleted: retry until it is unlinked
+                while not node.fully_linked:
+                    time.sleep(0)  # Another thread is still linking it
+                with node.lock:
+                    if node.marked:
+                        continue
+                    node.value = value
+                return False
+            locked = []
+            try:
+                self._lock_preds(preds, level, locked)
+                if not all(not preds[i].marked and preds[i].forward[i] is succs[i]
+                           and (succs[i] is None or not succs[i].marked) for i in range(level + 1)):
+                    continue  # The neighbourhood changed since the search: retry
+                new_node = ConcurrentNode(key, level, value)
+                for i in range(level + 1):
+                    new_node.forward[i] = succs[i]
+                for i in range(level + 1):  # Bottom-up, so every level a reader can reach it on is complete below
+                    preds[i].forward[i] = new_node
+                new_node.fully_linked = True  # Linearization point
+            finally:
+                for node in reversed(locked):
+                    node.lock.release()
+            with self.size_lock:
+                self.size += 1
+            return True
+
+    put = insert
+
+    def delete(self, key):
+        """
+        Deletes a key. Marking the node is the linearization point; it is unlinked right after.
+        :return: The removed node, or None if the key was not present.
+        """
+        preds = [None] * (self.max_level + 1)
+        succs = [None] * (self.max_level + 1)
+        victim = None
+        while True:
+            found = self._find(key, preds, succs)
+            if victim is None:
+                if found == -1:
+                    return None
+                candidate = succs[found]
+                if not candidate.fully_linked or candidate.marked or len(candidate.forward) - 1 != found:
+                    return None  # Not yet inserted, or already being deleted
+                with candidate.lock:
+                    if candidate.marked:
+                        return None
+                    candidate.marked = True
+                victim = candidate
+            top = len(victim.forward) - 1
+            locked = []
+            try:
+                self._lock_preds(preds, top, locked)
+                if not all(not preds[i].marked and preds[i].forward[i] is victim for i in range(top + 1)):
+                    continue  # A predecessor changed: search again (victim stays marked)
+                for i in range(top, -1, -1):  # Top-down, keeping victim.forward intact for readers on it
+                    preds[i].forward[i] = victim.forward[i]
+            finally:
+                for node in reversed(locked):
+                    node.lock.release()
+            with self.size_lock:
+                self.size -= 1
+            return victim
+
+    # ---------------------------- Lock-Free Reads ---------------------------- #
+
+    def _first_at_least(self, key):
+        """First node on level 0 with key >= key, found without locks (may be marked)."""
+        pred = self.header
+        for i in range(self.max_level, -1, -1):
+            current = pred.forward[i]
+            while current is not None and current.key < key:
+                pred = current
+                current = pred.forward[i]
+        return pred.forward[0]
+
+    def _node(self, key):
+        node = self._first_at_least(key)
+        if node is not None and node.key == key and node.fully_linked and not node.marked:
+            return node
+        return None
+
+    def get(self, key, default=None):
+        """Value of key, or default if the key is absent."""
+        node = self._node(key)
+        return node.value if node else default
+
+    def search(self, key):
+        """Returns True if key is in the Skip List (wait-free)."""
+        return self._node(key) is not None
+
+    def __contains__(self, key):
+        return self.search(key)
+
+    def items(self, lo=None, hi=None):
+        """Lazily yields (key, value) pairs with lo <= key < hi in ascending order (weakly consistent)."""
+        node = self.header.forward[0] if lo is None else self._first_at_least(lo)
+        while node is not None and (hi is None or node.key < hi):
+            if node.fully_linked and not node.marked:
+                yield node.key, node.value
+            node = node.forward[0]
+
+    def range(self, lo=None, hi=None):
+        """Lazily yields the keys with lo <= key < hi in ascending order (weakly consistent)."""
+        for key, _ in self.items(lo, hi):
+            yield key
+
+    def __iter__(self):
+        return self.range()
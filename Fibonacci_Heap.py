@@ -0,0 +1,722 @@
+#code by Kartheek Vikash Meesala
+#email: letter2kartheekvikashmeesala@gmail.com
+#Fibonacci heap with node handles: insert, find_min, extract_min, decrease_key, delete and merge
+#https://github.com/kartheekvikash/Algorithms.git
+
+import heapq  # Frontier of candidate nodes for batched and ordered traversal
+import itertools  # Tie-breaking counter and islice
+import math
+from array import array  # Parallel typed buffers for the pooled heap
+
+
+LOG_PHI = math.log((1 + math.sqrt(5)) / 2)  # Natural log of the golden ratio
+
+
+def _degree_table_size(num_nodes):
+    """
+    Slots needed to consolidate a heap of num_nodes nodes: a root of degree k has at least F(k+2) >= φ^k
+    descendants, so degrees never exceed log_φ(n). One extra slot absorbs floating-point rounding.
+    """
+    return int(math.log(num_nodes) / LOG_PHI) + 2
+
+
+# Fibonacci Heap Node
+class Node:
+    """Heap entry; insert() returns it as the handle for decrease_key() and delete()."""
+
+    __slots__ = ("key", "value", "degree", "parent", "child", "mark", "next", "prev")  # No per-node __dict__
+
+    def __init__(self, key, value=None):
+        self.key = key
+        self.value = value  # Payload carried with the key (e.g. a vertex id)
+        self.degree = 0
+        self.parent = None
+        self.child = None
+        self.mark = False  # Lost a child since it became a child itself
+        self.next = self
+        self.prev = self
+
+
+# Fibonacci Heap Class
+class FibonacciHeap:
+    """
+    Min-heap with O(1) amortized insert, find_min, decrease_key and merge,
+    and O(log n) amortized extract_min and delete.
+    """
+
+    def __init__(self):
+        self.min_node = None
+        self.num_nodes = 0
+        self._degree_table = []  # Root of each degree during _consolidate, reused between calls
+
+    def __len__(self):
+        return self.num_nodes
+
+    def insert(self, key, value=None):
+        """Adds a key (with an optional payload) and returns its node handle."""
+        node = Node(key, value)
+        if self.min_node is None:
+            self.min_node = node
+        else:
+            self._add_to_root_list(node)
+            if node.key < self.min_node.key:
+                self.min_node = node
+        self.num_nodes += 1
+        return node
+
+    def _add_to_root_list(self, node):
+        node.next = self.min_node
+        node.prev = self.min_node.prev
+        self.min_node.prev.next = node
+        self.min_node.prev = node
+
+    def _remove_from_list(self, node):
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        node.next = node
+        node.prev = node
+
+    def find_min(self):
+        return self.min_node.key if self.min_node else None
+
+    def extract_min(self):
+        """Removes the minimum and returns its key (None if the heap is empty)."""
+        z = self.extract_min_node()
+        return z.key if z else None
+
+    def extract_min_node(self):
+        """Removes the minimum and returns its node, so the payload is available (None if empty)."""
+        z = self.min_node
+        if z:
+            if z.child:
+                children = []
+                child = z.child
+                while True:
+                    children.append(child)
+                    child = child.next
+                    if child == z.child:
+                        break
+                for child in children:
+                    self._add_to_root_list(child)
+                    child.parent = None
+                z.child = None
+
+            z.prev.next = z.next
+            z.next.prev = z.prev
+
+            if z == z.next:
+                self.min_node = None
+            else:
+                self.min_node = z.next
+                self._consolidate()
+            z.next = z.prev = z
+            z.degree = 0
+            self.num_nodes -= 1
+        return z
+
+    def _consolidate(self):
+        """
+        Links roots of equal degree until every root degree is distinct, in a single walk over the root list.
+        The degree table is reused across calls and only grows to the bound D(n) <= log_φ(n).
+        """
+        table = self._degree_table
+        missing = _degree_table_size(self.num_nodes) - len(table)
+        if missing > 0:
+            table.extend([None] * missing)
+        start = w = self.min_node
+        top = 0  # Highest degree slot in use
+        while True:
+            following = w.next  # Roots not yet visited are never relinked, so their next stays valid
+            x = w
+            d = x.degree
+            while table[d] is not None:
+                y = table[d]
+                table[d] = None
+                if x.key > y.key:
+                    x, y = y, x
+                self._link(y, x)
+                d += 1
+            table[d] = x
+            if d > top:
+                top = d
+            if following is start:
+                break
+            w = following
+
+        # The surviving trees form the new root list; clear the table for the next call
+        self.min_node = first = last = None
+        for d in range(top + 1):
+            x = table[d]
+            if x is not None:
+                table[d] = None
+                if first is None:
+                    first = x
+                else:
+                    last.next = x
+                    x.prev = last
+                last = x
+                if self.min_node is None or x.key < self.min_node.key:
+                    self.min_node = x
+        last.next = first
+        first.prev = last
+
+    def _link(self, y, x):
+        """Makes root y a child of root x (the root list itself is rebuilt by _consolidate)."""
+        y.parent = x
+        if not x.child:
+            x.child = y
+            y.next = y
+            y.prev = y
+        else:
+            y.next = x.child
+            y.prev = x.child.prev
+            x.child.prev.next = y
+            x.child.prev = y
+        x.degree += 1
+        y.mark = False
+
+    def decrease_key(self, node, key):
+        """Lowers the key of a node handle; raises ValueError if the new key is larger."""
+        if key > node.key:
+            raise ValueError(f"New key {key!r} is greater than the current key {node.key!r}")
+        node.key = key
+        parent = node.parent
+        if parent and node.key < parent.key:
+            self._cut(node, parent)
+            self._cascading_cut(parent)
+        if node.key < self.min_node.key:
+            self.min_node = node
+
+    def _cut(self, node, parent):
+        """Moves node from the child list of parent to the root list."""
+        if node.next == node:
+            parent.child = None
+        elif parent.child == node:
+            parent.child = node.next
+        self._remove_from_list(node)
+        parent.degree -= 1
+        self._add_to_root_list(node)
+        node.parent = None
+        node.mark = False
+
+    def _cascading_cut(self, node):
+        """Cuts marked ancestors so every tree stays large for its degree."""
+        parent = node.parent
+        while parent:
+            if not node.mark:
+                node.mark = True
+                return
+            self._cut(node, parent)
+            node, parent = parent, parent.parent
+
+    def delete(self, node):
+        """Removes a node handle from the heap and returns its key."""
+        parent = node.parent
+        if parent:
+            self._cut(node, parent)  # Same effect as decreasing the key to -∞ ...
+            self._cascading_cut(parent)
+        self.min_node = node  # ... which would make it the minimum
+        return self.extract_min()
+
+    def merge(self, other):
+        """Moves every node of another FibonacciHeap into this one in O(1); other is left empty."""
+        if other.min_node is None:
+            return self
+        if self.min_node is None:
+            self.min_node = other.min_node
+        else:
+            last = other.min_node.prev  # Splice the two circular root lists together
+            self.min_node.prev.next = other.min_node
+            other.min_node.prev = self.min_node.prev
+            last.next = self.min_node
+            self.min_node.prev = last
+            if other.min_node.key < self.min_node.key:
+                self.min_node = other.min_node
+        self.num_nodes += other.num_nodes
+        other.min_node = None
+        other.num_nodes = 0
+        return self
+
+    def insert_many(self, keys, values=None):
+        """
+        Adds many keys at once: the new nodes are linked into one ring and spliced into the root list,
+        O(k) with a single comparison per key. Returns the node handles in input order.
+        :param values: Optional payloads, parallel to keys.
+        """
+        nodes = [Node(key) for key in keys] if values is None else [Node(k, v) for k, v in zip(keys, values)]
+        if not nodes:
+            return nodes
+        smallest = prev = nodes[0]
+        for node in itertools.islice(nodes, 1, None):
+            prev.next = node
+            node.prev = prev
+            prev = node
+            if node.key < smallest.key:
+                smallest = node
+        prev.next = nodes[0]
+        nodes[0].prev = prev
+        batch = FibonacciHeap()
+        batch.min_node, batch.num_nodes = smallest, len(nodes)
+        self.merge(batch)
+        return nodes
+
+    @staticmethod
+    def _siblings(node):
+        """Nodes of the circular list that contains node, starting at node."""
+        siblings = []
+        if node:
+            x = node
+            while True:
+                siblings.append(x)
+                x = x.next
+                if x == node:
+                    break
+        return siblings
+
+    def _ordered_nodes(self):
+        """
+        Yields nodes in ascending key order without modifying the heap: a small binary heap holds the
+        frontier (the roots, then the children of every node yielded), O(log k) per node for the first k.
+        """
+        counter = itertools.count()  # Tie-breaker so equal keys never compare nodes
+        frontier = [(node.key, next(counter), node) for node in self._siblings(self.min_node)]
+        heapq.heapify(frontier)
+        while frontier:
+            node = heapq.heappop(frontier)[2]
+            yield node
+            for child in self._siblings(node.child):
+                heapq.heappush(frontier, (child.key, next(counter), child))
+
+    def __iter__(self):
+        """Keys in ascending order; the heap must not be modified while iterating."""
+        return (node.key for node in self._ordered_nodes())
+
+    def nsmallest(self, k):
+        """The k smallest keys in ascending order, leaving the heap unchanged."""
+        return [node.key for node in itertools.islice(self._ordered_nodes(), k)]
+
+    def extract_many(self, k):
+        """Removes the k smallest keys (fewer if the heap is smaller) and returns them in ascending order."""
+        return [node.key for node in self.extract_many_nodes(k)]
+
+    def extract_many_nodes(self, k):
+        """
+        Removes the k smallest nodes with a single consolidation for the whole batch: nodes are popped from
+        the frontier of roots and promoted children, then the remaining frontier becomes the new root list.
+        """
+        if k <= 0 or self.min_node is None:
+            return []
+        counter = itertools.count()
+        frontier = [(node.key, next(counter), node) for node in self._siblings(self.min_node)]
+        heapq.heapify(frontier)
+        removed = []
+        while frontier and len(removed) < k:
+            node = heapq.heappop(frontier)[2]
+            for child in self._siblings(node.child):
+                child.parent = None
+                child.mark = False
+                heapq.heappush(frontier, (child.key, next(counter), child))
+            node.child = None
+            node.degree = 0
+            node.next = node.prev = node
+            removed.append(node)
+        self.num_nodes -= len(removed)
+        if not frontier:
+            self.min_node = None
+            return removed
+        roots = [entry[2] for entry in frontier]
+        for a, b in zip(roots, roots[1:] + roots[:1]):  # Relink the survivors as one root ring
+            a.next = b
+            b.prev = a
+        self.min_node = roots[0]
+        self._consolidate()
+        return removed
+
+    union = merge
+
+
+NIL = -1  # "No node" in the pooled heap's index buffers
+
+
+class PooledFibonacciHeap:
+    """
+    Memory-lean FibonacciHeap: nodes are integer slots in parallel typed arrays (struct of arrays)
+    instead of Python objects, about 34 bytes per node. Slots of extracted nodes are reused.
+    Keys are stored as float64 and payloads as int64; handles are slot indices (at most 2^31 - 1 slots).
+    """
+
+    def __init__(self):
+        self.keys = array("d")
+        self.values = array("q")
+        self.degree = array("B")
+        self.mark = array("B")
+        self.parent = array("i")
+        self.child = array("i")
+        self.next = array("i")
+        self.prev = array("i")
+        self.min_node = NIL
+        self.num_nodes = 0
+        self.free = NIL  # First free slot; free slots are chained through self.next
+        self._degree_table = []  # Root slot of each degree during _consolidate, reused between calls
+
+    def __len__(self):
+        return self.num_nodes
+
+    def nbytes(self):
+        """Memory held by the node buffers (including slots on the free list)."""
+        buffers = (self.keys, self.values, self.degree, self.mark, self.parent, self.child, self.next, self.prev)
+        return sum(buffer.buffer_info()[1] * buffer.itemsize for buffer in buffers)
+
+    def _allocate(self, key, value):
+        """Takes a free slot (or appends one) for a detached single-node ring."""
+        i = self.free
+        if i != NIL:
+            self.free = self.next[i]
+            self.keys[i] = key
+            self.values[i] = value
+            self.degree[i] = 0
+            self.mark[i] = 0
+            self.parent[i] = NIL
+            self.child[i] = NIL
+            self.next[i] = i
+            self.prev[i] = i
+        else:
+            i = len(self.keys)
+            self.keys.append(key)
+            self.values.append(value)
+            self.degree.append(0)
+            self.mark.append(0)
+            self.parent.append(NIL)
+            self.child.append(NIL)
+            self.next.append(i)
+            self.prev.append(i)
+        return i
+
+    def insert(self, key, value=0):
+        """Adds a key (with an optional integer payload) and returns its slot index as the handle."""
+        i = self._allocate(key, value)
+        if self.min_node == NIL:
+            self.min_node = i
+        else:
+            self._add_to_root_list(i)
+            if key < self.keys[self.min_node]:
+                self.min_node = i
+        self.num_nodes += 1
+        return i
+
+    def _add_to_root_list(self, i):
+        nxt, prv, m = self.next, self.prev, self.min_node
+        nxt[i] = m
+        prv[i] = prv[m]
+        nxt[prv[m]] = i
+        prv[m] = i
+
+    def find_min(self):
+        return self.keys[self.min_node] if self.min_node != NIL else None
+
+    def extract_min(self):
+        """Removes the minimum and returns its key (None if the heap is empty)."""
+        item = self.extract_min_item()
+        return item[0] if item else None
+
+    def extract_min_item(self):
+        """Removes the minimum and returns (key, value), or None if the heap is empty."""
+        z = self.min_node
+        if z == NIL:
+            return None
+        nxt, prv, parent = self.next, self.prev, self.parent
+        c = self.child[z]
+        if c != NIL:
+            x = c
+            while True:
+                parent[x] = NIL
+                x = nxt[x]
+                if x == c:
+                    break
+            last, after = prv[c], nxt[z]  # Splice the child ring into the root list after z
+            nxt[z] = c
+            prv[c] = z
+            nxt[last] = after
+            prv[after] = last
+            self.child[z] = NIL
+        nxt[prv[z]] = nxt[z]
+        prv[nxt[z]] = prv[z]
+        if nxt[z] == z:
+            self.min_node = NIL
+        else:
+            self.min_node = nxt[z]
+            self._consolidate()
+        item = (self.keys[z], self.values[z])
+        nxt[z] = self.free  # Recycle the slot
+        self.free = z
+        self.num_nodes -= 1
+        return item
+
+    def _consolidate(self):
+        """Single-pass consolidation with a reused degree table (see FibonacciHeap._consolidate)."""
+        keys, degree, nxt, prv = self.keys, self.degree, self.next, self.prev
+        table = self._degree_table
+        missing = _degree_table_size(self.num_nodes) - len(table)
+        if missing > 0:
+            table.extend([NIL] * missing)
+        start = w = self.min_node
+        top = 0
+        while True:
+            following = nxt[w]
+            x = w
+            d = degree[x]
+            while table[d] != NIL:
+                y = table[d]
+                table[d] = NIL
+                if keys[x] > keys[y]:
+                    x, y = y, x
+                self._link(y, x)
+                d += 1
+            table[d] = x
+            if d > top:
+                top = d
+            if following == start:
+                break
+            w = following
+
+        self.min_node = first = last = NIL
+        for d in range(top + 1):
+            x = table[d]
+            if x != NIL:
+                table[d] = NIL
+                if first == NIL:
+                    first = x
+                else:
+                    nxt[last] = x
+                    prv[x] = last
+                last = x
+                if self.min_node == NIL or keys[x] < keys[self.min_node]:
+                    self.min_node = x
+        nxt[last] = first
+        prv[first] = last
+
+    def _link(self, y, x):
+        """Makes root y a child of root x (the root list itself is rebuilt by _consolidate)."""
+        nxt, prv = self.next, self.prev
+        self.parent[y] = x
+        c = self.child[x]
+        if c == NIL:
+            self.child[x] = y
+            nxt[y] = y
+            prv[y] = y
+        else:
+            nxt[y] = c
+            prv[y] = prv[c]
+            nxt[prv[c]] = y
+            prv[c] = y
+        self.degree[x] += 1
+        self.mark[y] = 0
+
+    def decrease_key(self, i, key):
+        """Lowers the key of a handle; raises ValueError if the new key is larger."""
+        if key > self.keys[i]:
+            raise ValueError(f"New key {key!r} is greater than the current key {self.keys[i]!r}")
+        self.keys[i] = key
+        p = self.parent[i]
+        if p != NIL and key < self.keys[p]:
+            self._cut(i, p)
+            self._cascading_cut(p)
+        if key < self.keys[self.min_node]:
+            self.min_node = i
+
+    def _cut(self, i, p):
+        nxt, prv = self.next, self.prev
+        if nxt[i] == i:
+            self.child[p] = NIL
+        elif self.child[p] == i:
+            self.child[p] = nxt[i]
+        nxt[prv[i]] = nxt[i]
+        prv[nxt[i]] = prv[i]
+        self.degree[p] -= 1
+        self._add_to_root_list(i)
+        self.parent[i] = NIL
+        self.mark[i] = 0
+
+    def _cascading_cut(self, i):
+        p = self.parent[i]
+        while p != NIL:
+            if not self.mark[i]:
+                self.mark[i] = 1
+                return
+            self._cut(i, p)
+            i, p = p, self.parent[p]
+
+    def delete(self, i):
+        """Removes a handle from the heap and returns its key."""
+        p = self.parent[i]
+        if p != NIL:
+            self._cut(i, p)
+            self._cascading_cut(p)
+        self.min_node = i
+        return self.extract_min()
+
+    def merge(self, other):
+        """
+        Moves every node of another PooledFibonacciHeap into this one; other is left empty.
+        The slots are copied in O(len(other buffers)), so other's handle h becomes h + offset.
+        :return: offset
+        """
+        offset = len(self.keys)
+        if not len(other.keys):
+            return offset
+
+        def shift(indices):
+            return array("i", [j + offset if j != NIL else NIL for j in indices])
+
+        self.keys.extend(other.keys)
+        self.values.extend(other.values)
+        self.degree.extend(other.degree)
+        self.mark.extend(other.mark)
+        for name in ("parent", "child", "next", "prev"):
+            getattr(self, name).extend(shift(getattr(other, name)))
+        if other.free != NIL:  # Append other's free chain to ours
+            tail = other.free + offset
+            while self.next[tail] != NIL:
+                tail = self.next[tail]
+            self.next[tail] = self.free
+            self.free = other.free + offset
+        if other.min_node != NIL:
+            m = other.min_node + offset
+            if self.min_node == NIL:
+                self.min_node = m
+            else:
+                nxt, prv, last = self.next, self.prev, self.prev[m]  # Splice the root lists
+                nxt[prv[self.min_node]] = m
+                prv[m] = prv[self.min_node]
+                nxt[last] = self.min_node
+                prv[self.min_node] = last
+                if self.keys[m] < self.keys[self.min_node]:
+                    self.min_node = m
+        self.num_nodes += other.num_nodes
+        other.__init__()
+        return offset
+
+    def insert_many(self, keys, values=None):
+        """
+        Adds many keys at once, linking the new slots into one ring that is spliced into the root list in O(1).
+        Returns the handles in input order.
+        """
+        values = itertools.repeat(0) if values is None else values
+        handles = [self._allocate(key, value) for key, value in zip(keys, values)]
+        if not handles:
+            return handles
+        nxt, prv, keys = self.next, self.prev, self.keys
+        smallest = handles[0]
+        for a, b in zip(handles, handles[1:]):
+            nxt[a] = b
+            prv[b] = a
+            if keys[b] < keys[smallest]:
+                smallest = b
+        nxt[handles[-1]] = handles[0]
+        prv[handles[0]] = handles[-1]
+        if self.min_node == NIL:
+            self.min_node = smallest
+        else:
+            m, last = self.min_node, handles[-1]  # Splice the ring in front of the minimum
+            nxt[prv[m]] = handles[0]
+            prv[handles[0]] = prv[m]
+            nxt[last] = m
+            prv[m] = last
+            if keys[smallest] < keys[m]:
+                self.min_node = smallest
+        self.num_nodes += len(handles)
+        return handles
+
+    def _siblings(self, i):
+        """Slots of the circular list that contains slot i, starting at i."""
+        siblings = []
+        if i != NIL:
+            nxt, x = self.next, i
+            while True:
+                siblings.append(x)
+                x = nxt[x]
+                if x == i:
+                    break
+        return siblings
+
+    def _ordered_slots(self):
+        """Yields slots in ascending key order without modifying the heap (see FibonacciHeap._ordered_nodes)."""
+        keys, child = self.keys, self.child
+        frontier = [(keys[i], i) for i in self._siblings(self.min_node)]
+        heapq.heapify(frontier)
+        while frontier:
+            i = heapq.heappop(frontier)[1]
+            yield i
+            for c in self._siblings(child[i]):
+                heapq.heappush(frontier, (keys[c], c))
+
+    def __iter__(self):
+        """Keys in ascending order; the heap must not be modified while iterating."""
+        return (self.keys[i] for i in self._ordered_slots())
+
+    def nsmallest(self, k):
+        """The k smallest keys in ascending order, leaving the heap unchanged."""
+        return [self.keys[i] for i in itertools.islice(self._ordered_slots(), k)]
+
+    def extract_many(self, k):
+        """Removes the k smallest keys (fewer if the heap is smaller) and returns them in ascending order."""
+        return [key for key, _ in self.extract_many_items(k)]
+
+    def extract_many_items(self, k):
+        """Removes the k smallest (key, value) pairs with a single consolidation (see FibonacciHeap.extract_many_nodes)."""
+        if k <= 0 or self.min_node == NIL:
+            return []
+        keys, values, nxt, prv, parent, child = self.keys, self.values, self.next, self.prev, self.parent, self.child
+        frontier = [(keys[i], i) for i in self._siblings(self.min_node)]
+        heapq.heapify(frontier)
+        removed = []
+        while frontier and len(removed) < k:
+            i = heapq.heappop(frontier)[1]
+            for c in self._siblings(child[i]):
+                parent[c] = NIL
+                self.mark[c] = 0
+                heapq.heappush(frontier, (keys[c], c))
+            removed.append((keys[i], values[i]))
+            nxt[i] = self.free  # Recycle the slot
+            self.free = i
+        self.num_nodes -= len(removed)
+        if not frontier:
+            self.min_node = NIL
+            return removed
+        roots = [i for _, i in frontier]
+        for a, b in zip(roots, roots[1:] + roots[:1]):
+            nxt[a] = b
+            prv[b] = a
+        self.min_node = roots[0]
+        self._consolidate()
+        return removed
+
+    union = merge
+
+
+def dijkstra(adjacency, source):
+    """
+    Dijkstra's algorithm with one heap node per vertex and decrease_key instead of duplicate entries,
+    for the O(E + V log V) bound. adjacency[u] is a list of (v, weight) pairs with non-negative weights.
+    :return: (distances, predecessors) lists indexed by vertex id.
+    """
+    distances = [math.inf] * len(adjacency)
+    predecessors = [None] * len(adjacency)
+    handles = [None] * len(adjacency)  # Heap node of every vertex still in the queue
+    distances[source] = 0
+    heap = FibonacciHeap()
+    handles[source] = heap.insert(0, source)
+    while heap.min_node:
+        u = heap.extract_min_node().value
+        handles[u] = None
+        d = distances[u]
+        for v, weight in adjacency[u]:
+            candidate = d + weight
+            if candidate < distances[v]:
+                if distances[v] == math.inf:
+                    handles[v] = heap.insert(candidate, v)
+                else:
+                    heap.decrease_key(handles[v], candidate)
+                distances[v] = candidate
+                predecessors[v] = u
+    return distances, predecessors
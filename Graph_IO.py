@@ -0,0 +1,289 @@
+#code by Kartheek Vikash Meesala
+#email: letter2kartheekvikashmeesala@gmail.com
+#Bulk graph import/export: edge lists, CSV, DIMACS .gr and a memory-mappable binary format
+#https://github.com/kartheekvikash/Algorithms.git
+
+import argparse  # Import argparse for the conversion command line
+import csv  # Import csv for comma-separated edge lists
+import mmap  # Memory-map binary graphs instead of reading them
+import os  # Import os for file extensions
+import struct  # Pack the binary header
+import sys  # Import sys for byte-order checks
+from array import array  # Typed buffers for edge arrays
+
+from Graph_Representations import CSRGraph, convert, format_weight, from_arrays
+from Vertex_Index import VertexIndex
+
+FORMATS = ("edgelist", "csv", "dimacs", "binary")  # Names accepted by load_graph() and save_graph()
+CHUNK_SIZE = 1 << 16  # Edges parsed and interned per chunk
+
+# Binary layout (little-endian): header, int32 offsets[|V| + 1], int32 targets[|E|],
+# padding to 8 bytes, float64 weights[|E|], then the vertex names as UTF-8 joined by newlines.
+BINARY_MAGIC = b"GRAPHv1\0"
+BINARY_HEADER = struct.Struct("<8sQQQQ")  # magic, |V|, |E|, names byte length, reserved flags
+# Column names recognised in a two-column CSV header, where there is no weight column to test
+CSV_HEADER_NAMES = frozenset(("source", "target", "from", "to", "src", "dst", "u", "v", "node", "neighbour",
+                              "neighbor", "head", "tail", "start", "end"))
+_EXTENSIONS = {".gr": "dimacs", ".csv": "csv", ".bin": "binary", ".graph": "binary"}
+
+
+def detect_format(path):
+    """Guesses the file format from its extension (anything unknown is a whitespace edge list)."""
+    return _EXTENSIONS.get(os.path.splitext(path)[1].lower(), "edgelist")
+
+
+def _parse_weight(text):
+    """Parses an integer weight if possible, otherwise a float."""
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _edge_list_rows(handle):
+    """Yields the fields of each non-comment line of a whitespace-separated edge list."""
+    for line in handle:
+        data = line.split()
+        if data and not data[0].startswith(("#", "%")):
+            yield data
+
+
+def _csv_rows(handle):
+    """
+    Yields the fields of each CSV row, skipping '#' comments and a header row (the first row that is not
+    a comment, if its weight column is not numeric or, without a weight column, both names are in
+    CSV_HEADER_NAMES).
+    """
+    first = True
+    for row in csv.reader(handle):
+        row = [field.strip() for field in row]
+        if not row or row[0].startswith("#"):
+            continue
+        if first:
+            first = False
+            if len(row) == 2 and all(field.lower() in CSV_HEADER_NAMES for field in row):
+                continue  # Header such as "source,target"
+            if len(row) >= 3:
+                try:
+                    _parse_weight(row[2])
+                except ValueError:
+                    continue  # Header such as "source,target,weight"
+        yield row
+
+
+def _rows_to_chunks(rows, chunk_size):
+    """Turns 'u v [weight]' rows into lists of (u, v, weight) tuples (weight defaults to 1)."""
+    chunk = []
+    for data in rows:
+        if len(data) == 2:
+            chunk.append((data[0], data[1], 1))
+        elif len(data) == 3:
+            chunk.append((data[0], data[1], _parse_weight(data[2])))
+        else:
+            raise ValueError(f"Invalid edge {' '.join(data)!r}, expected: u v [weight]")
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _dimacs_chunks(handle, vertices, chunk_size):
+    """
+    Parses DIMACS shortest-path files: 'c' comments, one 'p sp <n> <m>' line and 'a <u> <v> <w>' arcs.
+    The 'p' line interns vertices "1" .. "n" up front so isolated vertices keep their numbering.
+    """
+    chunk = []
+    for line in handle:
+        data = line.split()
+        if not data or data[0] == "c":
+            continue
+        if data[0] in ("p", "a") and len(data) != 4:
+            raise ValueError(f"Invalid DIMACS line: {line.strip()!r}, expected 4 fields")
+        if data[0] == "p":
+            vertices.add_many(str(i) for i in range(1, int(data[2]) + 1))
+        elif data[0] == "a":
+            chunk.append((data[1], data[2], _parse_weight(data[3])))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        else:
+            raise ValueError(f"Unexpected DIMACS line: {line.strip()!r}")
+    if chunk:
+        yield chunk
+
+
+def read_edge_chunks(path, fmt="auto", chunk_size=CHUNK_SIZE, vertices=None):
+    """
+    Streams a text graph file as lists of at most chunk_size (u, v, weight) tuples,
+    reading line by line so the raw text is never held in memory.
+    :param vertices: Optional VertexIndex that DIMACS 'p' lines pre-populate.
+    """
+    fmt = detect_format(path) if fmt == "auto" else fmt
+    with open(path, newline="", encoding="utf-8") as handle:
+        if fmt == "dimacs":
+            yield from _dimacs_chunks(handle, vertices if vertices is not None else VertexIndex(), chunk_size)
+        elif fmt == "csv":
+            yield from _rows_to_chunks(_csv_rows(handle), chunk_size)
+        elif fmt == "edgelist":
+            yield from _rows_to_chunks(_edge_list_rows(handle), chunk_size)
+        else:
+            raise ValueError(f"Unknown text format {fmt!r}, expected edgelist, csv or dimacs")
+
+
+def load_graph(path, fmt="auto", backend="auto", vertices=None, chunk_size=CHUNK_SIZE):
+    """
+    Loads a graph file into a graph backend.
+    Text formats are parsed chunk by chunk straight into typed id/weight arrays;
+    binary files are memory-mapped and come back as a CSR graph without copying.
+    :param vertices: Optional VertexIndex to extend (new names are interned as they appear).
+    """
+    fmt = detect_format(path) if fmt == "auto" else fmt
+    if fmt == "binary":
+        graph = load_binary(path)
+        return graph if backend in ("auto", "csr") else convert(graph, backend)
+    vertices = VertexIndex() if vertices is None else vertices
+    src, dst, weights = array("q"), array("q"), array("d")
+    for chunk in read_edge_chunks(path, fmt, chunk_size, vertices):
+        chunk_src, chunk_dst, chunk_weights = vertices.intern_edges(chunk, add_missing=True)
+        src.extend(chunk_src)
+        dst.extend(chunk_dst)
+        weights.extend(chunk_weights)
+    return from_arrays(vertices, src, dst, weights, backend)
+
+
+def read_edges(path, fmt="auto"):
+    """
+    Reads a graph file as a VertexIndex and a list of (u, v, weight) tuples of names,
+    keeping integer weights from text files as ints (for the dict-based solvers and the GUIs).
+    """
+    fmt = detect_format(path) if fmt == "auto" else fmt
+    if fmt == "binary":
+        graph = load_binary(path)
+        names = graph.vertices
+        return names, [(names[u], names[v], weight) for u, v, weight in graph.edges()]
+    vertices = VertexIndex()
+    edges = [edge for chunk in read_edge_chunks(path, fmt, vertices=vertices) for edge in chunk]
+    vertices.add_many(name for u, v, _ in edges for name in (u, v))
+    return vertices, edges
+
+
+# ---------------------------- Binary Format ---------------------------- #
+
+def _little_endian(buffer):
+    """Typed array in little-endian byte order, ready to be written."""
+    if sys.byteorder != "little":
+        buffer = array(buffer.typecode, buffer)
+        buffer.byteswap()
+    return buffer
+
+
+def save_binary(graph, path):
+    """Writes any graph backend in the binary layout (int32 ids, so at most 2^31 - 1 edges)."""
+    graph = convert(graph, "csr")
+    num_vertices, num_edges = len(graph.vertices), graph.num_edges
+    if num_edges >= 2 ** 31:
+        raise ValueError("The binary format stores int32 offsets: too many edges")
+    names = "\n".join(str(name) for name in graph.vertices)
+    if any("\n" in str(name) for name in graph.vertices):
+        raise ValueError("Vertex names must not contain newlines")
+    names = names.encode("utf-8")
+    with open(path, "wb") as handle:
+        handle.write(BINARY_HEADER.pack(BINARY_MAGIC, num_vertices, num_edges, len(names), 0))
+        handle.write(_little_endian(array("i", graph.offsets)).tobytes())
+        handle.write(_little_endian(array("i", graph.indices)).tobytes())
+        handle.write(bytes(-handle.tell() % 8))  # Align the float64 weights
+        handle.write(_little_endian(array("d", graph.weights)).tobytes())
+        handle.write(names)
+
+
+def load_binary(path):
+    """
+    Memory-maps a binary graph file and returns a CSRGraph whose offsets, targets and weights
+    are views into the mapping (pages are read lazily by the OS). Only the names are decoded.
+    Raises ValueError on a file that is not a binary graph, is truncated or has trailing bytes.
+    """
+    with open(path, "rb") as handle:
+        mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(mapping) < BINARY_HEADER.size:
+        mapping.close()
+        raise ValueError(f"{path} is too short to be a binary graph file")
+    magic, num_vertices, num_edges, names_length, _ = BINARY_HEADER.unpack_from(mapping, 0)
+    if magic != BINARY_MAGIC:
+        mapping.close()
+        raise ValueError(f"{path} is not a binary graph file")
+    weights_start = BINARY_HEADER.size + 4 * (num_vertices + 1 + num_edges)
+    weights_start += -weights_start % 8
+    if len(mapping) != weights_start + 8 * num_edges + names_length:
+        mapping.close()
+        raise ValueError(f"{path} is truncated or has trailing bytes")
+    view = memoryview(mapping)
+    position = BINARY_HEADER.size
+
+    def take(typecode, count):
+        nonlocal position
+        itemsize = array(typecode).itemsize
+        position += -position % itemsize  # Skip alignment padding
+        part = view[position:position + count * itemsize]
+        position += count * itemsize
+        if sys.byteorder != "little":
+            swapped = array(typecode, part.tobytes())
+            swapped.byteswap()
+            return swapped
+        return part.cast(typecode)
+
+    offsets = take("i", num_vertices + 1)
+    indices = take("i", num_edges)
+    weights = take("d", num_edges)
+    names = bytes(view[position:position + names_length]).decode("utf-8").split("\n") if num_vertices else []
+    graph = CSRGraph(VertexIndex(names), offsets, indices, weights)
+    graph.mapping = mapping  # Keep the mapping alive as long as the graph
+    return graph
+
+
+# ---------------------------- Text Export ---------------------------- #
+
+def save_edge_list(graph, path, delimiter=" "):
+    """Writes one 'u v weight' line per edge (delimiter="," gives CSV)."""
+    names = graph.vertices
+    with open(path, "w", encoding="utf-8", newline="") as handle:
+        for u, v, weight in graph.edges():
+            handle.write(f"{names[u]}{delimiter}{names[v]}{delimiter}{format_weight(weight)}\n")
+
+
+def save_dimacs(graph, path):
+    """Writes DIMACS .gr; vertices are renumbered 1..n in id order (names are not preserved)."""
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write(f"p sp {len(graph.vertices)} {graph.num_edges}\n")
+        for u, v, weight in graph.edges():
+            handle.write(f"a {u + 1} {v + 1} {format_weight(weight)}\n")
+
+
+def save_graph(graph, path, fmt="auto"):
+    """Writes a graph in the format chosen by fmt or by the file extension."""
+    fmt = detect_format(path) if fmt == "auto" else fmt
+    if fmt == "binary":
+        save_binary(graph, path)
+    elif fmt == "dimacs":
+        save_dimacs(graph, path)
+    elif fmt in ("edgelist", "csv"):
+        save_edge_list(graph, path, "," if fmt == "csv" else " ")
+    else:
+        raise ValueError(f"Unknown format {fmt!r}, expected one of {', '.join(FORMATS)}")
+
+
+def main(argv=None):
+    """Command line entry point: converts a graph file between formats."""
+    parser = argparse.ArgumentParser(description="Convert graph files between edge list, CSV, DIMACS and binary.")
+    parser.add_argument("source", help="Input graph file")
+    parser.add_argument("target", help="Output graph file")
+    parser.add_argument("--from", dest="source_format", choices=FORMATS, help="Input format (default: by extension)")
+    parser.add_argument("--to", dest="target_format", choices=FORMATS, help="Output format (default: by extension)")
+    args = parser.parse_args(argv)
+    graph = load_graph(args.source, args.source_format or "auto", backend="csr")
+    save_graph(graph, args.target, args.target_format or "auto")
+    print(f"{args.source} → {args.target}: {len(graph.vertices)} vertices, {graph.num_edges} edges")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+#code by Kartheek Vikash Meesala
+#email: letter2kartheekvikashmeesala@gmail.com
+#Graph representation layer: adjacency list, CSR/CSC and dense matrix backends
+#https://github.com/kartheekvikash/Algorithms.git
+
+import math  # Import math module to represent infinity
+import sys  # Import sys for object size measurements
+from array import array  # Compact typed buffers for the compressed and dense backends
+from Vertex_Index import VertexIndex  # Shared name <-> id interning table
+
+BACKENDS = ("adjacency", "csr", "csc", "dense")  # Names accepted by build_graph()
+# Edge density (E / V²) from which "auto" picks the dense matrix. It is not the memory crossover: CSR takes
+# about 16 * E bytes against 8 * V² for the matrix, so it stays smaller up to density 0.5. From here on the
+# matrix costs at most twice as much and buys O(1) u -> v lookups and flat rows for Floyd-Warshall.
+DENSE_THRESHOLD = 0.25
+DENSE_MAX_VERTICES = 4096  # Never pick the dense matrix automatically beyond this many vertices
+
+
+def _list_nbytes(items):
+    """Size of a list plus the objects it holds (one level deep)."""
+    return sys.getsizeof(items) + sum(sys.getsizeof(item) for item in items)
+
+
+def _array_nbytes(buffer):
+    """Size of a typed array including its header (for memory-mapped views: the bytes they span)."""
+    if isinstance(buffer, memoryview):
+        return buffer.nbytes
+    return sys.getsizeof(buffer)
+
+
+def format_weight(weight):
+    """Displays integral float weights without a trailing '.0' and infinity as ∞."""
+    if weight == math.inf:
+        return "∞"
+    if isinstance(weight, float) and weight.is_integer():
+        return str(int(weight))
+    return str(weight)
+
+
+class AdjacencyListGraph:
+    """One list of (target id, weight) pairs per vertex; cheap to grow edge by edge."""
+
+    name = "adjacency"
+
+    def __init__(self, vertices, adjacency):
+        self.vertices = VertexIndex.of(vertices)  # Vertex names <-> ids
+        self.adjacency = adjacency  # adjacency[u] = [(v, weight), ...]
+
+    @classmethod
+    def _from_arrays(cls, vertices, src, dst, weights):
+        adjacency = [[] for _ in range(len(vertices))]
+        for u, v, weight in zip(src, dst, weights):
+            adjacency[u].append((v, weight))
+        return cls(vertices, adjacency)
+
+    @property
+    def num_edges(self):
+        return sum(len(targets) for targets in self.adjacency)
+
+    def edges(self):
+        """Yields (u id, v id, weight) for every edge."""
+        for u, targets in enumerate(self.adjacency):
+            for v, weight in targets:
+                yield u, v, weight
+
+    def neighbors(self, u):
+        """Yields (v id, weight) for the edges leaving vertex id u."""
+        return iter(self.adjacency[u])
+
+    def nbytes(self):
+        """Approximate memory held by the edge storage."""
+        return sys.getsizeof(self.adjacency) + sum(_list_nbytes(targets) for targets in self.adjacency)
+
+
+class _CompressedGraph:
+    """
+    Shared layout of CSR and CSC: offsets[i]:offsets[i + 1] is the slice of indices/weights
+    belonging to vertex i. CSR slices hold outgoing edges (indices = targets),
+    CSC slices hold incoming edges (indices = sources).
+    """
+
+    name = None
+
+    def __init__(self, vertices, offsets, indices, weights):
+        self.vertices = VertexIndex.of(vertices)  # Vertex names <-> ids
+        self.offsets = offsets  # array('q') of length |V| + 1
+        self.indices = indices  # array('q') of length |E|
+        self.weights = weights  # array('d') of length |E|
+
+    @classmethod
+    def _pack(cls, vertices, major, minor, edge_weights):
+        """Packs parallel id/weight arrays with a counting sort on the major id."""
+        num_vertices = len(vertices)
+        counts = [0] * (num_vertices + 1)
+        for i in major:
+            counts[i + 1] += 1
+        for i in range(num_vertices):
+            counts[i + 1] += counts[i]
+        offsets = array("q", counts)
+        cursor = counts[:-1]
+        indices = array("q", bytes(8 * len(major)))
+        weights = array("d", bytes(8 * len(major)))
+        for i, j, weight in zip(major, minor, edge_weights):
+            slot = cursor[i]
+            indices[slot] = j
+            weights[slot] = weight
+            cursor[i] = slot + 1
+        return cls(vertices, offsets, indices, weights)
+
+    @property
+    def num_edges(self):
+        return len(self.indices)
+
+    def slice(self, i):
+        """Yields (other endpoint id, weight) for the edges stored under vertex id i."""
+        for slot in range(self.offsets[i], self.offsets[i + 1]):
+            yield self.indices[slot], self.weights[slot]
+
+    def nbytes(self):
+        """Memory held by the offsets, indices and weights buffers."""
+        return _array_nbytes(self.offsets) + _array_nbytes(self.indices) + _array_nbytes(self.weights)
+
+
+class CSRGraph(_CompressedGraph):
+    """Compressed sparse rows: outgoing edges of each vertex stored contiguously."""
+
+    name = "csr"
+
+    @classmethod
+    def _from_arrays(cls, vertices, src, dst, weights):
+        return cls._pack(vertices, src, dst, weights)
+
+    def edges(self):
+        """Yields (u id, v id, weight) for every edge."""
+        for u in range(len(self.vertices)):
+            for v, weight in self.slice(u):
+                yield u, v, weight
+
+    def neighbors(self, u):
+        """Yields (v id, weight) for the edges leaving vertex id u."""
+        return self.slice(u)
+
+
+class CSCGraph(_CompressedGraph):
+    """Compressed sparse columns: incoming edges of each vertex stored contiguously."""
+
+    name = "csc"
+
+    @classmethod
+    def _from_arrays(cls, vertices, src, dst, weights):
+        return cls._pack(vertices, dst, src, weights)
+
+    def edges(self):
+        """Yields (u id, v id, weight) for every edge."""
+        for v in range(len(self.vertices)):
+            for u, weight in self.slice(v):
+                yield u, v, weight
+
+    def neighbors(self, u):
+        """Yields (v id, weight) for the edges leaving vertex id u (a full scan: prefer CSR for this)."""
+        return ((v, weight) for source, v, weight in self.edges() if source == u)
+
+    def predecessors(self, v):
+        """Yields (u id, weight) for the edges entering vertex id v."""
+        return self.slice(v)
+
+
+class DenseMatrixGraph:
+    """
+    |V| x |V| weight matrix: matrix[i][j] is the edge weight, ∞ if there is no edge and 0 on the diagonal.
+    Parallel edges collapse to the cheapest one, as a shortest-path algorithm would use.
+    """
+
+    name = "dense"
+
+    def __init__(self, vertices, matrix):
+        self.vertices = VertexIndex.of(vertices)  # Vertex names <-> ids
+        self.matrix = matrix  # List of array('d') rows
+
+    @classmethod
+    def _from_arrays(cls, vertices, src, dst, weights):
+        num_vertices = len(vertices)
+        matrix = [array("d", [math.inf]) * num_vertices for _ in range(num_vertices)]  # Initialize matrix with infinity
+        for i in range(num_vertices):
+            matrix[i][i] = 0  # Set diagonal entries to 0 (self-distance)
+        for i, j, weight in zip(src, dst, weights):
+            if weight < matrix[i][j]:
+                matrix[i][j] = weight  # Set edge weight in the matrix
+        return cls(vertices, matrix)
+
+    @property
+    def num_edges(self):
+        return sum(1 for _ in self.edges())
+
+    def edges(self):
+        """Yields (u id, v id, weight) for every finite off-diagonal entry (and negative self-loops)."""
+        for i, row in enumerate(self.matrix):
+            for j, weight in enumerate(row):
+                if weight != math.inf and (i != j or weight < 0):
+                    yield i, j, weight
+
+    def neighbors(self, u):
+        """Yields (v id, weight) for the edges leaving vertex id u."""
+        row = self.matrix[u]
+        return ((v, weight) for v, weight in enumerate(row) if weight != math.inf and (v != u or weight < 0))
+
+    def nbytes(self):
+        """Memory held by the matrix rows."""
+        return sys.getsizeof(self.matrix) + sum(_array_nbytes(row) for row in self.matrix)
+
+
+_CLASSES = {"adjacency": AdjacencyListGraph, "csr": CSRGraph, "csc": CSCGraph, "dense": DenseMatrixGraph}
+
+
+def convert(graph, backend):
+    """Converts any backend to another one; the result shares the same VertexIndex."""
+    target = _CLASSES[backend]
+    if isinstance(graph, target):
+        return graph
+    src, dst, weights = array("q"), array("q"), array("d")
+    for u, v, weight in graph.edges():
+        src.append(u)
+        dst.append(v)
+        weights.append(weight)
+    return target._from_arrays(graph.vertices, src, dst, weights)
+
+
+def estimated_nbytes(backend, num_vertices, num_edges):
+    """Rough memory footprint of a backend before building it (CPython, 64-bit)."""
+    if backend == "dense":
+        return num_vertices * (num_vertices * 8 + 64 + 8)  # array('d') rows plus the row list
+    if backend in ("csr", "csc"):
+        return (num_vertices + 1) * 8 + num_edges * 16  # int64 offsets, int64 indices, float64 weights
+    return num_vertices * 64 + num_edges * (8 + 56 + 32)  # List slots, tuples and their int/float objects
+
+
+def choose_backend(num_vertices, num_edges):
+    """
+    Picks the dense matrix for small dense graphs and CSR for everything else.
+    The matrix keeps one weight per vertex pair, so a graph built as "dense" (also through "auto") drops
+    parallel edges except the cheapest and self-loops with non-negative weight; pick "csr" to keep them.
+    """
+    if num_vertices == 0:
+        return "dense"
+    density = num_edges / (num_vertices * num_vertices)
+    if density >= DENSE_THRESHOLD and num_vertices <= DENSE_MAX_VERTICES:
+        return "dense"
+    return "csr"
+
+
+def build_graph(vertices, edges, backend="auto", add_missing=False):
+    """
+    Builds a graph from vertex names (or a VertexIndex) and (u, v, weight) tuples of names.
+    :param backend: One of BACKENDS, or "auto" to pick one from the edge density (see choose_backend).
+    :param add_missing: Intern edge endpoints that are not in vertices instead of raising ValueError.
+    """
+    vertices = VertexIndex.of(vertices)
+    src, dst, weights = vertices.intern_edges(edges, add_missing=add_missing)
+    return from_arrays(vertices, src, dst, weights, backend)
+
+
+def from_arrays(vertices, src, dst, weights, backend="auto"):
+    """Builds a graph from a VertexIndex and parallel source id, target id and weight arrays."""
+    if backend == "auto":
+        backend = choose_backend(len(vertices), len(src))
+    if backend not in _CLASSES:
+        raise ValueError(f"Unknown backend {backend!r}, expected one of {', '.join(BACKENDS)} or 'auto'")
+    return _CLASSES[backend]._from_arrays(VertexIndex.of(vertices), src, dst, weights)
+
+
+def memory_report(graph):
+    """
+    Bytes for the graph in every backend, measured by building each one. Beyond DENSE_MAX_VERTICES vertices
+    the dense matrix is not built: its entry is estimated_nbytes, so the report never allocates V² weights.
+    """
+    report = {}
+    for backend in BACKENDS:
+        if backend == "dense" and graph.name != "dense" and len(graph.vertices) > DENSE_MAX_VERTICES:
+            report[backend] = estimated_nbytes(backend, len(graph.vertices), graph.num_edges)
+        else:
+            report[backend] = convert(graph, backend).nbytes()
+    return report
+
+
+def format_graph(graph):
+    """Text rendering of a graph in its own backend layout, one line per row/vertex."""
+    names = graph.vertices
+    if isinstance(graph, DenseMatrixGraph):
+        return ["[" + ", ".join(format_weight(weight) for weight in row) + "]" for row in graph.matrix]
+    if isinstance(graph, AdjacencyListGraph):
+        return [f"{names[u]}: " + ", ".join(f"{names[v]}({format_weight(w)})" for v, w in targets)
+                for u, targets in enumerate(graph.adjacency)]
+    return [
+        "offsets: " + str(list(graph.offsets)),
+        ("targets: " if isinstance(graph, CSRGraph) else "sources: ") + str([names[i] for i in graph.indices]),
+        "weights: [" + ", ".join(format_weight(w) for w in graph.weights) + "]",
+    ]
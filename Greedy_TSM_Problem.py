@@ -5,32 +5,7 @@
 
 import tkinter as tk
 from tkinter import messagebox
-import math
-
-# Function to calculate distance between two points
-def distance(point1, point2):
-    return math.sqrt((point1[0] - point2[0])**2 + (point1[1] - point2[1])**2)
-
-# Greedy TSP algorithm
-def greedy_tsp(points):
-    visited = []
-    total_distance = 0
-    current_point = points.pop(0)
-    visited.append(current_point)
-
-    while points:
-        # Find the closest point
-        closest_point = min(points, key=lambda point: distance(current_point, point))
-        total_distance += distance(current_point, closest_point)
-        visited.append(closest_point)
-        points.remove(closest_point)
-        current_point = closest_point
-
-    # Return to the starting point
-    total_distance += distance(current_point, visited[0])
-    visited.append(visited[0])
-
-    return visited, total_distance
+from TSP_Solver import greedy_tsp, improve_tsp  # Headless tour builder and 2-opt/Or-opt improvement stage
 
 # Function to arrange points in a pyramid shape
 def arrange_pyramid_points(points, canvas_width, canvas_height):
@@ -69,7 +44,8 @@ def visualize_tsp():
     arranged_points = arrange_pyramid_points(points, canvas_width=1000, canvas_height=800)
 
     # Perform TSP greedy algorithm
-    visited, total_distance = greedy_tsp(arranged_points[:])  # Preserve original points
+    visited, greedy_distance = greedy_tsp(arranged_points[:])  # Preserve original points
+    visited, total_distance, _ = improve_tsp(visited, time_budget=1.0)  # 2-opt and Or-opt on the greedy tour
 
     # Visualize results
     canvas.delete("all")
@@ -90,43 +66,44 @@ def visualize_tsp():
         canvas.create_text(x1, y1 - 10, text=f"{i + 1}", fill="black")
 
     result_label.config(
-        text=f"Total Distance: {total_distance:.2f}\nVisited Order: {visited}"
+        text=f"Total Distance: {total_distance:.2f} (greedy tour: {greedy_distance:.2f})\nVisited Order: {visited}"
     )
 
-# Create main window
-root = tk.Tk()
-root.title("Greedy TSP Solver with Pyramid Structure")
-root.geometry("1200x800")  # Set the window size
-
-# Input field for custom points
-frame = tk.Frame(root)
-frame.pack(pady=10)
-
-tk.Label(frame, text="Enter custom points (x1,y1;x2,y2;...):").pack(side=tk.LEFT, padx=5)
-entry_points = tk.Entry(frame, width=40)
-entry_points.pack(side=tk.LEFT, padx=5)
-tk.Button(frame, text="Solve TSP", command=visualize_tsp).pack(side=tk.LEFT, padx=5)
-
-# Expanded Canvas for visualization
-canvas = tk.Canvas(root, width=1000, height=800, bg="white")
-canvas.pack(pady=10)
-
-# Label for result
-result_label = tk.Label(root, text="Total Distance: N/A\nVisited Order: N/A", font=("Arial", 14))
-result_label.pack(pady=10)
-
-# Algorithm Definition & Uses
-algo_label = tk.Label(root, text=(
-    "Algorithm: Greedy Traveling Salesman Problem (TSP)\n\n"
-    "Definition: The Greedy TSP algorithm finds an approximate shortest route "
-    "by always selecting the closest next point. While not optimal, it provides "
-    "a fast and efficient solution in many practical scenarios.\n\n"
-    "Real-World Applications:\n"
-    "• Delivery route optimization (e.g., postal services)\n"
-    "• Circuit design for minimal wiring connections\n"
-    "• Logistics planning for warehouse operations\n"
-    "• City traffic routing for autonomous vehicles"
-), font=("Arial", 12), justify="left", wraplength=1100)
-algo_label.pack(pady=20)
-
-root.mainloop()
+if __name__ == "__main__":
+    # Create main window
+    root = tk.Tk()
+    root.title("Greedy TSP Solver with Pyramid Structure")
+    root.geometry("1200x800")  # Set the window size
+
+    # Input field for custom points
+    frame = tk.Frame(root)
+    frame.pack(pady=10)
+
+    tk.Label(frame, text="Enter custom points (x1,y1;x2,y2;...):").pack(side=tk.LEFT, padx=5)
+    entry_points = tk.Entry(frame, width=40)
+    entry_points.pack(side=tk.LEFT, padx=5)
+    tk.Button(frame, text="Solve TSP", command=visualize_tsp).pack(side=tk.LEFT, padx=5)
+
+    # Expanded Canvas for visualization
+    canvas = tk.Canvas(root, width=1000, height=800, bg="white")
+    canvas.pack(pady=10)
+
+    # Label for result
+    result_label = tk.Label(root, text="Total Distance: N/A\nVisited Order: N/A", font=("Arial", 14))
+    result_label.pack(pady=10)
+
+    # Algorithm Definition & Uses
+    algo_label = tk.Label(root, text=(
+        "Algorithm: Greedy Traveling Salesman Problem (TSP)\n\n"
+        "Definition: The Greedy TSP algorithm finds an approximate shortest route "
+        "by always selecting the closest next point. While not optimal, it provides "
+        "a fast and efficient solution in many practical scenarios.\n\n"
+        "Real-World Applications:\n"
+        "• Delivery route optimization (e.g., postal services)\n"
+        "• Circuit design for minimal wiring connections\n"
+        "• Logistics planning for warehouse operations\n"
+        "• City traffic routing for autonomous vehicles"
+    ), font=("Arial", 12), justify="left", wraplength=1100)
+    algo_label.pack(pady=20)
+
+    root.mainloop()
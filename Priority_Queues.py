@@ -0,0 +1,383 @@
+#code by Kartheek Vikash Meesala
+#email: letter2kartheekvikashmeesala@gmail.com
+#Interchangeable priority-queue backends behind one interface: binary, pairing, radix and Fibonacci heaps, skip list
+#https://github.com/kartheekvikash/Algorithms.git
+
+import abc  # Abstract interface every backend must implement
+import heapq  # Binary heap for the lazy-deletion backend
+import itertools  # Stamps that tell current heap entries from stale ones
+import math  # Import math module to represent infinity
+
+from Fibonacci_Heap import FibonacciHeap
+from Skip_List import SkipList
+
+
+class PriorityQueue(abc.ABC):
+    """
+    Interface shared by every backend (a min-queue of keys with payloads):
+    push(key, value) -> handle, pop() -> (key, value), peek() -> (key, value) or None,
+    decrease_key(handle, key) and len(). Handles are opaque and only valid until their item is popped.
+    A backend missing any of these cannot be instantiated.
+    """
+
+    name = None
+
+    @abc.abstractmethod
+    def push(self, key, value=None):
+        """Adds key with its payload and returns a handle for decrease_key."""
+
+    @abc.abstractmethod
+    def pop(self):
+        """Removes and returns the (key, value) with the smallest key; raises IndexError if empty."""
+
+    @abc.abstractmethod
+    def peek(self):
+        """The (key, value) pop would return, or None if the queue is empty."""
+
+    @abc.abstractmethod
+    def decrease_key(self, handle, key):
+        """Lowers the key of a queued item; raises ValueError if key is greater than its current key."""
+
+    @abc.abstractmethod
+    def __len__(self):
+        """Number of queued items."""
+
+
+def _check_decrease(old, new):
+    if new > old:
+        raise ValueError(f"New key {new!r} is greater than the current key {old!r}")
+
+
+# ---------------------------- Binary Heap ---------------------------- #
+
+class BinaryHeapQueue(PriorityQueue):
+    """
+    heapq with lazy deletion: decrease_key pushes a fresh entry and the old one is skipped when it surfaces.
+    Handles are [key, value, stamp] lists; an entry (key, stamp, handle) is current while the stamps match.
+    """
+
+    name = "binary"
+
+    def __init__(self):
+        self.heap = []
+        self.size = 0
+        self.stamps = itertools.count()
+
+    def __len__(self):
+        return self.size
+
+    def push(self, key, value=None):
+        stamp = next(self.stamps)
+        handle = [key, value, stamp]
+        heapq.heappush(self.heap, (key, stamp, handle))
+        self.size += 1
+        return handle
+
+    def _clean(self):
+        heap = self.heap
+        while heap and heap[0][1] != heap[0][2][2]:
+            heapq.heappop(heap)  # Stale entry
+
+    def peek(self):
+        self._clean()
+        if not self.heap:
+            return None
+        handle = self.heap[0][2]
+        return handle[0], handle[1]
+
+    def pop(self):
+        self._clean()
+        if not self.heap:
+            raise IndexError("pop from an empty priority queue")
+        handle = heapq.heappop(self.heap)[2]
+        handle[2] = None  # Any remaining entries of this handle are now stale
+        self.size -= 1
+        return handle[0], handle[1]
+
+    def decrease_key(self, handle, key):
+        _check_decrease(handle[0], key)
+        stamp = next(self.stamps)
+        handle[0], handle[2] = key, stamp
+        heapq.heappush(self.heap, (key, stamp, handle))
+
+
+# ---------------------------- Pairing Heap ---------------------------- #
+
+class PairingNode:
+    """Pairing heap node: first child, next sibling and prev (previous sibling, or the parent for a first child)."""
+
+    __slots__ = ("key", "value", "child", "sibling", "prev")
+
+    def __init__(self, key, value):
+        self.key = key
+        self.value = value
+        self.child = None
+        self.sibling = None
+        self.prev = None
+
+
+class PairingHeapQueue(PriorityQueue):
+    """
+    Pairing heap: O(1) push and meld, O(log n) amortized pop with the two-pass pairing,
+    and decrease_key by cutting the subtree and melding it with the root.
+    """
+
+    name = "pairing"
+
+    def __init__(self):
+        self.root = None
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    @staticmethod
+    def _meld(a, b):
+        """Makes the root with the larger key the first child of the other; returns the new root."""
+        if b.key < a.key:
+            a, b = b, a
+        b.sibling = a.child
+        if a.child:
+            a.child.prev = b
+        b.prev = a
+        a.child = b
+        return a
+
+    def push(self, key, value=None):
+        node = PairingNode(key, value)
+        self.root = node if self.root is None else self._meld(self.root, node)
+        self.size += 1
+        return node
+
+    def peek(self):
+        return (self.root.key, self.root.value) if self.root else None
+
+    def pop(self):
+        root = self.root
+        if root is None:
+            raise IndexError("pop from an empty priority queue")
+        children = []
+        child = root.child
+        while child:
+            following = child.sibling
+            child.prev = child.sibling = None
+            children.append(child)
+            child = following
+        paired = [self._meld(children[i], children[i + 1]) if i + 1 < len(children) else children[i]
+                  for i in range(0, len(children), 2)]  # First pass: left to right in pairs
+        merged = paired.pop() if paired else None
+        while paired:  # Second pass: right to left into one tree
+            merged = self._meld(paired.pop(), merged)
+        self.root = merged
+        self.size -= 1
+        return root.key, root.value
+
+    def decrease_key(self, node, key):
+        _check_decrease(node.key, key)
+        node.key = key
+        if node is self.root:
+            return
+        if node.prev.child is node:  # First child: prev is the parent
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+        if node.sibling:
+            node.sibling.prev = node.prev
+        node.prev = node.sibling = None
+        self.root = self._meld(self.root, node)
+
+
+# ---------------------------- Radix Heap ---------------------------- #
+
+class RadixHeapQueue(PriorityQueue):
+    """
+    Monotone radix heap for non-negative integer keys: no key may be smaller than the last popped one
+    (as in Dijkstra with integer weights). Bucket i holds keys whose highest bit differing from the last
+    popped key is bit i - 1, so each key moves down at most log(C) buckets in total.
+    Decrease-key is lazy, as in BinaryHeapQueue.
+    """
+
+    name = "radix"
+
+    def __init__(self):
+        self.buckets = [[] for _ in range(65)]  # Grows for keys beyond 64 bits
+        self.last = 0  # Last popped key; every key in the queue is >= last
+        self.size = 0
+        self.stamps = itertools.count()
+
+    def __len__(self):
+        return self.size
+
+    def _put(self, key, stamp, handle):
+        index = (key ^ self.last).bit_length()
+        while index >= len(self.buckets):
+            self.buckets.append([])
+        self.buckets[index].append((key, stamp, handle))
+
+    def _check_key(self, key):
+        try:
+            integral = int(key)
+        except (OverflowError, TypeError, ValueError):  # inf, nan and non-numbers
+            integral = None
+        if integral is None or key != integral or key < self.last:
+            raise ValueError(f"Radix heap keys must be integers >= the last popped key {self.last}, got {key!r}")
+        return integral
+
+    def push(self, key, value=None):
+        key = self._check_key(key)
+        stamp = next(self.stamps)
+        handle = [key, value, stamp]
+        self._put(key, stamp, handle)
+        self.size += 1
+        return handle
+
+    def _settle(self):
+        """Makes bucket 0 end with a current entry holding the minimum key; returns False if empty."""
+        zero = self.buckets[0]
+        while zero and zero[-1][1] != zero[-1][2][2]:
+            zero.pop()
+        if zero:
+            return True
+        for bucket in itertools.islice(self.buckets, 1, None):
+            live = [entry for entry in bucket if entry[1] == entry[2][2]]
+            bucket.clear()
+            if live:
+                self.last = min(entry[0] for entry in live)
+                for entry in live:  # Every entry lands in a lower bucket; the minimum in bucket 0
+                    self._put(*entry)
+                return True
+        return False
+
+    def peek(self):
+        if not self._settle():
+            return None
+        handle = self.buckets[0][-1][2]
+        return handle[0], handle[1]
+
+    def pop(self):
+        if not self._settle():
+            raise IndexError("pop from an empty priority queue")
+        handle = self.buckets[0].pop()[2]
+        handle[2] = None
+        self.size -= 1
+        return handle[0], handle[1]
+
+    def decrease_key(self, handle, key):
+        _check_decrease(handle[0], key)
+        key = self._check_key(key)
+        stamp = next(self.stamps)
+        handle[0], handle[2] = key, stamp
+        self._put(key, stamp, handle)
+
+
+# ---------------------------- Fibonacci Heap ---------------------------- #
+
+class FibonacciHeapQueue(PriorityQueue):
+    """FibonacciHeap behind the shared interface; handles are its nodes."""
+
+    name = "fibonacci"
+
+    def __init__(self):
+        self.heap = FibonacciHeap()
+
+    def __len__(self):
+        return len(self.heap)
+
+    def push(self, key, value=None):
+        return self.heap.insert(key, value)
+
+    def peek(self):
+        node = self.heap.min_node
+        return (node.key, node.value) if node else None
+
+    def pop(self):
+        node = self.heap.extract_min_node()
+        if node is None:
+            raise IndexError("pop from an empty priority queue")
+        return node.key, node.value
+
+    def decrease_key(self, node, key):
+        self.heap.decrease_key(node, key)
+
+
+# ---------------------------- Skip List ---------------------------- #
+
+class SkipListQueue(PriorityQueue):
+    """
+    SkipList used as a priority queue: items are (key, stamp, handle) tuples, so equal keys stay distinct
+    and pop in insertion order. The minimum is the first node of level 0; decrease_key is delete + insert.
+    """
+
+    name = "skiplist"
+
+    def __init__(self, max_level=4, p=0.5):
+        self.skip_list = SkipList(max_level, p)
+        self.size = 0
+        self.stamps = itertools.count()
+
+    def __len__(self):
+        return self.size
+
+    def push(self, key, value=None):
+        handle = [key, value, next(self.stamps)]
+        self.skip_list.insert((key, handle[2], handle))
+        self.size += 1
+        return handle
+
+    def peek(self):
+        first = self.skip_list.header.forward[0]
+        return (first.key[0], first.key[2][1]) if first else None
+
+    def pop(self):
+        first = self.skip_list.header.forward[0]
+        if first is None:
+            raise IndexError("pop from an empty priority queue")
+        self.skip_list.delete(first.key)
+        self.size -= 1
+        return first.key[0], first.key[2][1]
+
+    def decrease_key(self, handle, key):
+        _check_decrease(handle[0], key)
+        self.skip_list.delete((handle[0], handle[2], handle))
+        handle[0], handle[2] = key, next(self.stamps)
+        self.skip_list.insert((key, handle[2], handle))
+
+
+QUEUES = {queue.name: queue for queue in
+          (BinaryHeapQueue, PairingHeapQueue, RadixHeapQueue, FibonacciHeapQueue, SkipListQueue)}
+
+
+def make_queue(backend="binary"):
+    """Creates an empty queue of the named backend (one of QUEUES)."""
+    try:
+        return QUEUES[backend]()
+    except KeyError:
+        raise ValueError(f"Unknown priority queue {backend!r}, expected one of {', '.join(QUEUES)}") from None
+
+
+def dijkstra(adjacency, source, backend="binary"):
+    """
+    Dijkstra's algorithm over adjacency lists of (v, weight) pairs on any backend, with one queue item
+    per vertex updated through decrease_key. The radix backend needs integer weights.
+    :param backend: Name of a backend in QUEUES, or an empty PriorityQueue instance to use as is.
+    :return: (distances, predecessors) lists indexed by vertex id.
+    """
+    distances = [math.inf] * len(adjacency)
+    predecessors = [None] * len(adjacency)
+    handles = [None] * len(adjacency)  # Queue handle of every vertex still in the queue
+    distances[source] = 0
+    queue = backend if isinstance(backend, PriorityQueue) else make_queue(backend)
+    handles[source] = queue.push(0, source)
+    while len(queue):
+        d, u = queue.pop()
+        handles[u] = None
+        for v, weight in adjacency[u]:
+            candidate = d + weight
+            if candidate < distances[v]:
+                if handles[v] is None:
+                    handles[v] = queue.push(candidate, v)
+                else:
+                    queue.decrease_key(handles[v], candidate)
+                distances[v] = candidate
+                predecessors[v] = u
+    return distances, predecessors
@@ -5,7 +5,12 @@
 
 
 import tkinter as tk  # Import the Tkinter module for GUI creation
-import math  # Import math module to represent infinity
+from tkinter import filedialog  # File picker for loading graph files
+from Graph_Representations import (BACKENDS, DENSE_MAX_VERTICES, build_graph, format_graph, format_weight,
+                                   memory_report)  # Graph backends
+from Graph_IO import read_edges  # Edge-list, CSV, DIMACS and binary graph loaders
+from Shortest_Path_Solvers import all_pairs_shortest_paths, choose_method  # Dijkstra, Floyd-Warshall, Johnson
+from Vertex_Index import VertexIndex  # Shared name <-> id interning table
 
 class GraphApp:
     def __init__(self, root):
@@ -14,8 +19,9 @@ class GraphApp:
         self.root.title("Graph Representation (Adjacency Matrix)")  # Set window title
         self.root.geometry("1200x700")  # Increase GUI size to fit screen
 
-        self.vertices = []  # List to store user-entered vertices
+        self.vertices = VertexIndex()  # User-entered vertices, with O(1) name lookups
         self.edges = {}  # Dictionary to store graph edges with weights
+        self.backend = tk.StringVar(value="auto")  # Representation chosen by the user ("auto" picks by density)
 
         # Labels and Entry Fields for User Input
         tk.Label(root, text="Enter Vertices (Comma-separated):", font=("Arial", 12)).grid(row=0, column=0, sticky="w", padx=10)
@@ -29,8 +35,12 @@ class GraphApp:
         # Buttons to interact with the application
         tk.Button(root, text="Set Vertices", font=("Arial", 12), command=self.set_vertices, width=15).grid(row=0, column=2, padx=10)
         tk.Button(root, text="Add Edge", font=("Arial", 12), command=self.add_edge, width=15).grid(row=1, column=2, padx=10)
-        tk.Button(root, text="Generate Matrix", font=("Arial", 12), command=self.display_matrix, width=15).grid(row=2, column=1, padx=10)
+        tk.Label(root, text="Representation:", font=("Arial", 12)).grid(row=2, column=0, sticky="w", padx=10)
+        tk.OptionMenu(root, self.backend, "auto", *BACKENDS).grid(row=2, column=1, sticky="w", padx=10)
+        tk.Button(root, text="Generate Graph", font=("Arial", 12), command=self.display_matrix, width=15).grid(row=2, column=2, padx=10)
+        tk.Button(root, text="Load Graph File", font=("Arial", 12), command=self.load_file, width=15).grid(row=3, column=1, padx=10)  # Bulk import from a file
         tk.Button(root, text="Clear Output", font=("Arial", 12), command=self.clear_output, width=15).grid(row=3, column=2, padx=10)  # New button to clear output
+        tk.Button(root, text="Shortest Paths", font=("Arial", 12), command=self.display_shortest_paths, width=15).grid(row=3, column=0, padx=10)  # All-pairs distances
 
         # Output Text Box to display results
         self.output_box = tk.Text(root, height=30, width=120, font=("Arial", 12))
@@ -38,8 +48,8 @@ class GraphApp:
 
     def set_vertices(self):
         """Extract and store vertices from user input."""
-        self.vertices = self.vertices_entry.get().split(",")  # Split input by commas
-        self.vertices = [v.strip() for v in self.vertices]  # Remove extra spaces
+        names = self.vertices_entry.get().split(",")  # Split input by commas
+        self.vertices = VertexIndex(v.strip() for v in names)  # Remove extra spaces and intern names to ids
         self.output_box.insert(tk.END, f"Vertices set: {', '.join(self.vertices)}\n")
 
     def add_edge(self):
@@ -61,23 +71,44 @@ class GraphApp:
         except ValueError:
             self.output_box.insert(tk.END, "Weight must be an integer!\n")  # Error handling for invalid weight input
 
+    def load_file(self):
+        """Load vertices and edges from an edge-list, CSV, DIMACS .gr or binary graph file."""
+        path = filedialog.askopenfilename(title="Open graph file")
+        if not path:
+            return
+        try:
+            self.vertices, edges = read_edges(path)
+        except (OSError, ValueError) as error:
+            self.output_box.insert(tk.END, f"Could not load {path}: {error}\n")
+            return
+        self.edges = {(u, v): weight for u, v, weight in edges}
+        self.output_box.insert(tk.END, f"Loaded {len(self.vertices)} vertices and {len(edges)} edges from {path}\n")
+
     def clear_output(self):
         """Clears the output box for new inputs."""
         self.output_box.delete("1.0", tk.END)  # Deletes all text inside the output box
 
-    def display_matrix(self):
-        """Generates and displays the adjacency matrix."""
-        num_vertices = len(self.vertices)  # Get the number of vertices
-        adj_matrix = [[math.inf] * num_vertices for _ in range(num_vertices)]  # Initialize matrix with infinity
+    def build(self):
+        """Builds the graph from the entered vertices and edges in the selected representation."""
+        edges = [(u, v, weight) for (u, v), weight in self.edges.items()]
+        return build_graph(self.vertices, edges, self.backend.get())  # "auto" picks a backend from the density
 
-        # Set diagonal entries to 0 (self-distance)
-        for i in range(num_vertices):
-            adj_matrix[i][i] = 0  
+    def display_shortest_paths(self):
+        """Runs the all-pairs solver picked from the weights and density and displays the distance matrix."""
+        graph = self.build()
+        method = choose_method(graph, all_pairs=True)
+        try:
+            result = all_pairs_shortest_paths(graph, method)
+        except ValueError as error:  # Negative weight cycle
+            self.output_box.insert(tk.END, f"{error}\n")
+            return
+        self.output_box.insert(tk.END, f"\nAll-pairs shortest paths ({method}, ∞ = unreachable):\n")
+        for name, row in zip(self.vertices, result.matrix):
+            self.output_box.insert(tk.END, f"{name}: [" + ", ".join(format_weight(d) for d in row) + "]\n")
 
-        # Populate the adjacency matrix with weights
-        for (u, v), weight in self.edges.items():
-            i, j = self.vertices.index(u), self.vertices.index(v)  # Get indices for vertices
-            adj_matrix[i][j] = weight  # Set edge weight in the matrix
+    def display_matrix(self):
+        """Generates and displays the graph in the selected representation (adjacency matrix by default for dense graphs)."""
+        graph = self.build()
 
         # Explanation of how the adjacency matrix works
         explanation = """
@@ -101,15 +132,31 @@ class GraphApp:
         [∞, ∞, ∞, 0]
 
         This method is commonly used in shortest path algorithms like Dijkstra and Bellman-Ford.
+        Press "Shortest Paths" to run Dijkstra, Floyd-Warshall or Johnson's algorithm on it.
         """
-        self.output_box.insert(tk.END, "\n" + explanation + "\nAdjacency Matrix (∞ represents missing edges):\n")
-        
-        # Display the final adjacency matrix in GUI output
-        for row in adj_matrix:
-            row_display = ["∞" if val == math.inf else val for val in row]  # Replace infinity with ∞ for display clarity
-            self.output_box.insert(tk.END, str(row_display) + "\n")
+        self.output_box.insert(tk.END, "\n" + explanation + "\n")
+
+        # Display the graph in the chosen representation
+        titles = {
+            "dense": "Adjacency Matrix (∞ represents missing edges):",
+            "adjacency": "Adjacency List (target(weight) per vertex):",
+            "csr": "CSR (outgoing edges of vertex i are targets[offsets[i]:offsets[i+1]]):",
+            "csc": "CSC (incoming edges of vertex i are sources[offsets[i]:offsets[i+1]]):",
+        }
+        self.output_box.insert(tk.END, titles[graph.name] + "\n")
+        for line in format_graph(graph):
+            self.output_box.insert(tk.END, line + "\n")
+
+        # Report the memory each backend needs for this graph
+        self.output_box.insert(tk.END, "\nMemory use per representation:\n")
+        for backend, size in memory_report(graph).items():
+            marker = "  ← shown" if backend == graph.name else ""
+            if backend == "dense" and backend != graph.name and len(graph.vertices) > DENSE_MAX_VERTICES:
+                marker = "  (estimated, not built)"
+            self.output_box.insert(tk.END, f"{backend:>10}: {size} bytes{marker}\n")
 
 # Run Tkinter App
-root = tk.Tk()  # Initialize Tkinter
-app = GraphApp(root)  # Create an instance of the GraphApp class
-root.mainloop()  # Run the GUI loop
\ No newline at end of file
+if __name__ == "__main__":
+    root = tk.Tk()  # Initialize Tkinter
+    app = GraphApp(root)  # Create an instance of the GraphApp class
+    root.mainloop()  # Run the GUI loop
@@ -0,0 +1,254 @@
+#code by Kartheek Vikash Meesala
+#email: letter2kartheekvikashmeesala@gmail.com
+#Shortest path solvers over the Graph_Representations backends: Dijkstra, Floyd-Warshall and Johnson
+#https://github.com/kartheekvikash/Algorithms.git
+
+import heapq  # Binary heap for Dijkstra's priority queue
+import math  # Import math module to represent infinity
+from array import array  # Compact rows for distance matrices
+
+from Bellman_Ford_Solver import bellman_ford, np  # Reweighting for Johnson; NumPy if it is installed
+from Fibonacci_Heap import dijkstra as _fibonacci_dijkstra  # Decrease-key Dijkstra
+from Priority_Queues import QUEUES, dijkstra as _queue_dijkstra  # Dijkstra on any priority-queue backend
+from Graph_Representations import DENSE_THRESHOLD, AdjacencyListGraph, DenseMatrixGraph, convert
+
+SINGLE_SOURCE_METHODS = ("dijkstra", "bellman-ford")  # Names accepted by shortest_paths()
+ALL_PAIRS_METHODS = ("dijkstra", "floyd-warshall", "johnson")  # Names accepted by all_pairs_shortest_paths()
+HEAPS = tuple(QUEUES)  # Priority queues accepted by dijkstra()
+
+
+class ShortestPaths:
+    """Single-source distances and predecessors, indexed by vertex id."""
+
+    def __init__(self, vertices, source, method, distances, predecessors):
+        self.vertices = vertices  # VertexIndex of the graph
+        self.source = source  # Source vertex id
+        self.method = method  # Algorithm that produced the result
+        self.distances = distances  # Vertex id -> distance (math.inf if unreachable)
+        self.predecessors = predecessors  # Vertex id -> previous vertex id on the shortest path, or None
+
+    def distance(self, name):
+        """Distance from the source to the named vertex."""
+        return self.distances[self.vertices.id_of(name)]
+
+    def path_to(self, name):
+        """Vertex names on the shortest path from the source to name ([] if unreachable)."""
+        target = self.vertices.id_of(name)
+        if self.distances[target] == math.inf:
+            return []
+        path = [target]
+        while path[-1] != self.source:
+            path.append(self.predecessors[path[-1]])
+        return [self.vertices[v] for v in reversed(path)]
+
+
+class AllPairsShortestPaths:
+    """|V| x |V| distance matrix: matrix[i][j] is the distance from vertex id i to vertex id j."""
+
+    def __init__(self, vertices, method, matrix):
+        self.vertices = vertices  # VertexIndex of the graph
+        self.method = method  # Algorithm that produced the matrix
+        self.matrix = matrix  # List of array('d') rows
+
+    def distance(self, u, v):
+        """Distance between two named vertices."""
+        return self.matrix[self.vertices.id_of(u)][self.vertices.id_of(v)]
+
+
+def _adjacency(graph):
+    """Outgoing (target, weight) lists per vertex id, reusing an adjacency-list backend as-is."""
+    if isinstance(graph, AdjacencyListGraph):
+        return graph.adjacency
+    return convert(graph, "adjacency").adjacency
+
+
+def has_negative_weights(graph):
+    """True if any edge weight is negative."""
+    return any(weight < 0 for _, _, weight in graph.edges())
+
+
+def density(graph):
+    """Edge density |E| / |V|²."""
+    num_vertices = len(graph.vertices)
+    return graph.num_edges / (num_vertices * num_vertices) if num_vertices else 0.0
+
+
+def _dijkstra(adjacency, source):
+    """Heap-based Dijkstra with lazy deletion over adjacency lists; weights must be non-negative."""
+    distances = [math.inf] * len(adjacency)
+    predecessors = [None] * len(adjacency)
+    distances[source] = 0
+    heap = [(0, source)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > distances[u]:
+            continue  # Stale entry: u was already settled with a shorter distance
+        for v, weight in adjacency[u]:
+            candidate = d + weight
+            if candidate < distances[v]:
+                distances[v] = candidate
+                predecessors[v] = u
+                heapq.heappush(heap, (candidate, v))
+    return distances, predecessors
+
+
+def dijkstra(graph, source, heap="binary"):
+    """
+    Single-source shortest paths for non-negative weights.
+    :param source: Source vertex name.
+    :param heap: "binary" (heapq with lazy deletion, O((V + E) log V)),
+                 "fibonacci" (FibonacciHeap with decrease_key, O(E + V log V)),
+                 or any other Priority_Queues backend ("radix" needs integer weights).
+    """
+    if heap not in HEAPS:
+        raise ValueError(f"Unknown heap {heap!r}, expected one of {', '.join(HEAPS)}")
+    if has_negative_weights(graph):
+        raise ValueError("Dijkstra's algorithm requires non-negative edge weights")
+    source_id = graph.vertices.id_of(source)
+    if heap == "binary":
+        distances, predecessors = _dijkstra(_adjacency(graph), source_id)
+    elif heap == "fibonacci":
+        distances, predecessors = _fibonacci_dijkstra(_adjacency(graph), source_id)
+    else:
+        distances, predecessors = _queue_dijkstra(_adjacency(graph), source_id, heap)
+    return ShortestPaths(graph.vertices, source_id, "dijkstra", distances, predecessors)
+
+
+def _negative_cycle_error(graph, cycle):
+    names = [str(graph.vertices[v]) for v in cycle]
+    return ValueError("Graph contains a negative weight cycle: " + " → ".join(names + names[:1]))
+
+
+def _bellman_ford(graph, source_id):
+    """Runs the Bellman-Ford solver on vertex ids and returns id-indexed distances and predecessors."""
+    num_vertices = len(graph.vertices)
+    result = bellman_ford(range(num_vertices), graph.edges(), source_id, strategy="spfa")
+    if result.has_negative_cycle:
+        raise _negative_cycle_error(graph, result.negative_cycle)
+    return [result.distances[v] for v in range(num_vertices)], [result.predecessors[v] for v in range(num_vertices)]
+
+
+def _fw_tile_python(matrix, rows, columns, pivots):
+    """Relaxes matrix[i][j] through every pivot k for the tile rows x columns (pure Python kernel)."""
+    j0, j1 = columns.start, columns.stop
+    for k in pivots:
+        row_k = matrix[k][j0:j1]
+        for i in rows:
+            dik = matrix[i][k]
+            if dik == math.inf:
+                continue
+            row_i = matrix[i]
+            row_i[j0:j1] = [a if a <= dik + b else dik + b for a, b in zip(row_i[j0:j1], row_k)]
+
+
+def _fw_tile_numpy(matrix, rows, columns, pivots):
+    """Relaxes one tile through every pivot with NumPy rank-1 updates (the tile stays in cache)."""
+    rows, columns = slice(rows.start, rows.stop), slice(columns.start, columns.stop)
+    tile = matrix[rows, columns]  # A view: updates land in the matrix
+    for k in pivots:
+        np.minimum(tile, matrix[rows, k, None] + matrix[k, columns], out=tile)
+
+
+def floyd_warshall(graph, block_size=128):
+    """
+    All-pairs shortest paths on the dense matrix with the blocked (tiled) Floyd-Warshall schedule:
+    for every pivot block, the diagonal tile is closed first, then the tiles sharing its row or column,
+    then all remaining tiles. Each phase only reads tiles that are final for the current pivots.
+    Uses NumPy tiles when NumPy is installed, list slices otherwise.
+    """
+    dense = convert(graph, "dense")
+    num_vertices = len(dense.vertices)
+    if np is not None:
+        matrix = np.array([row.tolist() for row in dense.matrix], dtype=np.float64).reshape(num_vertices, num_vertices)
+        tile = _fw_tile_numpy
+    else:
+        matrix = [row.tolist() for row in dense.matrix]
+        tile = _fw_tile_python
+    blocks = [range(start, min(start + block_size, num_vertices)) for start in range(0, num_vertices, block_size)]
+    for kb, pivots in enumerate(blocks):
+        tile(matrix, pivots, pivots, pivots)  # Phase 1: diagonal tile
+        for other in range(len(blocks)):  # Phase 2: pivot row and pivot column
+            if other != kb:
+                tile(matrix, blocks[kb], blocks[other], pivots)
+                tile(matrix, blocks[other], blocks[kb], pivots)
+        for i in range(len(blocks)):  # Phase 3: everything else
+            for j in range(len(blocks)):
+                if i != kb and j != kb:
+                    tile(matrix, blocks[i], blocks[j], pivots)
+    for v in range(num_vertices):
+        if matrix[v][v] < 0:
+            raise ValueError(f"Graph contains a negative weight cycle through {dense.vertices[v]}")
+    rows = [array("d", row) for row in matrix]
+    return AllPairsShortestPaths(dense.vertices, "floyd-warshall", rows)
+
+
+def johnson(graph):
+    """
+    All-pairs shortest paths for sparse graphs with negative weights: Bellman-Ford from a virtual source
+    (joined to every vertex by a 0-weight edge) gives potentials h, every edge is reweighted to
+    w + h[u] - h[v] >= 0, and Dijkstra runs from each vertex on the reweighted graph.
+    """
+    num_vertices = len(graph.vertices)
+    virtual = num_vertices  # Id of the extra source vertex
+    edges = list(graph.edges())
+    result = bellman_ford(range(num_vertices + 1), edges + [(virtual, v, 0) for v in range(num_vertices)],
+                          virtual, strategy="spfa")
+    if result.has_negative_cycle:
+        raise _negative_cycle_error(graph, [v for v in result.negative_cycle if v != virtual])
+    potential = result.distances
+    reweighted = [[] for _ in range(num_vertices)]
+    for u, v, weight in edges:
+        reweighted[u].append((v, weight + potential[u] - potential[v]))
+    rows = []
+    for u in range(num_vertices):
+        distances, _ = _dijkstra(reweighted, u)
+        rows.append(array("d", [d - potential[u] + potential[v] if d != math.inf else math.inf
+                                for v, d in enumerate(distances)]))
+    return AllPairsShortestPaths(graph.vertices, "johnson", rows)
+
+
+def repeated_dijkstra(graph):
+    """All-pairs shortest paths for non-negative weights: one Dijkstra per vertex."""
+    adjacency = _adjacency(graph)
+    rows = [array("d", _dijkstra(adjacency, u)[0]) for u in range(len(graph.vertices))]
+    return AllPairsShortestPaths(graph.vertices, "dijkstra", rows)
+
+
+def choose_method(graph, all_pairs=False):
+    """
+    Picks a solver from the sign of the weights and the graph density:
+    single source -> Dijkstra, or Bellman-Ford if any weight is negative;
+    all pairs -> Floyd-Warshall on dense graphs, else Dijkstra per vertex, or Johnson if any weight is negative.
+    """
+    negative = has_negative_weights(graph)
+    if not all_pairs:
+        return "bellman-ford" if negative else "dijkstra"
+    if isinstance(graph, DenseMatrixGraph) or density(graph) >= DENSE_THRESHOLD:
+        return "floyd-warshall"
+    return "johnson" if negative else "dijkstra"
+
+
+def shortest_paths(graph, source, method="auto"):
+    """Single-source shortest paths from the named source; method is one of SINGLE_SOURCE_METHODS or "auto"."""
+    method = choose_method(graph) if method == "auto" else method
+    if method == "dijkstra":
+        return dijkstra(graph, source)
+    if method == "bellman-ford":
+        source_id = graph.vertices.id_of(source)
+        distances, predecessors = _bellman_ford(graph, source_id)
+        return ShortestPaths(graph.vertices, source_id, "bellman-ford", distances, predecessors)
+    raise ValueError(f"Unknown method {method!r}, expected one of {', '.join(SINGLE_SOURCE_METHODS)} or 'auto'")
+
+
+def all_pairs_shortest_paths(graph, method="auto"):
+    """All-pairs shortest paths; method is one of ALL_PAIRS_METHODS or "auto"."""
+    method = choose_method(graph, all_pairs=True) if method == "auto" else method
+    if method == "floyd-warshall":
+        return floyd_warshall(graph)
+    if method == "johnson":
+        return johnson(graph)
+    if method == "dijkstra":
+        if has_negative_weights(graph):
+            raise ValueError("Dijkstra's algorithm requires non-negative edge weights")
+        return repeated_dijkstra(graph)
+    raise ValueError(f"Unknown method {method!r}, expected one of {', '.join(ALL_PAIRS_METHODS)} or 'auto'")
@@ -6,117 +6,14 @@
 
 import tkinter as tk  # Import tkinter for GUI creation
 from tkinter import messagebox, scrolledtext  # Import messagebox for alerts, scrolledtext for large text fields
-import random  # Import random module for probabilistic level assignment
-
-# ---------------------------- Skip List Node Definition ---------------------------- #
-
-class Node:
-    """Represents a node in the Skip List."""
-    def __init__(self, key, level):
-        self.key = key  # Stores the key (value) of the node
-        self.forward = [None] * (level + 1)  # Pointers to next nodes at different levels
-
-# ---------------------------- Skip List Data Structure ---------------------------- #
-
-class SkipList:
-    """Skip List data structure supporting insert, search, and delete operations."""
-    def __init__(self, max_level, p):
-        """
-        Initializes the Skip List.
-        :param max_level: Maximum level allowed in the Skip List.
-        :param p: Probability factor for level increment.
-        """
-        self.max_level = max_level  # Maximum levels allowed
-        self.p = p  # Probability for determining node levels
-        self.header = Node(None, max_level)  # Header (sentinel) node with max levels
-        self.level = 0  # Current highest level in the list
-
-    def random_level(self):
-        """
-        Generates a random level for a new node based on probability 'p'.
-        Higher probability results in taller levels.
-        """
-        lvl = 0
-        while random.random() < self.p and lvl < self.max_level:
-            lvl += 1
-        return lvl
-
-    def insert(self, key):
-        """
-        Inserts a key into the Skip List.
-        - Determines the level for the new node using `random_level()`.
-        - Updates forward pointers to maintain structure.
-        """
-        update = [None] * (self.max_level + 1)  # Tracks nodes that need updating
-        current = self.header  # Start from header node
-        
-        # Move through levels from highest to lowest
-        for i in range(self.level, -1, -1):
-            while current.forward[i] and current.forward[i].key < key:
-                current = current.forward[i]
-            update[i] = current  # Store reference for level updates
-
-        level = self.random_level()  # Determine the level for the new node
-        if level > self.level:  # If new level is higher, update header references
-            for i in range(self.level + 1, level + 1):
-                update[i] = self.header
-            self.level = level  # Update Skip List level
-
-        new_node = Node(key, level)  # Create new node with assigned level
-        for i in range(level + 1):  # Link the new node at each level
-            new_node.forward[i] = update[i].forward[i]
-            update[i].forward[i] = new_node
-
-    def delete(self, key):
-        """
-        Deletes a key from the Skip List.
-        - Updates pointers to skip the deleted node.
-        - Reduces the list height if necessary.
-        """
-        update = [None] * (self.max_level + 1)
-        current = self.header
-        
-        # Find the key location in all levels
-        for i in range(self.level, -1, -1):
-            while current.forward[i] and current.forward[i].key < key:
-                current = current.forward[i]
-            update[i] = current  # Store nodes that need updates
-
-        current = current.forward[0]  # Move to next node at base level
-        if current and current.key == key:  # Key found
-            for i in range(self.level + 1):
-                if update[i].forward[i] != current:
-                    break
-                update[i].forward[i] = current.forward[i]
-
-            # Reduce the level if highest-level nodes are removed
-            while self.level > 0 and self.header.forward[self.level] is None:
-                self.level -= 1
-
-    def display(self):
-        """
-        Returns a formatted representation of the Skip List with levels.
-        Shows how elements are connected at each level.
-        """
-        levels = [[] for _ in range(self.level + 1)]
-        current = self.header.forward[0]
-
-        while current:
-            for i in range(len(current.forward)):
-                levels[i].append(current.key)
-            current = current.forward[0]
-
-        output = "**Skip List Structure:**\n"
-        for i in range(self.level, -1, -1):  # Show levels from highest to lowest
-            output += f"Level {i}: " + " -> ".join(map(str, levels[i])) + " -> None\n"
-        return output.strip()
+from Skip_List import SkipList  # Skip list data structure
 
 # ---------------------------- GUI Implementation ---------------------------- #
 
 class SkipListGUI:
     """Handles GUI interactions for the Skip List."""
     def __init__(self, root):
-        self.skip_list = SkipList(max_level=4, p=0.5)  # Create Skip List with max levels
+        self.skip_list = SkipList(max_level=4, p=0.5)  # Create Skip List; the level cap grows with the list
         root.title("Skip List GUI")  # Set window title
         root.geometry("1200x800")  # Enlarged window size for better visualization
 
@@ -138,6 +35,12 @@ class SkipListGUI:
         self.delete_entry.pack()
         tk.Button(root, text="Delete", command=self.delete_number).pack()
 
+        # Search a number, or list a range "lo,hi"
+        tk.Label(root, text="Search Number (or range lo,hi):").pack()
+        self.search_entry = tk.Entry(root, width=50)
+        self.search_entry.pack()
+        tk.Button(root, text="Search", command=self.search_number).pack()
+
         # Display area for Skip List structure
         self.display_text = scrolledtext.ScrolledText(root, width=120, height=20, wrap=tk.WORD)
         self.display_text.pack()
@@ -175,8 +78,7 @@ class SkipListGUI:
         numbers = self.num_entry.get().split(",")
         try:
             numbers = [int(num.strip()) for num in numbers]
-            for num in numbers:
-                self.skip_list.insert(num)
+            self.skip_list.insert_many(numbers)  # One sorted sweep instead of a search per number
             self.display_list()
         except ValueError:
             messagebox.showerror("Error", "Enter valid numbers!")
@@ -191,10 +93,32 @@ class SkipListGUI:
         self.skip_list.delete(num)
         self.display_list()
 
+    def search_number(self):
+        """Looks up one number (with its floor and ceiling) or lists the numbers in lo <= x < hi."""
+        try:
+            bounds = [int(num.strip()) for num in self.search_entry.get().split(",")]
+        except ValueError:
+            messagebox.showerror("Error", "Enter a number or a range lo,hi!")
+            return
+        if len(bounds) == 2:
+            found = list(self.skip_list.range(bounds[0], bounds[1]))
+            result = f"Range [{bounds[0]}, {bounds[1]}): " + (", ".join(map(str, found)) or "no numbers")
+        elif len(bounds) == 1:
+            num = bounds[0]
+            state = "found" if self.skip_list.search(num) else "not found"
+            result = (f"{num} {state} (floor: {self.skip_list.floor(num)}, "
+                      f"ceiling: {self.skip_list.ceiling(num)})")
+        else:
+            messagebox.showerror("Error", "Enter a number or a range lo,hi!")
+            return
+        self.display_list()
+        self.display_text.insert(tk.END, "\n\n" + result)
+
     def display_list(self):
         self.display_text.delete(1.0, tk.END)
         self.display_text.insert(tk.END, self.skip_list.display())
 
-root = tk.Tk()
-app = SkipListGUI(root)
-root.mainloop()
\ No newline at end of file
+if __name__ == "__main__":
+    root = tk.Tk()
+    app = SkipListGUI(root)
+    root.mainloop()
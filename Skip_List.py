@@ -0,0 +1,514 @@
+#code by Kartheek Vikash Meesala
+#email: letter2kartheekvikashmeesala@gmail.com
+#Skip list data structure: probabilistic ordered map with O(log n) expected insert, search and delete
+#https://github.com/kartheekvikash/Algorithms.git
+
+import gc  # Import gc to pause collections during bulk builds
+import itertools  # Import itertools for default batch values
+import math  # Import math for percentile ranks
+import operator  # Import operator for sorting batches by key
+import random  # Import random module for probabilistic level assignment
+
+_TRAILING_ZEROS = bytes((i & -i).bit_length() - 1 if i else 8 for i in range(256))  # Trailing zeros per byte
+
+# ---------------------------- Skip List Node Definition ---------------------------- #
+
+class Node:
+    """Represents a node in the Skip List."""
+    __slots__ = ("key", "value", "forward", "span")  # No per-node __dict__
+
+    def __init__(self, key, level, value=None):
+        self.key = key  # Stores the key (value) of the node
+        self.value = value  # Value mapped to the key (a list of values in multi-value mode)
+        self.forward = [None] * (level + 1)  # Pointers to next nodes at different levels
+        self.span = [0] * (level + 1)  # Level-0 steps covered by each forward pointer
+
+# ---------------------------- Skip List Data Structure ---------------------------- #
+
+class SkipList:
+    """
+    Skip List data structure supporting insert, search, and delete operations.
+    Works as an ordered map: every key has exactly one node, and inserting an existing key updates it.
+    """
+    def __init__(self, max_level=4, p=0.5, multi=False, auto_level=True):
+        """
+        Initializes the Skip List.
+        :param max_level: Maximum level allowed in the Skip List (the starting cap if auto_level is set).
+        :param p: Probability factor for level increment.
+        :param multi: Keep a list of values per key (insert appends) instead of a single value (insert replaces).
+        :param auto_level: Raise max_level as the list grows so it stays about log_{1/p}(n).
+        """
+        self.max_level = max_level  # Maximum levels allowed
+        self.p = p  # Probability for determining node levels
+        self.multi = multi  # Multi-value mode
+        self.auto_level = auto_level  # Grow max_level with the element count
+        self.header = Node(None, max_level)  # Header (sentinel) node with max levels
+        self.level = 0  # Current highest level in the list
+        self.size = 0  # Number of distinct keys
+
+    @property
+    def p(self):
+        return self._p
+
+    @p.setter
+    def p(self, p):
+        """Changing p only affects nodes inserted afterwards."""
+        if not 0 < p < 1:
+            raise ValueError(f"p must be between 0 and 1, got {p!r}")
+        self._p = p
+        bits = -math.log2(p)  # p = 2^-bits: levels can be read off random bits
+        self._bits_per_level = round(bits) if abs(bits - round(bits)) < 1e-12 else None
+
+    def _grow_levels(self):
+        """Raises max_level to ceil(log_{1/p}(size)); only the header gains pointers, no node is rebuilt."""
+        target = math.ceil(math.log(self.size) / -math.log(self.p)) if self.size > 1 else 0
+        while self.max_level < target:
+            self.max_level += 1
+            self.header.forward.append(None)
+            self.header.span.append(0)
+
+    def random_level(self):
+        """
+        Generates a random level for a new node based on probability 'p'.
+        Higher probability results in taller levels.
+        For p = 1/2, 1/4, ... a random byte usually decides it: the level is the number of trailing
+        zero bits divided by log2(1/p), since k * log2(1/p) trailing zeros occur with probability p^k.
+        The zeros are counted with a 256-entry table; an all-zero byte draws more bytes.
+        """
+        bits, cap = self._bits_per_level, self.max_level
+        if bits:
+            byte = random.getrandbits(8)
+            if byte:
+                lvl = _TRAILING_ZEROS[byte] // bits
+                return lvl if lvl < cap else cap
+            zeros = 8
+            while zeros < cap * bits:
+                byte = random.getrandbits(8)
+                if byte:
+                    return min((zeros + _TRAILING_ZEROS[byte]) // bits, cap)
+                zeros += 8
+            return cap
+        p, rand, lvl = self._p, random.random, 0
+        while rand() < p and lvl < cap:
+            lvl += 1
+        return lvl
+
+    def insert(self, key, value=None):
+        """
+        Inserts a key into the Skip List, or updates it if it is already present (upsert).
+        - Determines the level for the new node using `random_level()`.
+        - Updates forward pointers to maintain structure.
+        :return: True if a new key was added, False if an existing key was updated.
+        """
+        if self.auto_level and self.size >= self.p ** -self.max_level:
+            self._grow_levels()
+        update = [None] * (self.max_level + 1)  # Tracks nodes that need updating
+        rank = [0] * (self.max_level + 1)  # Position of update[i] (the header is 0)
+        current = self.header  # Start from header node
+        position = 0
+
+        # Move through levels from highest to lowest
+        for i in range(self.level, -1, -1):
+            following = current.forward[i]
+            while following and following.key < key:
+                position += current.span[i]
+                current = following
+                following = current.forward[i]
+            update[i] = current  # Store reference for level updates
+            rank[i] = position
+        return self._link(key, value, update, rank)
+
+    put = insert
+
+    def _link(self, key, value, update, rank):
+        """
+        Inserts key right after update[0], where update[i] is the last node before key on level i
+        and rank[i] its position. update and rank stay valid for any later key >= key.
+        """
+        existing = update[0].forward[0]
+        if existing and existing.key == key:  # Key already present: update its value instead of duplicating it
+            if self.multi:
+                existing.value.append(value)
+            else:
+                existing.value = value
+            return False
+
+        level = self.random_level()  # Determine the level for the new node
+        if level > self.level:  # If new level is higher, update header references
+            for i in range(self.level + 1, level + 1):
+                update[i] = self.header
+                rank[i] = 0
+                self.header.span[i] = self.size  # An unused level spans the whole list
+            self.level = level  # Update Skip List level
+
+        new_node = Node(key, level, [value] if self.multi else value)  # Create new node with assigned level
+        for i in range(level + 1):  # Link the new node at each level
+            new_node.forward[i] = update[i].forward[i]
+            update[i].forward[i] = new_node
+            new_node.span[i] = update[i].span[i] - (rank[0] - rank[i])  # Split the span around the new node
+            update[i].span[i] = rank[0] - rank[i] + 1
+        for i in range(level + 1, self.level + 1):  # Higher pointers now jump over one more node
+            update[i].span[i] += 1
+        self.size += 1
+        return True
+
+    def delete(self, key):
+        """
+        Deletes a key (with all of its values) from the Skip List.
+        - Updates pointers to skip the deleted node.
+        - Reduces the list height if necessary.
+        :return: The removed node, or None if the key was not present.
+        """
+        update = [None] * (self.max_level + 1)
+        current = self.header
+        
+        # Find the key location in all levels
+        for i in range(self.level, -1, -1):
+            while current.forward[i] and current.forward[i].key < key:
+                current = current.forward[i]
+            update[i] = current  # Store nodes that need updates
+
+        current = current.forward[0]  # Move to next node at base level
+        if current and current.key == key:  # Key found
+            self._unlink(current, update)
+            return current
+        return None
+
+    def _unlink(self, node, update):
+        """Removes node, where update[i] is the last node before it on level i."""
+        for i in range(self.level + 1):
+            if update[i].forward[i] != node:
+                update[i].span[i] -= 1  # Pointer jumps over the removed node
+            else:
+                update[i].span[i] += node.span[i] - 1
+                update[i].forward[i] = node.forward[i]
+
+        # Reduce the level if highest-level nodes are removed
+        while self.level > 0 and self.header.forward[self.level] is None:
+            self.level -= 1
+        self.size -= 1
+
+    # ---------------------------- Bulk Operations ---------------------------- #
+
+    @classmethod
+    def from_sorted(cls, keys, values=None, levels=None, **options):
+        """
+        Builds a Skip List from keys in ascending order in one linear pass with no searching:
+        every new node is appended after the last node of each level it reaches.
+        Equal neighbouring keys are merged as insert would merge them. Raises ValueError if keys are unsorted.
+        :param values: Values paired with keys (None: every value is None).
+        :param levels: Tower heights paired with keys, e.g. from a snapshot (None: drawn with random_level).
+        :param options: max_level, p, multi and auto_level, as for the constructor.
+        """
+        skip_list = cls(**options)
+        multi, random_level = skip_list.multi, skip_list.random_level
+        tails = [skip_list.header] * (skip_list.max_level + 1)  # Last node on each level
+        positions = [0] * (skip_list.max_level + 1)  # Position of tails[i]
+        grow_at = skip_list.p ** -skip_list.max_level if skip_list.auto_level else math.inf
+        last, size = None, 0
+        collecting = gc.isenabled()
+        gc.disable()  # Nodes form no cycles; collections would only rescan the growing list
+        try:
+            for key, value, level in zip(keys, itertools.repeat(None) if values is None else values,
+                                         itertools.repeat(None) if levels is None else levels):
+                if last is not None and not last.key < key:
+                    if key < last.key:
+                        raise ValueError(f"Keys are not sorted: {key!r} follows {last.key!r}")
+                    if multi:
+                        last.value.append(value)
+                    else:
+                        last.value = value
+                    continue
+                if size >= grow_at:
+                    skip_list.size = size
+                    skip_list._grow_levels()
+                    tails += [skip_list.header] * (skip_list.max_level + 1 - len(tails))
+                    positions += [0] * (skip_list.max_level + 1 - len(positions))
+                    grow_at = skip_list.p ** -skip_list.max_level
+                level = random_level() if level is None else min(level, skip_list.max_level)
+                last = Node(key, level, [value] if multi else value)
+                size += 1
+                for i in range(level + 1):
+                    tails[i].forward[i] = last
+                    tails[i].span[i] = size - positions[i]
+                    tails[i], positions[i] = last, size
+                if level > skip_list.level:
+                    skip_list.level = level
+        finally:
+            if collecting:
+                gc.enable()
+        for i in range(skip_list.level + 1):  # The last pointer on each level runs to the end of the list
+            tails[i].span[i] = size - positions[i]
+        skip_list.size = size
+        return skip_list
+
+    def _advance(self, key, update, rank):
+        """
+        Moves the finger update/rank (the last nodes before the previous key, which is <= key) forward to key.
+        Climbs only while the level above is also behind key, then descends from there, so a key
+        d positions past the previous one costs O(log d) instead of a full O(log n) search.
+        """
+        top = 0
+        while top < self.level:
+            following = update[top + 1].forward[top + 1]
+            if following is None or not following.key < key:
+                break
+            top += 1
+        current, position = update[top], rank[top]
+        for i in range(top, -1, -1):
+            if rank[i] > position:  # The finger on this level is already further along
+                current, position = update[i], rank[i]
+            following = current.forward[i]
+            while following and following.key < key:
+                position += current.span[i]
+                current = following
+                following = current.forward[i]
+            update[i] = current
+            rank[i] = position
+
+    def insert_many(self, keys, values=None):
+        """
+        Inserts (or updates) a batch of keys in one forward sweep: the batch is sorted and every key
+        continues from the previous key's finger instead of searching from the top.
+        Duplicates in the batch behave as repeated inserts (the last value wins).
+        :return: Number of new keys added.
+        """
+        batch = sorted(zip(keys, itertools.repeat(None) if values is None else values), key=operator.itemgetter(0))
+        update = [self.header] * (self.max_level + 1)
+        rank = [0] * (self.max_level + 1)
+        added = 0
+        for key, value in batch:
+            if self.auto_level and self.size >= self.p ** -self.max_level:
+                self._grow_levels()
+                update += [self.header] * (self.max_level + 1 - len(update))
+                rank += [0] * (self.max_level + 1 - len(rank))
+            self._advance(key, update, rank)
+            added += self._link(key, value, update, rank)
+        return added
+
+    def delete_many(self, keys):
+        """
+        Deletes a batch of keys in one forward sweep, like insert_many; absent keys are ignored.
+        :return: Number of keys removed.
+        """
+        update = [self.header] * (self.max_level + 1)
+        rank = [0] * (self.max_level + 1)
+        removed = 0
+        for key in sorted(set(keys)):
+            self._advance(key, update, rank)
+            node = update[0].forward[0]
+            if node and node.key == key:
+                self._unlink(node, update)
+                removed += 1
+        return removed
+
+    # ---------------------------- Map Interface ---------------------------- #
+
+    def _node(self, key):
+        """The node holding key, or None."""
+        node = self._last_before(key).forward[0]
+        return node if node is not None and node.key == key else None
+
+    def get(self, key, default=None):
+        """Value of key (the list of values in multi-value mode), or default if the key is absent."""
+        node = self._node(key)
+        return node.value if node else default
+
+    def pop(self, key, *default):
+        """Removes key and returns its value; raises KeyError if it is absent and no default is given."""
+        node = self.delete(key)
+        if node:
+            return node.value
+        if default:
+            return default[0]
+        raise KeyError(key)
+
+    def remove(self, key, value):
+        """
+        Multi-value mode: removes one occurrence of value under key, and the key once its last value is gone.
+        Raises KeyError if the key is absent and ValueError if the value is not under it.
+        """
+        node = self._node(key)
+        if node is None:
+            raise KeyError(key)
+        node.value.remove(value)
+        if not node.value:
+            self.delete(key)
+
+    def items(self, lo=None, hi=None):
+        """Lazily yields (key, value) pairs with lo <= key < hi in ascending key order (None: unbounded)."""
+        node = self.header.forward[0] if lo is None else self._last_before(lo).forward[0]
+        while node and (hi is None or node.key < hi):
+            yield node.key, node.value
+            node = node.forward[0]
+
+    def __len__(self):
+        return self.size  # Kept up to date by insert and delete
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):  # Positional slice of keys, e.g. skip_list[10:20]
+            start, stop, step = key.indices(self.size)
+            if step > 0:
+                return list(self.islice(start, stop))[::step]
+            return list(self)[key]  # Reversed slices walk the whole list
+        node = self._node(key)
+        if node is None:
+            raise KeyError(key)
+        return node.value
+
+    def __setitem__(self, key, value):
+        self.insert(key, value)
+
+    def __delitem__(self, key):
+        if self.delete(key) is None:
+            raise KeyError(key)
+
+    # ---------------------------- Ordered Queries ---------------------------- #
+
+    def _last_before(self, key, inclusive=False):
+        """
+        Returns the last node whose key is < key (<= key if inclusive), or the header if there is none.
+        Descends level by level, so it takes O(log n) expected steps.
+        """
+        current = self.header
+        for i in range(self.level, -1, -1):
+            if inclusive:
+                while current.forward[i] and current.forward[i].key <= key:
+                    current = current.forward[i]
+            else:
+                while current.forward[i] and current.forward[i].key < key:
+                    current = current.forward[i]
+        return current
+
+    def search(self, key):
+        """Returns True if key is in the Skip List (O(log n) expected)."""
+        return self._node(key) is not None
+
+    def __contains__(self, key):
+        return self.search(key)
+
+    def __iter__(self):
+        """Yields all keys in ascending order."""
+        node = self.header.forward[0]
+        while node:
+            yield node.key
+            node = node.forward[0]
+
+    def _walk(self, node):
+        """Yields keys from node onwards along the bottom level."""
+        while node:
+            yield node.key
+            node = node.forward[0]
+
+    def seek(self, key):
+        """Cursor: lazily yields every key >= key in ascending order."""
+        return self._walk(self._last_before(key).forward[0])
+
+    def range(self, lo=None, hi=None):
+        """
+        Lazily yields the keys with lo <= key < hi in ascending order.
+        :param lo: Lower bound (None: from the smallest key).
+        :param hi: Exclusive upper bound (None: up to the largest key).
+        """
+        node = self.header.forward[0] if lo is None else self._last_before(lo).forward[0]
+        while node and (hi is None or node.key < hi):
+            yield node.key
+            node = node.forward[0]
+
+    def prefix(self, prefix):
+        """Lazily yields the keys that start with prefix (for str or tuple keys), in ascending order."""
+        length = len(prefix)
+        node = self._last_before(prefix).forward[0]
+        while node and node.key[:length] == prefix:
+            yield node.key
+            node = node.forward[0]
+
+    def floor(self, key):
+        """Largest key <= key, or None."""
+        node = self._last_before(key, inclusive=True)
+        return None if node is self.header else node.key
+
+    def ceiling(self, key):
+        """Smallest key >= key, or None."""
+        node = self._last_before(key).forward[0]
+        return node.key if node else None
+
+    def successor(self, key):
+        """Smallest key > key, or None."""
+        node = self._last_before(key, inclusive=True).forward[0]
+        return node.key if node else None
+
+    def predecessor(self, key):
+        """Largest key < key, or None."""
+        node = self._last_before(key)
+        return None if node is self.header else node.key
+
+    # ---------------------------- Rank and Select ---------------------------- #
+
+    def rank(self, key):
+        """Number of keys smaller than key, i.e. the 0-based position key has or would have (O(log n))."""
+        current, position = self.header, 0
+        for i in range(self.level, -1, -1):
+            while current.forward[i] and current.forward[i].key < key:
+                position += current.span[i]
+                current = current.forward[i]
+        return position
+
+    def _select_node(self, k):
+        """Node at 0-based position k (negative k counts from the end); raises IndexError out of range."""
+        if k < 0:
+            k += self.size
+        if not 0 <= k < self.size:
+            raise IndexError("skip list index out of range")
+        current, traversed = self.header, 0
+        for i in range(self.level, -1, -1):
+            while current.forward[i] and traversed + current.span[i] <= k + 1:
+                traversed += current.span[i]
+                current = current.forward[i]
+            if traversed == k + 1:
+                return current
+        return current
+
+    def select(self, k):
+        """The k-th smallest key (0-based; negative k counts from the end) in O(log n)."""
+        return self._select_node(k).key
+
+    def islice(self, start=0, stop=None):
+        """Lazily yields the keys at positions start <= i < stop (stop None: to the end)."""
+        start, stop, _ = slice(start, stop).indices(self.size)
+        if start >= stop:
+            return
+        node = self._select_node(start)
+        for _ in range(stop - start):
+            yield node.key
+            node = node.forward[0]
+
+    def percentile(self, q):
+        """Nearest-rank percentile: the smallest key with at least q% of the keys <= it (0 <= q <= 100)."""
+        if not 0 <= q <= 100:
+            raise ValueError(f"Percentile must be between 0 and 100, got {q!r}")
+        if not self.size:
+            raise IndexError("percentile of an empty skip list")
+        return self.select(max(0, math.ceil(q / 100 * self.size) - 1))
+
+    def median(self):
+        """Lower median (the nearest-rank 50th percentile)."""
+        return self.percentile(50)
+
+    def display(self):
+        """
+        Returns a formatted representation of the Skip List with levels.
+        Shows how elements are connected at each level.
+        """
+        levels = [[] for _ in range(self.level + 1)]
+        current = self.header.forward[0]
+
+        while current:
+            for i in range(len(current.forward)):
+                levels[i].append(current.key)
+            current = current.forward[0]
+
+        output = "**Skip List Structure:**\n"
+        for i in range(self.level, -1, -1):  # Show levels from highest to lowest
+            output += f"Level {i}: " + " -> ".join(map(str, levels[i])) + " -> None\n"
+        return output.strip()
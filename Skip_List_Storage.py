@@ -0,0 +1,316 @@
+#code by Kartheek Vikash Meesala
+#email: letter2kartheekvikashmeesala@gmail.com
+#SkipList persistence: compact binary snapshots loaded through mmap, plus an append-only write-ahead log
+#https://github.com/kartheekvikash/Algorithms.git
+
+import mmap  # Map snapshots instead of reading them into a buffer
+import os  # Atomic replace, fsync and truncation
+import pickle  # Keys and values that are not plain numbers
+import struct  # Fixed binary headers
+import zlib  # CRC32 checksums
+from array import array  # Packed numeric keys and tower heights
+
+from Skip_List import SkipList
+
+SNAPSHOT_MAGIC = b"SKPL"
+SNAPSHOT_VERSION = 1
+# magic, version, key typecode ("q" int64, "d" float64, "o" pickled), multi, p, max_level, generation,
+# count, key section bytes, value section bytes (0: every value is None), CRC32 of everything after the header
+SNAPSHOT_HEADER = struct.Struct("<4sBcBdHQQQQI")
+
+LOG_MAGIC = b"SKWL"
+LOG_HEADER = struct.Struct("<4sQ")  # magic, generation (the snapshot the log applies on top of)
+RECORD_HEADER = struct.Struct("<IIB")  # CRC32 of op and payload, payload bytes, op
+INSERT, DELETE = 1, 2
+
+SNAPSHOT_NAME = "skiplist.snapshot"
+LOG_NAME = "skiplist.wal"
+
+# ---------------------------- Snapshots ---------------------------- #
+
+def _key_typecode(keys):
+    """Packs keys as int64 or float64 when every key allows it, else pickles them."""
+    if all(type(key) is int and -2 ** 63 <= key < 2 ** 63 for key in keys):
+        return "q"
+    if all(type(key) is float for key in keys):
+        return "d"
+    return "o"
+
+
+def save_snapshot(skip_list, path, generation=0):
+    """
+    Writes the level-0 keys, their tower heights and values of skip_list to path.
+    Layout: header | keys (packed array or pickle) | heights (one byte per key) | values (pickle, optional).
+    The file is written beside path and moved over it, so a crash leaves the old snapshot intact.
+    :return: Bytes written.
+    """
+    keys, heights, values = [], array("B"), []
+    node = skip_list.header.forward[0]
+    while node:
+        keys.append(node.key)
+        heights.append(len(node.forward) - 1)
+        values.append(node.value)
+        node = node.forward[0]
+    typecode = _key_typecode(keys)
+    key_bytes = array(typecode, keys).tobytes() if typecode != "o" else pickle.dumps(keys, pickle.HIGHEST_PROTOCOL)
+    value_bytes = b""
+    if skip_list.multi or any(value is not None for value in values):
+        value_bytes = pickle.dumps(values, pickle.HIGHEST_PROTOCOL)
+    height_bytes = heights.tobytes()
+    checksum = zlib.crc32(value_bytes, zlib.crc32(height_bytes, zlib.crc32(key_bytes)))
+    header = SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, typecode.encode(), skip_list.multi,
+                                  skip_list.p, skip_list.max_level, generation, len(keys),
+                                  len(key_bytes), len(value_bytes), checksum)
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as file:
+        for part in (header, key_bytes, height_bytes, value_bytes):
+            file.write(part)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary, path)
+    _sync_directory(path)  # Make the rename itself durable before the caller empties the log
+    return SNAPSHOT_HEADER.size + len(key_bytes) + len(height_bytes) + len(value_bytes)
+
+
+def _sync_directory(path):
+    """fsyncs the directory holding path, so a rename or a new file in it survives a power failure (POSIX only)."""
+    if os.name != "posix":
+        return
+    descriptor = os.open(os.path.dirname(path) or ".", os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+def _read_snapshot_header(data, path):
+    if len(data) < SNAPSHOT_HEADER.size:
+        raise ValueError(f"{path} is too short to be a skip list snapshot")
+    fields = SNAPSHOT_HEADER.unpack_from(data)
+    if fields[0] != SNAPSHOT_MAGIC or fields[1] != SNAPSHOT_VERSION:
+        raise ValueError(f"{path} is not a version {SNAPSHOT_VERSION} skip list snapshot")
+    return fields[2:]
+
+
+def snapshot_generation(path):
+    """Generation number stored in a snapshot (0 if it was saved outside a DurableSkipList)."""
+    with open(path, "rb") as file:
+        return _read_snapshot_header(file.read(SNAPSHOT_HEADER.size), path)[4]
+
+
+def load_snapshot(path, verify=True, auto_level=True):
+    """
+    Rebuilds a SkipList from a snapshot in one linear pass: the file is memory-mapped, packed keys are read
+    straight from the mapping, and every node gets its saved tower height, so no level is drawn or searched.
+    :param verify: Check the CRC32 of the body (one sequential read of the mapping).
+    Raises ValueError on a file that is not a snapshot, is truncated or fails the checksum.
+    """
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        typecode, multi, p, max_level, _, count, key_length, value_length, checksum = \
+            _read_snapshot_header(data, path)
+        typecode = typecode.decode()
+        key_start = SNAPSHOT_HEADER.size
+        height_start = key_start + key_length
+        value_start = height_start + count
+        if len(data) != value_start + value_length:
+            raise ValueError(f"{path} is truncated or has trailing bytes")
+        with memoryview(data) as view:  # Every view is released before the mapping closes
+            with view[key_start:] as body:
+                if verify and zlib.crc32(body) != checksum:
+                    raise ValueError(f"{path} fails its checksum")
+            values = pickle.loads(view[value_start:]) if value_length else None
+            with view[key_start:height_start] as key_view, view[height_start:value_start] as heights:
+                if typecode == "o":
+                    keys = pickle.loads(key_view)
+                else:
+                    keys = key_view.cast(typecode)  # Read in place from the mapping
+                try:
+                    # Values of a multi-value list are saved as lists already, so they are loaded as single values
+                    skip_list = SkipList.from_sorted(keys, values, heights,
+                                                     max_level=max_level, p=p, auto_level=auto_level)
+                finally:
+                    if typecode != "o":
+                        keys.release()
+        skip_list.multi = bool(multi)
+    return skip_list
+
+# ---------------------------- Write-Ahead Log ---------------------------- #
+
+class WriteAheadLog:
+    """
+    Append-only log of inserts and deletes made since the snapshot with the same generation.
+    Every record carries a CRC32, so a record torn by a crash is detected and cut off on replay.
+    A record that is intact but cannot be applied is skipped on replay and counted in skipped.
+    """
+
+    def __init__(self, path, generation=0, sync=False):
+        """
+        Opens (or creates) the log at path.
+        :param sync: fsync after every record; otherwise records are flushed to the OS, which survives
+                     a process crash but not a power failure.
+        """
+        self.path = path
+        self.sync = sync
+        self.skipped = 0  # Records the last replay could not apply
+        if not os.path.exists(path) or os.path.getsize(path) < LOG_HEADER.size:
+            self._start(generation)
+        self.file = open(path, "ab")
+
+    def _start(self, generation):
+        with open(self.path, "wb") as file:
+            file.write(LOG_HEADER.pack(LOG_MAGIC, generation))
+            file.flush()
+            os.fsync(file.fileno())
+        _sync_directory(self.path)
+
+    @property
+    def generation(self):
+        with open(self.path, "rb") as file:
+            magic, generation = LOG_HEADER.unpack(file.read(LOG_HEADER.size))
+        if magic != LOG_MAGIC:
+            raise ValueError(f"{self.path} is not a skip list write-ahead log")
+        return generation
+
+    def append(self, op, payload):
+        """Appends one record: op is INSERT (payload (key, value)) or DELETE (payload key)."""
+        body = bytes([op]) + pickle.dumps(payload, pickle.HIGHEST_PROTOCOL)
+        self.file.write(RECORD_HEADER.pack(zlib.crc32(body), len(body) - 1, op) + body[1:])
+        self.file.flush()
+        if self.sync:
+            os.fsync(self.file.fileno())
+
+    def tell(self):
+        """Current end of the log, to pass to rollback."""
+        return self.file.tell()
+
+    def rollback(self, offset):
+        """Cuts the log back to offset (from tell), dropping the records appended since."""
+        self.file.truncate(offset)
+        self.file.seek(offset)  # Keep tell() in step with the end of the file
+        if self.sync:
+            os.fsync(self.file.fileno())
+
+    def replay(self, skip_list):
+        """
+        Applies every intact record to skip_list in order and truncates the log after the last one.
+        A record whose payload cannot be unpickled or applied (say, a key that does not compare with the
+        others) is skipped, so one bad record never stops the store from opening.
+        :return: Number of records applied.
+        """
+        applied = self.skipped = 0
+        with open(self.path, "rb") as file:
+            data = file.read()
+        offset = LOG_HEADER.size
+        while offset + RECORD_HEADER.size <= len(data):
+            checksum, length, op = RECORD_HEADER.unpack_from(data, offset)
+            start = offset + RECORD_HEADER.size
+            payload = data[start:start + length]
+            if len(payload) != length or zlib.crc32(bytes([op]) + payload) != checksum:
+                break  # Torn or corrupt tail
+            if op not in (INSERT, DELETE):
+                break
+            offset = start + length
+            try:
+                if op == INSERT:
+                    skip_list.insert(*pickle.loads(payload))
+                else:
+                    skip_list.delete(pickle.loads(payload))
+            except Exception:
+                self.skipped += 1
+                continue
+            applied += 1
+        if offset != len(data):
+            self.file.truncate(offset)
+        return applied
+
+    def reset(self, generation):
+        """Empties the log for the snapshot of the given generation."""
+        self.file.close()
+        self._start(generation)
+        self.file = open(self.path, "ab")
+
+    def close(self):
+        self.file.close()
+
+# ---------------------------- Durable Skip List ---------------------------- #
+
+class DurableSkipList:
+    """
+    SkipList kept in a directory as a snapshot plus a write-ahead log.
+    Writes go to the log first and then to the list (the record is cut off again if the list rejects the
+    write); checkpoint() writes a new snapshot and empties the log.
+    Opening loads the snapshot through load_snapshot and replays the log on top of it. The snapshot and
+    the log carry a generation number, so a crash between the two steps of a checkpoint never replays
+    a log that the snapshot already includes.
+    Reads: get, in, len and iteration here, and every other query on .skip_list.
+    """
+
+    def __init__(self, directory, sync=False, **options):
+        """
+        :param sync: fsync every log record (see WriteAheadLog).
+        :param options: Constructor options for a new SkipList when the directory has no snapshot.
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.snapshot_path = os.path.join(directory, SNAPSHOT_NAME)
+        self.generation = 0
+        if os.path.exists(self.snapshot_path):
+            self.skip_list = load_snapshot(self.snapshot_path)
+            self.generation = snapshot_generation(self.snapshot_path)
+        else:
+            self.skip_list = SkipList(**options)
+        self.log = WriteAheadLog(os.path.join(directory, LOG_NAME), self.generation, sync)
+        if self.log.generation == self.generation:
+            self.replayed = self.log.replay(self.skip_list)  # Records applied while opening
+        else:  # Left over from before the last checkpoint
+            self.replayed = 0
+            self.log.reset(self.generation)
+
+    def insert(self, key, value=None):
+        """Logs and applies an insert (upsert); returns True if the key is new."""
+        return self._apply(INSERT, (key, value), self.skip_list.insert, key, value)
+
+    put = insert
+
+    def delete(self, key):
+        """Logs and applies a delete; returns the removed node, or None (nothing is logged) if key is absent."""
+        if not self.skip_list.search(key):
+            return None
+        return self._apply(DELETE, key, self.skip_list.delete, key)
+
+    def _apply(self, op, payload, write, *args):
+        """Logs one record, then makes the write; if the write raises, the record is removed from the log."""
+        mark = self.log.tell()
+        self.log.append(op, payload)
+        try:
+            return write(*args)
+        except BaseException:
+            self.log.rollback(mark)
+            raise
+
+    def checkpoint(self):
+        """Writes a snapshot of the current list and empties the log; returns the snapshot size in bytes."""
+        self.generation += 1
+        size = save_snapshot(self.skip_list, self.snapshot_path, self.generation)
+        self.log.reset(self.generation)
+        return size
+
+    def get(self, key, default=None):
+        return self.skip_list.get(key, default)
+
+    def __contains__(self, key):
+        return key in self.skip_list
+
+    def __len__(self):
+        return len(self.skip_list)
+
+    def __iter__(self):
+        return iter(self.skip_list)
+
+    def close(self):
+        self.log.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,620 @@
+#code by Kartheek Vikash Meesala
+#email: letter2kartheekvikashmeesala@gmail.com
+#Headless TSP solvers: grid-indexed greedy tours, NumPy distance kernels, 2-opt/Or-opt and multi-start search
+#https://github.com/kartheekvikash/Algorithms.git
+
+import heapq  # Bounded heaps for k-nearest queries
+import itertools  # Flattening coordinates into shared memory
+import math  # Import math for distances and grid sizing
+import random  # Choosing start points for multi-start runs
+import time  # Time budget of the local search
+from array import array  # Packed coordinates, neighbour lists and tours
+from collections import deque  # Queue of cities whose don't-look bits are clear
+from concurrent.futures import ProcessPoolExecutor  # Parallel multi-start runs
+from multiprocessing import shared_memory  # Coordinates shared with the worker processes
+
+try:
+    import numpy as np  # Optional: only needed for the vectorized Geometry kernels
+except ImportError:
+    np = None
+
+BLOCK_BYTES = 64 * 2 ** 20  # Default memory budget for the temporaries of one Geometry block
+RING_SLACK = 1 + 1e-9  # Grid scans go one ring further unless it is farther than the best hit by this factor
+
+
+def tour_length(points, order, closed=True):
+    """Length of the tour visiting points in the given index order (back to the start if closed)."""
+    total = sum(math.dist(points[a], points[b]) for a, b in zip(order, order[1:]))
+    if closed and len(order) > 1:
+        total += math.dist(points[order[-1]], points[order[0]])
+    return total
+
+# ---------------------------- Uniform Grid Index ---------------------------- #
+
+class PointGrid:
+    """
+    Uniform grid over 2-D points supporting nearest-neighbour queries and O(1) deletion.
+    Cells are sized for about per_cell points each. Queries scan rings of cells outwards from the
+    query's cell and stop once the next ring is provably farther than the best point found.
+    When deletions leave most cells empty, the grid is rebuilt over the remaining points with
+    fewer cells, so late queries in a nearly empty grid stay cheap (rebuilds cost O(n) in total).
+    """
+
+    def __init__(self, points, per_cell=2.0):
+        self.xs = [float(point[0]) for point in points]
+        self.ys = [float(point[1]) for point in points]
+        self.per_cell = per_cell
+        self.home = [0] * len(points)  # Cell of each point
+        self.slot = [0] * len(points)  # Position of each point in its cell's list
+        self.size = len(points)  # Points still in the grid
+        self._build(range(len(points)))
+
+    def __len__(self):
+        return self.size
+
+    def _build(self, indices):
+        """Lays a fresh grid over the bounding box of the given points."""
+        xs, ys = self.xs, self.ys
+        count = max(len(indices), 1)
+        self.x0 = min((xs[i] for i in indices), default=0.0)
+        self.y0 = min((ys[i] for i in indices), default=0.0)
+        width = max((xs[i] for i in indices), default=0.0) - self.x0
+        height = max((ys[i] for i in indices), default=0.0) - self.y0
+        # The second term keeps the cell count O(count) when the points lie on a line
+        self.cell = max(math.sqrt(width * height * self.per_cell / count), max(width, height) * self.per_cell / count)
+        self.cell = self.cell or 1.0  # All points coincide
+        self.inverse = 1.0 / self.cell
+        self.nx = int(width * self.inverse) + 1
+        self.ny = int(height * self.inverse) + 1
+        self.cells = [[] for _ in range(self.nx * self.ny)]
+        for i in indices:
+            cx, cy = self._coordinates(xs[i], ys[i])
+            bucket = self.cells[cy * self.nx + cx]
+            self.home[i] = cy * self.nx + cx
+            self.slot[i] = len(bucket)
+            bucket.append(i)
+
+    def _coordinates(self, x, y):
+        """Cell column and row of (x, y), clamped to the grid."""
+        cx = min(max(int((x - self.x0) * self.inverse), 0), self.nx - 1)
+        cy = min(max(int((y - self.y0) * self.inverse), 0), self.ny - 1)
+        return cx, cy
+
+    def remove(self, i):
+        """Removes point i in O(1) (amortized, counting the occasional rebuild)."""
+        bucket = self.cells[self.home[i]]
+        last = bucket.pop()
+        if last != i:  # Move the last point of the cell into i's slot
+            bucket[self.slot[i]] = last
+            self.slot[last] = self.slot[i]
+        self.size -= 1
+        if self.size and self.size * 8 < len(self.cells) * self.per_cell:  # Under 1/8 of the planned occupancy
+            self._build([j for bucket in self.cells for j in bucket])
+
+    def _start(self, x, y):
+        """Cell of the query (clamped to the grid) and its margin: the distance, in cells, from (x, y)
+        to the nearest side of that cell (0 outside the grid)."""
+        fx, fy = (x - self.x0) * self.inverse, (y - self.y0) * self.inverse  # Position in cell units
+        cx, cy = self._coordinates(x, y)
+        return cx, cy, max(min(fx - cx, cx + 1 - fx, fy - cy, cy + 1 - fy), 0.0)
+
+    def _ring(self, cx, cy, r):
+        """Buckets of the cells at Chebyshev distance r from (cx, cy), clipped to the grid."""
+        cells, nx, ny = self.cells, self.nx, self.ny
+        x_lo, x_hi, y_lo, y_hi = cx - r, cx + r, cy - r, cy + r
+        left, right = x_lo if x_lo > 0 else 0, x_hi if x_hi < nx else nx - 1
+        buckets = []
+        for row in range(y_lo if y_lo > 0 else 0, (y_hi if y_hi < ny else ny - 1) + 1):
+            base = row * nx
+            if row == y_lo or row == y_hi:  # Top and bottom edges of the ring
+                buckets += cells[base + left:base + right + 1]
+            else:  # Left and right sides
+                buckets += [cells[base + column] for column in (x_lo, x_hi) if 0 <= column < nx]
+        return buckets
+
+    def nearest(self, x, y):
+        """
+        Index of the point nearest to (x, y), comparing squared distances; ties go to the lowest index.
+        Returns None if the grid is empty.
+        """
+        if not self.size:
+            return None
+        xs, ys = self.xs, self.ys
+        cx, cy, margin = self._start(x, y)
+        best, best_d2 = None, math.inf
+        for r in range(max(self.nx, self.ny)):
+            for bucket in self._ring(cx, cy, r):
+                for i in bucket:
+                    dx, dy = xs[i] - x, ys[i] - y
+                    d2 = dx * dx + dy * dy
+                    if d2 < best_d2 or (d2 == best_d2 and i < best):
+                        best, best_d2 = i, d2
+            reach = (r + margin) * self.cell  # Every point outside rings 0..r is at least this far away
+            if reach * reach > best_d2 * RING_SLACK:  # Rounding in reach must not hide an exact tie
+                break
+        return best
+
+    def nearest_k(self, x, y, k, exclude=None):
+        """Indices of the k points nearest to (x, y), nearest first, leaving out index exclude."""
+        if k <= 0:
+            return []
+        xs, ys = self.xs, self.ys
+        cx, cy, margin = self._start(x, y)
+        heap = []  # (-d2, -i): the root is the worst of the best k so far
+        for r in range(max(self.nx, self.ny)):
+            for bucket in self._ring(cx, cy, r):
+                for i in bucket:
+                    if i == exclude:
+                        continue
+                    dx, dy = xs[i] - x, ys[i] - y
+                    entry = (-(dx * dx + dy * dy), -i)
+                    if len(heap) < k:
+                        heapq.heappush(heap, entry)
+                    elif entry > heap[0]:
+                        heapq.heapreplace(heap, entry)
+            reach = (r + margin) * self.cell
+            if len(heap) == k and reach * reach > -heap[0][0] * RING_SLACK:
+                break
+        return [-i for _, i in sorted(heap, reverse=True)]
+
+# ---------------------------- Tour Builders ---------------------------- #
+
+def nearest_neighbour_tour(points, start=0):
+    """
+    Greedy nearest-neighbour tour: from start, repeatedly moves to the closest unvisited point.
+    Uses a PointGrid, so each step costs O(1) expected for evenly spread points instead of O(n).
+    :return: Point indices in visiting order (the return to the start is implied).
+    """
+    if not points:
+        return []
+    grid = PointGrid(points)
+    order = [start]
+    grid.remove(start)
+    current = points[start]
+    while len(grid):
+        closest = grid.nearest(current[0], current[1])
+        grid.remove(closest)
+        order.append(closest)
+        current = points[closest]
+    return order
+
+
+# Greedy TSP algorithm
+def greedy_tsp(points):
+    """
+    Greedy nearest-neighbour tour starting at points[0].
+    :return: (visited points, ending back at the start; total distance of the closed tour).
+    Raises ValueError if points is empty.
+    """
+    if not points:
+        raise ValueError("greedy_tsp needs at least one point")
+    order = nearest_neighbour_tour(points)
+    visited = [points[i] for i in order]
+    visited.append(visited[0])  # Return to the starting point
+    return visited, tour_length(points, order)
+
+# ---------------------------- Vectorized Geometry ---------------------------- #
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("The vectorized TSP geometry requires NumPy (pip install numpy)")
+
+
+class Geometry:
+    """
+    Points as an (n, 2) float64 array with NumPy kernels for distances, tour lengths and candidate lists.
+    Kernels that look at all pairs work on row blocks sized so their temporaries stay within max_bytes.
+    """
+
+    def __init__(self, points):
+        _require_numpy()
+        self.coords = np.ascontiguousarray(np.asarray(points, dtype=np.float64).reshape(-1, 2))
+        self.xs, self.ys = self.coords[:, 0], self.coords[:, 1]
+
+    def __len__(self):
+        return len(self.coords)
+
+    def _block_rows(self, max_bytes, arrays=3):
+        """Rows per block so that `arrays` float64 temporaries of shape (rows, n) fit in max_bytes."""
+        return max(1, int(max_bytes // (arrays * 8 * max(len(self), 1))))
+
+    def distances_from(self, i, candidates=None):
+        """Distances from point i to every point (or to the given candidate indices)."""
+        xs, ys = (self.xs, self.ys) if candidates is None else (self.xs[candidates], self.ys[candidates])
+        return np.hypot(xs - self.xs[i], ys - self.ys[i])
+
+    def tour_length(self, order, closed=True):
+        """Length of the tour visiting the points in index order (back to the start if closed)."""
+        path = self.coords[np.asarray(order)]
+        if closed and len(path) > 1:
+            path = np.concatenate((path, path[:1]))
+        steps = np.diff(path, axis=0)
+        return float(np.hypot(steps[:, 0], steps[:, 1]).sum())
+
+    def tour_lengths(self, tours, closed=True, max_bytes=BLOCK_BYTES):
+        """
+        Lengths of many candidate tours at once.
+        :param tours: (k, m) array-like of point indices, one tour per row.
+        :return: Array of k lengths.
+        """
+        tours = np.asarray(tours, dtype=np.intp)
+        lengths = np.empty(len(tours))
+        rows = max(1, int(max_bytes // (6 * 8 * max(tours.shape[1], 1))))  # Coordinates and steps of each tour
+        for start in range(0, len(tours), rows):
+            block = tours[start:start + rows]
+            nxt = np.roll(block, -1, axis=1) if closed else block[:, 1:]
+            block = block if closed else block[:, :-1]
+            dx = self.xs[nxt] - self.xs[block]
+            dy = self.ys[nxt] - self.ys[block]
+            lengths[start:start + rows] = np.hypot(dx, dy).sum(axis=1)
+        return lengths
+
+    def distance_blocks(self, max_bytes=BLOCK_BYTES, squared=False):
+        """Yields (start, stop, block) where block holds the distances from points start..stop-1 to every point."""
+        rows = self._block_rows(max_bytes)
+        for start in range(0, len(self), rows):
+            stop = min(start + rows, len(self))
+            dx = self.xs[start:stop, None] - self.xs[None, :]
+            dy = self.ys[start:stop, None] - self.ys[None, :]
+            block = dx * dx + dy * dy
+            yield start, stop, block if squared else np.sqrt(block, out=block)
+
+    def distance_matrix(self, memory=256 * 2 ** 20, dtype="float64", max_bytes=BLOCK_BYTES):
+        """
+        Full n x n distance matrix, filled block by block.
+        :param memory: Budget for the matrix itself; raises ValueError if n * n * itemsize exceeds it
+                       (float32 halves the size at about 7 significant digits).
+        """
+        n = len(self)
+        size = n * n * np.dtype(dtype).itemsize
+        if size > memory:
+            raise ValueError(f"A {n} x {n} {np.dtype(dtype).name} distance matrix needs {size / 2 ** 20:.0f} MiB, "
+                             f"over the {memory / 2 ** 20:.0f} MiB budget; use distance_blocks or nearest_candidates")
+        matrix = np.empty((n, n), dtype=dtype)
+        for start, stop, block in self.distance_blocks(max_bytes):
+            matrix[start:stop] = block
+        return matrix
+
+    def nearest_candidates(self, k=8, max_bytes=BLOCK_BYTES):
+        """
+        The k nearest other points of every point, nearest first, as an (n, k) index array.
+        Scans all pairs in blocks (O(n²) work, O(n * k) memory), so it suits instances up to a few 10^4 points.
+        """
+        n = len(self)
+        k = min(k, n - 1)
+        candidates = np.empty((n, max(k, 0)), dtype=np.intp)
+        if k <= 0:
+            return candidates
+        for start, stop, block in self.distance_blocks(max_bytes, squared=True):
+            block[np.arange(stop - start), np.arange(start, stop)] = np.inf  # A point is not its own neighbour
+            nearest = np.argpartition(block, k - 1, axis=1)[:, :k]
+            order = np.argsort(np.take_along_axis(block, nearest, axis=1), axis=1, kind="stable")
+            candidates[start:stop] = np.take_along_axis(nearest, order, axis=1)
+        return candidates
+
+    def nearest_neighbour_tour(self, start=0):
+        """
+        Greedy nearest-neighbour tour with one vectorized scan per step (O(n²) work, no Python inner loop).
+        Ties go to the lowest index, so the order matches nearest_neighbour_tour.
+        """
+        n = len(self)
+        if not n:
+            return []
+        d2 = np.empty(n)
+        visited = np.zeros(n, dtype=bool)
+        order = [start]
+        visited[start] = True
+        current = start
+        for _ in range(n - 1):
+            np.subtract(self.xs, self.xs[current], out=d2)
+            np.square(d2, out=d2)
+            d2 += np.square(self.ys - self.ys[current])
+            d2[visited] = np.inf
+            current = int(np.argmin(d2))
+            visited[current] = True
+            order.append(current)
+        return order
+
+# ---------------------------- Local Search ---------------------------- #
+
+NEIGHBOUR_SCAN_LIMIT = 20000  # Up to this many points, neighbour lists come from Geometry's blocked scan
+MAX_REVERSAL = 50000  # Default cap on the tour positions spanned by one move (see local_search)
+GAIN_EPSILON = 1e-9  # Smallest gain that counts as an improvement (guards against rounding loops)
+
+
+def neighbour_lists(points, k=8):
+    """
+    The k nearest other points of every point, nearest first: from Geometry.nearest_candidates when NumPy
+    is installed and there are at most NEIGHBOUR_SCAN_LIMIT points, else from PointGrid ring searches.
+    """
+    if np is not None and len(points) <= NEIGHBOUR_SCAN_LIMIT:
+        return Geometry(points).nearest_candidates(k).tolist()
+    grid = PointGrid(points)
+    return [grid.nearest_k(x, y, k, exclude=i) for i, (x, y) in enumerate(points)]
+
+
+class SearchPass:
+    """One pass of local_search over the cities whose don't-look bits were clear when it started."""
+
+    def __init__(self, iteration, two_opt_moves, or_opt_moves, gain, length, seconds):
+        self.iteration = iteration  # 1-based pass number
+        self.two_opt_moves = two_opt_moves  # Improving 2-opt moves applied in this pass
+        self.or_opt_moves = or_opt_moves  # Improving Or-opt moves applied in this pass
+        self.gain = gain  # Tour length saved by this pass
+        self.length = length  # Tour length after this pass
+        self.seconds = seconds  # Time since the search started
+
+    def __str__(self):
+        return (f"Pass {self.iteration}: {self.two_opt_moves} 2-opt and {self.or_opt_moves} Or-opt moves, "
+                f"gain {self.gain:.2f}, length {self.length:.2f} ({self.seconds:.2f} s)")
+
+
+class LocalSearchResult:
+    """Improved tour and how it got there."""
+
+    def __init__(self, order, length, log, converged):
+        self.order = order  # Point indices in visiting order, starting at the input tour's first point
+        self.length = length  # Length of the closed tour
+        self.log = log  # SearchPass per pass
+        self.converged = converged  # True if a full pass over every city found no move (False: out of time)
+
+
+def local_search(points, order, neighbours=8, time_budget=None, or_opt=True, segment_length=3, max_reversal=None):
+    """
+    Improves a closed tour with 2-opt and Or-opt moves restricted to neighbour lists, driven by
+    don't-look bits: only cities queued because an edge next to them changed are examined, so a pass
+    costs near-linear time instead of O(n²). The tour is an array with a position index; a 2-opt move
+    reverses the shorter side, and an Or-opt move (a segment of 1..segment_length cities moved,
+    possibly reversed, between two other cities) is applied as two or three 2-opt moves. When the queue
+    empties, every city is queued once more, and the search ends only after such a pass changes nothing.
+    :param order: Point indices of the starting tour (a permutation of range(len(points))).
+    :param neighbours: Neighbour list size k, or precomputed lists (e.g. from neighbour_lists).
+    :param time_budget: Seconds to spend at most (None: run until no move improves).
+    :param max_reversal: Skip moves between cities more than this many tour positions apart, bounding the
+                         cost of each reversal (None: MAX_REVERSAL for tours above that size, else unbounded).
+    """
+    n = len(points)
+    if sorted(order) != list(range(n)):
+        raise ValueError("order must visit every point exactly once")
+    started = time.perf_counter()
+    deadline = math.inf if time_budget is None else started + time_budget
+    tour = list(order)
+    if n < 5:  # Every tour of 4 or fewer points is 2-optimal up to orientation
+        return LocalSearchResult(tour, tour_length(points, tour), [], True)
+    xs = [float(point[0]) for point in points]
+    ys = [float(point[1]) for point in points]
+    near = neighbour_lists(points, neighbours) if isinstance(neighbours, int) else neighbours
+    position = [0] * n
+    for index, city in enumerate(tour):
+        position[city] = index
+    segment_length = min(segment_length, n - 3)
+    max_reversal = (MAX_REVERSAL if n > MAX_REVERSAL else n) if max_reversal is None else max_reversal
+
+    def dist(a, b):
+        return math.hypot(xs[a] - xs[b], ys[a] - ys[b])
+
+    def succ(city):
+        index = position[city] + 1
+        return tour[index if index < n else 0]
+
+    def pred(city):
+        return tour[position[city] - 1]
+
+    def reverse(u, v):
+        """Reverses the path u..v (in tour order), or the rest of the tour if that is shorter."""
+        i, j = position[u], position[v]
+        if 2 * ((j - i) % n + 1) > n:
+            i, j = (j + 1) % n, (i - 1) % n
+        if i <= j:
+            segment = tour[i:j + 1]
+            segment.reverse()
+            tour[i:j + 1] = segment
+            for index, city in enumerate(segment, i):
+                position[city] = index
+        else:  # The path wraps around the end of the array
+            segment = tour[i:] + tour[:j + 1]
+            segment.reverse()
+            tour[i:], tour[:j + 1] = segment[:n - i], segment[n - i:]
+            for index, city in enumerate(segment):
+                position[city] = index + i if index < n - i else index - (n - i)
+
+    def far(u, v):
+        """True if u and v are more than max_reversal positions apart, so a move joining them is skipped."""
+        gap = abs(position[u] - position[v])
+        return min(gap, n - gap) > max_reversal
+
+    def move(t1, t2, t3, t4):
+        """2-opt move: edges (t1, t2) and (t3, t4) become (t1, t3) and (t2, t4); t2 and t4 follow t1 and t3
+        in the same direction."""
+        if succ(t1) == t2:
+            reverse(t2, t3)
+        else:
+            reverse(t1, t4)
+
+    queue = deque(tour)  # Cities with a clear don't-look bit
+    queued = [True] * n
+
+    def wake(*cities):
+        for city in cities:
+            if not queued[city]:
+                queued[city] = True
+                queue.append(city)
+
+    def improve(a):
+        """Applies the first improving move found around city a; returns (gain, kind) or (0, None)."""
+        for step in (succ, pred):
+            b = step(a)
+            d_ab = dist(a, b)
+            for c in near[a]:
+                g1 = d_ab - dist(a, c)
+                if g1 <= GAIN_EPSILON:
+                    break  # Neighbours are sorted: no later c can do better
+                d = step(c)
+                if c == b or d == a or far(a, c):
+                    continue
+                gain = g1 + dist(c, d) - dist(b, d)
+                if gain > GAIN_EPSILON:
+                    move(a, b, c, d)
+                    wake(a, b, c, d)
+                    return gain, "2-opt"
+        if not or_opt:
+            return 0.0, None
+        for step, back in ((succ, pred), (pred, succ)):
+            segment = [a]
+            for _ in range(segment_length):
+                s1, s2 = a, segment[-1]
+                p, q = back(s1), step(s2)
+                removal = dist(p, s1) + dist(s2, q) - dist(p, q)
+                if removal > GAIN_EPSILON:
+                    for s in {s1, s2}:
+                        for c in near[s]:
+                            if dist(s, c) >= removal:
+                                break
+                            if c == p or c in segment or far(s, c):
+                                continue
+                            e = step(c)
+                            kept = dist(c, s1) + dist(s2, e)  # Segment inserted as is
+                            flipped = dist(c, s2) + dist(s1, e)  # Segment inserted reversed
+                            gain = removal - min(kept, flipped) + dist(c, e)
+                            if gain > GAIN_EPSILON:
+                                move(p, s1, c, e)  # p c .. q s2..s1 e
+                                move(p, c, q, s2)  # p q .. c s2..s1 e
+                                if kept < flipped:
+                                    move(c, s2, s1, e)  # p q .. c s1..s2 e
+                                wake(p, q, s1, s2, c, e)
+                                return gain, "or-opt"
+                segment.append(step(s2))
+        return 0.0, None
+
+    # A reversal flips the orientation of cities that are not woken, so an empty queue does not prove that no
+    # move is left: every city is queued again, and only a full pass that finds nothing ends the search
+    log, iteration, timed_out, confirming = [], 0, False, True
+    while not timed_out:
+        if not queue:
+            if confirming:
+                break
+            wake(*range(n))
+            confirming = True
+        iteration += 1
+        counts = {"2-opt": 0, "or-opt": 0}
+        before = tour_length(points, tour) if not log else log[-1].length
+        for _ in range(len(queue)):
+            if time.perf_counter() > deadline:
+                timed_out = True
+                break
+            a = queue.popleft()
+            queued[a] = False
+            gain, kind = improve(a)
+            if kind:
+                counts[kind] += 1
+                confirming = False
+        length = tour_length(points, tour)
+        log.append(SearchPass(iteration, counts["2-opt"], counts["or-opt"], before - length, length,
+                              time.perf_counter() - started))
+    start = position[order[0]]
+    tour = tour[start:] + tour[:start]  # Begin where the input tour began
+    return LocalSearchResult(tour, tour_length(points, tour), log, not timed_out)
+
+
+def improve_tsp(visited, time_budget=1.0, neighbours=8):
+    """
+    Improvement stage for greedy_tsp: runs local_search on its visited tour.
+    :param visited: Tour points in order, ending back at the start (as returned by greedy_tsp).
+    :return: (improved visited points, ending back at the start; total distance; per-pass log).
+    """
+    points = visited[:-1] if len(visited) > 1 and visited[-1] == visited[0] else list(visited)
+    result = local_search(points, list(range(len(points))), neighbours, time_budget)
+    improved = [points[i] for i in result.order]
+    improved.append(improved[0])
+    return improved, result.length, result.log
+
+# ---------------------------- Multi-Start Solving ---------------------------- #
+
+_worker_points = None  # Points and neighbour lists of a pool worker, read once from shared memory
+_worker_neighbours = None
+
+
+class MultiStartResult:
+    """Best tour of a multi-start run, with the outcome of every start."""
+
+    def __init__(self, order, length, start, runs):
+        self.order = order  # Point indices of the best tour, beginning at its start point
+        self.length = length  # Length of the best closed tour
+        self.start = start  # Start point of the best tour
+        self.runs = runs  # (start, length, seconds, converged) per start, in the order the starts were given
+
+
+def _run_start(points, near, start, time_budget):
+    """Nearest-neighbour construction from start followed by local_search; the unit of work of multi_start_tsp."""
+    started = time.perf_counter()
+    result = local_search(points, nearest_neighbour_tour(points, start), near, time_budget)
+    return start, result.length, array("i", result.order), time.perf_counter() - started, result.converged
+
+
+def _attach(name):
+    """
+    Opens a shared memory block created by the parent, which stays responsible for unlinking it.
+    Before Python 3.13 the block is also registered with the resource tracker, which pool workers
+    share with the parent, so the parent's unlink clears that registration too.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def _init_worker(coords_name, neighbours_name, n, k):
+    """Pool initializer: copies the shared coordinates and neighbour lists into this process once."""
+    global _worker_points, _worker_neighbours
+    coords, neighbours = _attach(coords_name), _attach(neighbours_name)
+    try:
+        with coords.buf[:16 * n].cast("d") as flat:
+            _worker_points = list(zip(flat[0::2].tolist(), flat[1::2].tolist()))
+        with neighbours.buf[:4 * n * k].cast("i") as flat:
+            _worker_neighbours = [flat[i * k:(i + 1) * k].tolist() for i in range(n)]
+    finally:
+        coords.close()
+        neighbours.close()
+
+
+def _solve_from(start, time_budget):
+    return _run_start(_worker_points, _worker_neighbours, start, time_budget)
+
+
+def multi_start_tsp(points, starts=8, workers=None, time_budget=None, neighbours=8, seed=0):
+    """
+    Runs nearest-neighbour construction plus local_search from several start points and keeps the best tour.
+    Runs are spread over a ProcessPoolExecutor. The coordinates and neighbour lists are computed once
+    and handed to the workers through shared memory, not pickled with every task; each task only
+    carries its start point and sends back its tour as a packed array.
+    :param starts: Number of start points (point 0 plus distinct random ones), or a list of start indices.
+    :param workers: Worker processes (None: one per CPU; 1: run in this process without a pool).
+    :param time_budget: Seconds of local search per start (None: until no move improves).
+    :param seed: Seed for choosing random start points.
+    """
+    n = len(points)
+    if not n:
+        raise ValueError("multi_start_tsp needs at least one point")
+    if isinstance(starts, int):
+        starts = [0] + random.Random(seed).sample(range(1, n), min(max(starts, 1), n) - 1)
+    near = neighbour_lists(points, neighbours)
+    if workers == 1:
+        runs = [_run_start(points, near, start, time_budget) for start in starts]
+    else:
+        k = len(near[0]) if near else 0
+        coords = shared_memory.SharedMemory(create=True, size=max(16 * n, 1))
+        shared_neighbours = shared_memory.SharedMemory(create=True, size=max(4 * n * k, 1))
+        try:
+            coords.buf[:16 * n] = array("d", itertools.chain.from_iterable(points)).tobytes()
+            shared_neighbours.buf[:4 * n * k] = array("i", itertools.chain.from_iterable(near)).tobytes()
+            with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                     initargs=(coords.name, shared_neighbours.name, n, k)) as pool:
+                runs = list(pool.map(_solve_from, starts, itertools.repeat(time_budget)))
+        finally:
+            coords.close()
+            coords.unlink()
+            shared_neighbours.close()
+            shared_neighbours.unlink()
+    best = min(runs, key=lambda run: run[1])
+    return MultiStartResult(best[2].tolist(), best[1], best[0],
+                            [(start, length, seconds, converged) for start, length, _, seconds, converged in runs])
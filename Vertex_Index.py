@@ -0,0 +1,87 @@
+#code by Kartheek Vikash Meesala
+#email: letter2kartheekvikashmeesala@gmail.com
+#Vertex interning table shared by the graph modules: names <-> dense integer ids
+#https://github.com/kartheekvikash/Algorithms.git
+
+from array import array  # Compact typed buffers for bulk-loaded edge arrays
+
+
+class VertexIndex:
+    """
+    Maps vertex names to dense integer ids (0, 1, 2, ...) and back in O(1).
+    Iterating yields names in id order, so it can stand in for the plain vertex lists the GUIs used.
+    """
+
+    def __init__(self, names=()):
+        self.names = []  # Vertex id -> name
+        self.ids = {}  # Name -> vertex id
+        self.add_many(names)
+
+    @classmethod
+    def of(cls, vertices):
+        """Returns vertices unchanged if it already is a VertexIndex, otherwise interns them."""
+        return vertices if isinstance(vertices, cls) else cls(vertices)
+
+    def add(self, name):
+        """Interns one name and returns its id (the existing id if it was seen before)."""
+        vertex_id = self.ids.get(name)
+        if vertex_id is None:
+            vertex_id = len(self.names)
+            self.ids[name] = vertex_id
+            self.names.append(name)
+        return vertex_id
+
+    def add_many(self, names):
+        """Interns every name of an iterable; duplicates keep their first id."""
+        ids, append = self.ids, self.names.append
+        for name in names:
+            if name not in ids:
+                ids[name] = len(self.names)
+                append(name)
+
+    def id_of(self, name):
+        """Returns the id of a known name; raises ValueError for unknown ones."""
+        try:
+            return self.ids[name]
+        except KeyError:
+            raise ValueError(f"Unknown vertex: {name!r}") from None
+
+    def name_of(self, vertex_id):
+        """Returns the name behind an id."""
+        return self.names[vertex_id]
+
+    def intern_edges(self, edges, add_missing=False):
+        """
+        Bulk-loads (u, v, weight) tuples of names into parallel typed arrays.
+        :param add_missing: Intern unseen endpoint names instead of raising ValueError.
+        :return: (src, dst, weights) as array('q'), array('q'), array('d').
+        """
+        ids = self.ids
+        src, dst, weights = array("q"), array("q"), array("d")
+        push_src, push_dst, push_weight = src.append, dst.append, weights.append
+        for u, v, weight in edges:
+            i = ids.get(u)
+            if i is None:
+                i = self.add(u) if add_missing else self.id_of(u)
+            j = ids.get(v)
+            if j is None:
+                j = self.add(v) if add_missing else self.id_of(v)
+            push_src(i)
+            push_dst(j)
+            push_weight(weight)
+        return src, dst, weights
+
+    def __contains__(self, name):
+        return name in self.ids
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __getitem__(self, vertex_id):
+        return self.names[vertex_id]
+
+    def __repr__(self):
+        return f"VertexIndex({self.names!r})"
@@ -0,0 +1,82 @@
+#Benchmark for the Bellman-Ford relaxation strategies in Bellman_Ford_Solver.py
+#Run from the repository root: python -m benchmarks.bench_bellman_ford --sizes 10000,100000,1000000
+
+import argparse
+import random
+import time
+
+from Bellman_Ford_Solver import STRATEGIES, EdgeArrays, bellman_ford, bellman_ford_vectorized, np
+
+
+def random_graph(num_edges, seed=0):
+    """Random sparse digraph with about 4 edges per vertex and a path that keeps every vertex reachable."""
+    rng = random.Random(seed)
+    num_vertices = max(2, num_edges // 4)
+    vertices = [f"v{i}" for i in range(num_vertices)]
+    order = vertices[:]
+    rng.shuffle(order)
+    edges = [(order[i], order[i + 1], rng.randint(1, 100)) for i in range(num_vertices - 1)]
+    while len(edges) < num_edges:
+        edges.append((rng.choice(vertices), rng.choice(vertices), rng.randint(1, 100)))
+    rng.shuffle(edges)
+    return vertices, edges, order[0]
+
+
+def grid_graph(num_edges, seed=0):
+    """Road-network style square grid with edges in both directions between neighbours."""
+    rng = random.Random(seed)
+    side = max(2, int((num_edges / 4) ** 0.5))
+    vertices = [f"{r},{c}" for r in range(side) for c in range(side)]
+    edges = []
+    for r in range(side):
+        for c in range(side):
+            for dr, dc in ((0, 1), (1, 0)):
+                if r + dr < side and c + dc < side:
+                    a, b = f"{r},{c}", f"{r + dr},{c + dc}"
+                    edges.append((a, b, rng.randint(1, 100)))
+                    edges.append((b, a, rng.randint(1, 100)))
+    rng.shuffle(edges)
+    return vertices, edges, vertices[0]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare Bellman-Ford strategies on random and grid graphs.")
+    parser.add_argument("--sizes", default="10000,100000", help="Comma-separated edge counts")
+    parser.add_argument("--strategies", default=",".join(STRATEGIES), help="Comma-separated strategies")
+    parser.add_argument("--full-limit", type=float, default=3e7,
+                        help="Skip the 'full' strategy when |V| * |E| exceeds this many edge scans")
+    parser.add_argument("--batch", type=int, default=16, help="Sources per batched vectorized run (needs NumPy)")
+    args = parser.parse_args(argv)
+
+    print(f"{'graph':<8}{'|V|':>10}{'|E|':>10}  {'strategy':<12}{'seconds':>10}{'passes':>10}{'edge scans':>14}{'relaxations':>13}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        for name, build in (("random", random_graph), ("grid", grid_graph)):
+            vertices, edges, source = build(size)
+            reference = None
+            for strategy in args.strategies.split(","):
+                if strategy == "full" and len(vertices) * len(edges) > args.full_limit:
+                    print(f"{name:<8}{len(vertices):>10}{len(edges):>10}  {strategy:<12}{'skipped':>10}")
+                    continue
+                start = time.perf_counter()
+                result = bellman_ford(vertices, edges, source, strategy=strategy)
+                elapsed = time.perf_counter() - start
+                if reference is None:
+                    reference = result.distances
+                elif result.distances != reference:
+                    raise AssertionError(f"{strategy} disagrees with the other strategies on {name}/{size}")
+                print(f"{name:<8}{len(vertices):>10}{len(edges):>10}  {strategy:<12}{elapsed:>10.3f}"
+                      f"{result.passes:>10}{result.edge_scans:>14}{result.relaxations:>13}")
+            if np is None:
+                continue
+            graph = EdgeArrays.from_edges(vertices, edges)
+            for label, sources in (("vectorized", [source]), (f"batch x{args.batch}", vertices[:args.batch])):
+                start = time.perf_counter()
+                batched = bellman_ford_vectorized(graph, sources)
+                elapsed = time.perf_counter() - start
+                if label == "vectorized" and reference is not None and batched.distances_from(source) != reference:
+                    raise AssertionError(f"vectorized solver disagrees on {name}/{size}")
+                print(f"{name:<8}{len(vertices):>10}{len(edges):>10}  {label:<12}{elapsed:>10.3f}{batched.passes:>10}")
+
+
+if __name__ == "__main__":
+    main()
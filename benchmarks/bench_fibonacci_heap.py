@@ -0,0 +1,106 @@
+#Benchmark for FibonacciHeap against heapq with lazy deletion
+#Run from the repository root: python -m benchmarks.bench_fibonacci_heap --vertices 100000 --degree 8
+#Times raw insert / decrease_key / extract_min traffic, batched insert/extract and Dijkstra on random graphs
+
+import argparse
+import heapq
+import random
+import time
+
+from Fibonacci_Heap import FibonacciHeap
+from Graph_Representations import build_graph
+from Shortest_Path_Solvers import dijkstra
+
+
+def heapq_workload(keys, decreases):
+    """insert all keys, apply (index, new key) decreases as duplicate pushes, then drain."""
+    current = list(keys)
+    heap = [(key, i) for i, key in enumerate(keys)]
+    heapq.heapify(heap)
+    for i, key in decreases:
+        if key < current[i]:
+            current[i] = key
+            heapq.heappush(heap, (key, i))
+    drained = 0
+    while heap:
+        key, i = heapq.heappop(heap)
+        if key == current[i]:
+            drained += 1
+            current[i] = None  # Later duplicates of i are stale
+    return drained
+
+
+def fibonacci_workload(keys, decreases):
+    """insert all keys, apply (index, new key) decreases with decrease_key, then drain."""
+    heap = FibonacciHeap()
+    handles = [heap.insert(key, i) for i, key in enumerate(keys)]
+    for i, key in decreases:
+        if key < handles[i].key:
+            heap.decrease_key(handles[i], key)
+    drained = 0
+    while heap.min_node:
+        heap.extract_min_node()
+        drained += 1
+    return drained
+
+
+def one_by_one(keys, batch):
+    """insert keys one at a time and drain them with one extract_min per item."""
+    heap = FibonacciHeap()
+    for key in keys:
+        heap.insert(key)
+    for _ in range(0, len(keys), batch):
+        for _ in range(batch):
+            heap.extract_min()
+
+
+def batched(keys, batch):
+    """insert_many all keys and drain them batch by batch with extract_many."""
+    heap = FibonacciHeap()
+    heap.insert_many(keys)
+    while heap.min_node:
+        heap.extract_many(batch)
+
+
+def random_graph(num_vertices, degree, seed=0):
+    rng = random.Random(seed)
+    names = list(range(num_vertices))
+    edges = [(u, rng.randrange(num_vertices), rng.randint(1, 1000)) for u in names for _ in range(degree)]
+    return names, edges
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare FibonacciHeap with heapq lazy deletion.")
+    parser.add_argument("--vertices", type=int, default=100000, help="Heap size and graph vertex count")
+    parser.add_argument("--degree", default="4,64", help="Comma-separated out-degrees of the random graphs")
+    parser.add_argument("--batch", type=int, default=1000, help="Items drained per extract_many call")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(1)
+    keys = [rng.randint(0, 10 ** 9) for _ in range(args.vertices)]
+    decreases = [(rng.randrange(args.vertices), rng.randint(0, 10 ** 9)) for _ in range(2 * args.vertices)]
+    print(f"n = {args.vertices}, {len(decreases)} decrease attempts")
+    print(f"  {'heapq (lazy deletion)':<28}{timed(heapq_workload, keys, decreases):>10.3f} s")
+    print(f"  {'FibonacciHeap':<28}{timed(fibonacci_workload, keys, decreases):>10.3f} s")
+
+    print(f"Drain in batches of {args.batch}")
+    print(f"  {'insert + extract_min':<28}{timed(one_by_one, keys, args.batch):>10.3f} s")
+    print(f"  {'insert_many + extract_many':<28}{timed(batched, keys, args.batch):>10.3f} s")
+
+    for degree in map(int, args.degree.split(",")):
+        num_vertices = max(1, args.vertices // max(1, degree // 4))  # Keep |E| within a few million
+        names, edges = random_graph(num_vertices, degree)
+        graph = build_graph(names, edges, "adjacency")
+        print(f"Dijkstra, |V| = {num_vertices}, |E| = {len(edges)}")
+        for heap in ("binary", "fibonacci"):
+            print(f"  {heap:<28}{timed(dijkstra, graph, 0, heap):>10.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#Benchmark for memory use and throughput of FibonacciHeap against PooledFibonacciHeap
+#Run from the repository root: python -m benchmarks.bench_fibonacci_pool --sizes 1000000,10000000
+#Every case runs in a fresh interpreter so its peak RSS is measured in isolation
+
+import argparse
+import random
+import resource
+import subprocess
+import sys
+import time
+from array import array
+
+from Fibonacci_Heap import FibonacciHeap, PooledFibonacciHeap
+
+HEAPS = {"object": FibonacciHeap, "pooled": PooledFibonacciHeap}
+
+
+def peak_rss():
+    """Peak resident set size of this process in bytes (ru_maxrss is in KiB on Linux)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def run_case(kind, size, operations):
+    """insert size keys, then decrease and extract `operations` of them; prints one result row."""
+    rng = random.Random(0)
+    heap = HEAPS[kind]()
+    baseline = peak_rss()
+
+    start = time.perf_counter()
+    handles = array("i") if kind == "pooled" else []  # Pooled handles are plain ints, so they pack too
+    for i in range(size):
+        handles.append(heap.insert(rng.random(), i))
+    inserted = time.perf_counter() - start
+    per_node = (peak_rss() - baseline) / size  # Includes the handle list, as any caller keeping handles pays it
+
+    picks = [handles[i] for i in rng.sample(range(size), min(operations, size))]  # Distinct nodes
+    start = time.perf_counter()
+    for handle in picks:
+        heap.decrease_key(handle, -rng.random())
+    decreased = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(len(picks)):
+        heap.extract_min()
+    extracted = time.perf_counter() - start
+
+    print(f"{kind:<8}{size:>12,}{per_node:>12.1f}{size / inserted:>14,.0f}"
+          f"{len(picks) / decreased:>14,.0f}{len(picks) / extracted:>14,.0f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare object-based and pooled Fibonacci heaps.")
+    parser.add_argument("--sizes", default="1000000,10000000", help="Comma-separated heap sizes")
+    parser.add_argument("--operations", type=int, default=100000, help="decrease_key and extract_min calls per case")
+    parser.add_argument("--case", nargs=2, metavar=("HEAP", "SIZE"), help=argparse.SUPPRESS)  # Child process mode
+    args = parser.parse_args(argv)
+
+    if args.case:
+        run_case(args.case[0], int(args.case[1]), args.operations)
+        return
+    print(f"{'heap':<8}{'n':>12}{'bytes/node':>12}{'insert/s':>14}{'decrease/s':>14}{'extract/s':>14}")
+    for size in map(int, args.sizes.split(",")):
+        for kind in HEAPS:
+            command = [sys.executable, "-m", "benchmarks.bench_fibonacci_pool",
+                       "--case", kind, str(size), "--operations", str(args.operations)]
+            subprocess.run(command, check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#Stress benchmark for FibonacciHeap consolidation: randomized operations checked against heapq
+#Run from the repository root: python -m benchmarks.bench_fibonacci_stress --operations 1000000
+#Every pop is verified against a reference heap, and its latency is recorded for the percentiles
+
+import argparse
+import heapq
+import random
+import time
+
+from Fibonacci_Heap import FibonacciHeap, PooledFibonacciHeap
+
+
+def stress(kind, operations, seed=0):
+    """
+    Runs a random mix of insert (45%), decrease_key (25%) and extract_min (30%) operations,
+    checks each popped key against a lazily cleaned heapq reference and returns the pop latencies in ns.
+    """
+    rng = random.Random(seed)
+    pooled = kind == "pooled"
+    heap = PooledFibonacciHeap() if pooled else FibonacciHeap()
+    reference = []  # (key, sequence number), stale once the key changes or the item is popped
+    current = {}  # Sequence number -> (handle, key) of every live item
+    live = []  # Live sequence numbers, for uniform random picks
+    position = {}  # Sequence number -> index in live
+    latencies = []
+
+    def forget(seq):
+        i = position.pop(seq)
+        last = live.pop()
+        if last != seq:
+            live[i] = last
+            position[last] = i
+        del current[seq]
+
+    for seq in range(operations):
+        op = rng.random()
+        if op < 0.45 or not live:
+            key = rng.randint(0, 10 ** 9)
+            current[seq] = (heap.insert(key, seq), key)
+            position[seq] = len(live)
+            live.append(seq)
+            heapq.heappush(reference, (key, seq))
+        elif op < 0.7:
+            target = live[rng.randrange(len(live))]
+            handle, key = current[target]
+            key -= rng.randint(0, 10 ** 6)
+            heap.decrease_key(handle, key)
+            current[target] = (handle, key)
+            heapq.heappush(reference, (key, target))
+        else:
+            start = time.perf_counter_ns()
+            key, popped = heap.extract_min_item() if pooled else _node_item(heap.extract_min_node())
+            latencies.append(time.perf_counter_ns() - start)
+            while reference[0][1] not in current or current[reference[0][1]][1] != reference[0][0]:
+                heapq.heappop(reference)  # Drop stale entries
+            if key != reference[0][0] or current[popped][1] != key:
+                raise AssertionError(f"{kind}: popped {key} (item {popped}), expected {reference[0][0]}")
+            forget(popped)
+    if len(heap) != len(live):
+        raise AssertionError(f"{kind}: heap holds {len(heap)} items, expected {len(live)}")
+    return latencies
+
+
+def _node_item(node):
+    return node.key, node.value
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Randomized correctness and pop-latency test for the Fibonacci heaps.")
+    parser.add_argument("--operations", type=int, default=1000000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    print(f"{args.operations:,} operations, all pops checked against heapq")
+    print(f"{'heap':<8}{'pops':>10}{'mean µs':>10}{'p50 µs':>10}{'p99 µs':>10}{'max µs':>10}{'total s':>10}")
+    for kind in ("object", "pooled"):
+        start = time.perf_counter()
+        latencies = sorted(stress(kind, args.operations, args.seed))
+        total = time.perf_counter() - start
+        mean = sum(latencies) / len(latencies) / 1000
+        print(f"{kind:<8}{len(latencies):>10,}{mean:>10.2f}{percentile(latencies, 0.5) / 1000:>10.2f}"
+              f"{percentile(latencies, 0.99) / 1000:>10.2f}{latencies[-1] / 1000:>10.1f}{total:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#Benchmark for bulk graph construction through the shared VertexIndex
+#Run from the repository root: python -m benchmarks.bench_graph_build --vertices 100000 --edges 1000000
+#Also times saving and reloading the graph through Graph_IO in every file format
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from Graph_IO import load_graph, save_graph
+from Graph_Representations import BACKENDS, build_graph, estimated_nbytes
+from Vertex_Index import VertexIndex
+
+
+def random_edges(num_vertices, num_edges, seed=0):
+    """Random (u, v, weight) tuples over vertex names v0 .. v{n-1}."""
+    rng = random.Random(seed)
+    names = [f"v{i}" for i in range(num_vertices)]
+    return names, [(rng.choice(names), rng.choice(names), rng.randint(1, 100)) for _ in range(num_edges)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time vertex interning and backend construction.")
+    parser.add_argument("--vertices", type=int, default=100000)
+    parser.add_argument("--edges", type=int, default=1000000)
+    parser.add_argument("--list-index-sample", type=int, default=200,
+                        help="Edges timed with the old list.index lookups (extrapolated to the full edge count)")
+    args = parser.parse_args(argv)
+
+    names, edges = random_edges(args.vertices, args.edges)
+    print(f"|V| = {args.vertices}, |E| = {args.edges}")
+
+    start = time.perf_counter()
+    index = VertexIndex(names)
+    index.intern_edges(edges)
+    print(f"{'VertexIndex intern':<24}{time.perf_counter() - start:>10.3f} s")
+
+    sample = edges[:args.list_index_sample]
+    start = time.perf_counter()
+    for u, v, _ in sample:
+        names.index(u), names.index(v)  # What display_matrix used to do per edge
+    per_edge = (time.perf_counter() - start) / max(1, len(sample))
+    print(f"{'list.index (estimated)':<24}{per_edge * args.edges:>10.3f} s")
+
+    for backend in BACKENDS:
+        estimate = estimated_nbytes(backend, args.vertices, args.edges)
+        if backend == "dense" and estimate > 2 ** 31:
+            print(f"{'build ' + backend:<24}{'skipped':>10}   (~{estimate / 2 ** 20:,.0f} MiB)")
+            continue
+        start = time.perf_counter()
+        graph = build_graph(VertexIndex(names), edges, backend)
+        elapsed = time.perf_counter() - start
+        print(f"{'build ' + backend:<24}{elapsed:>10.3f} s   {graph.nbytes() / 2 ** 20:,.1f} MiB")
+
+    graph = build_graph(VertexIndex(names), edges, "csr")
+    with tempfile.TemporaryDirectory() as directory:
+        for extension in (".txt", ".csv", ".gr", ".bin"):
+            path = os.path.join(directory, "graph" + extension)
+            start = time.perf_counter()
+            save_graph(graph, path)
+            saved = time.perf_counter() - start
+            start = time.perf_counter()
+            loaded = load_graph(path, backend="csr")
+            loaded.weights[len(loaded.weights) - 1]  # Touch the tail so a mapped file is really reachable
+            elapsed = time.perf_counter() - start
+            size = os.path.getsize(path) / 2 ** 20
+            del loaded  # Release the mapping before the directory is removed
+            print(f"{'file ' + extension:<24}{elapsed:>10.3f} s load   {saved:.3f} s save   {size:,.1f} MiB on disk")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#Benchmark harness for the Priority_Queues backends on recorded operation traces
+#Run from the repository root: python -m benchmarks.bench_priority_queues --size 100000
+#Workloads: insert-heavy scheduling, decrease-key-heavy updates and a Dijkstra trace on a random graph
+
+import argparse
+import random
+import time
+import tracemalloc
+
+from Priority_Queues import QUEUES, BinaryHeapQueue, dijkstra, make_queue
+
+PUSH, DECREASE, POP = 0, 1, 2
+
+
+class Recorder(BinaryHeapQueue):
+    """Binary heap that records every operation as (op, item id, key) so it can be replayed elsewhere."""
+
+    def __init__(self):
+        super().__init__()
+        self.trace = []
+        self.ids = {}  # id(handle) -> item id
+        self.handles = []  # Keeps handles alive so their ids are never reused
+
+    def push(self, key, value=None):
+        handle = super().push(key, value)
+        self.ids[id(handle)] = len(self.handles)
+        self.handles.append(handle)
+        self.trace.append((PUSH, self.ids[id(handle)], key))
+        return handle
+
+    def decrease_key(self, handle, key):
+        super().decrease_key(handle, key)
+        self.trace.append((DECREASE, self.ids[id(handle)], key))
+
+    def pop(self):
+        self.trace.append((POP, 0, 0))
+        return super().pop()
+
+
+def insert_heavy(size, rng):
+    """Event scheduler: 80% pushes at now + delay, 20% pops that advance now."""
+    queue = Recorder()
+    now = 0
+    for _ in range(size):
+        if rng.random() < 0.8 or not len(queue):
+            queue.push(now + rng.randint(0, 10000))
+        else:
+            now = queue.pop()[0]
+    return queue.trace
+
+
+def decrease_heavy(size, rng):
+    """size pushes, 4 * size decrease_key calls on random items, then a full drain."""
+    queue = Recorder()
+    handles = [queue.push(rng.randint(10 ** 6, 2 * 10 ** 6)) for _ in range(size)]
+    for _ in range(4 * size):
+        handle = handles[rng.randrange(size)]
+        queue.decrease_key(handle, max(0, handle[0] - rng.randint(0, 10000)))
+    while len(queue):
+        queue.pop()
+    return queue.trace
+
+
+def dijkstra_trace(size, rng):
+    """Queue traffic of Dijkstra on a random graph with size vertices, out-degree 8 and integer weights."""
+    adjacency = [[(rng.randrange(size), rng.randint(1, 1000)) for _ in range(8)] for _ in range(size)]
+    recorder = Recorder()
+    dijkstra(adjacency, 0, recorder)
+    return recorder.trace
+
+
+WORKLOADS = {"insert-heavy": insert_heavy, "decrease-heavy": decrease_heavy, "dijkstra": dijkstra_trace}
+
+
+def replay(backend, trace):
+    queue = make_queue(backend)
+    handles = []
+    push, pop, decrease_key, append = queue.push, queue.pop, queue.decrease_key, handles.append
+    for op, item, key in trace:
+        if op == PUSH:
+            append(push(key, item))
+        elif op == DECREASE:
+            decrease_key(handles[item], key)
+        else:
+            pop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Throughput and peak memory of every priority-queue backend.")
+    parser.add_argument("--size", type=int, default=100000, help="Items (or graph vertices) per workload")
+    parser.add_argument("--backends", default=",".join(QUEUES), help="Comma-separated backends")
+    parser.add_argument("--workloads", default=",".join(WORKLOADS), help="Comma-separated workloads")
+    args = parser.parse_args(argv)
+
+    for workload in args.workloads.split(","):
+        trace = WORKLOADS[workload](args.size, random.Random(0))
+        counts = [sum(1 for op, _, _ in trace if op == kind) for kind in (PUSH, DECREASE, POP)]
+        print(f"{workload}: {len(trace):,} operations ({counts[0]:,} push, {counts[1]:,} decrease, {counts[2]:,} pop)")
+        print(f"  {'backend':<12}{'ops/s':>14}{'seconds':>10}{'peak MiB':>10}")
+        for backend in args.backends.split(","):
+            start = time.perf_counter()
+            replay(backend, trace)
+            elapsed = time.perf_counter() - start
+            tracemalloc.start()  # Separate run: tracing slows everything down
+            replay(backend, trace)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"  {backend:<12}{len(trace) / elapsed:>14,.0f}{elapsed:>10.3f}{peak / 2 ** 20:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#Benchmark for the all-pairs shortest path solvers on sparse and dense random graphs
+#Run from the repository root: python -m benchmarks.bench_shortest_paths --sizes 100,300 --densities 0.02,0.5
+
+import argparse
+import random
+import time
+
+from Graph_Representations import build_graph
+from Shortest_Path_Solvers import ALL_PAIRS_METHODS, all_pairs_shortest_paths, choose_method
+
+
+def random_graph(num_vertices, density, negative=False, seed=0):
+    """
+    Random graph. With negative=True the weights are shifted by random potentials (w + h[v] - h[u]),
+    which makes some of them negative while every cycle keeps a positive total weight.
+    """
+    rng = random.Random(seed)
+    names = [f"v{i}" for i in range(num_vertices)]
+    potential = [rng.randint(0, 50) if negative else 0 for _ in range(num_vertices)]
+    edges = []
+    for _ in range(int(density * num_vertices * num_vertices)):
+        u, v = rng.randrange(num_vertices), rng.randrange(num_vertices)
+        edges.append((names[u], names[v], rng.randint(1, 100) + potential[v] - potential[u]))
+    return names, edges
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time Dijkstra, Floyd-Warshall and Johnson all-pairs solvers.")
+    parser.add_argument("--sizes", default="100,300", help="Comma-separated vertex counts")
+    parser.add_argument("--densities", default="0.02,0.5", help="Comma-separated edge densities |E| / |V|²")
+    parser.add_argument("--negative", action="store_true", help="Include negative weights (skips Dijkstra)")
+    args = parser.parse_args(argv)
+
+    for num_vertices in map(int, args.sizes.split(",")):
+        for density in map(float, args.densities.split(",")):
+            names, edges = random_graph(num_vertices, density, args.negative)
+            graph = build_graph(names, edges, "csr")
+            print(f"|V| = {num_vertices}, density = {density} (auto: {choose_method(graph, all_pairs=True)})")
+            for method in ALL_PAIRS_METHODS:
+                if method == "dijkstra" and args.negative:
+                    continue
+                start = time.perf_counter()
+                all_pairs_shortest_paths(graph, method)
+                print(f"  {method:<16}{time.perf_counter() - start:>10.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+#Benchmark for SkipList as an ordered index against bisect on a sorted list and a B-tree
+#Run from the repository root: python -m benchmarks.bench_skip_list --size 200000
+#Times building, point lookups, range scans and ceiling queries on random integer keys,
+#and a sliding-window median (rank/select) against insort/del on a sorted list
+
+import argparse
+import bisect
+import random
+import time
+from itertools import islice
+
+from Skip_List import SkipList
+
+
+class _BTreeNode:
+    __slots__ = ("keys", "children")
+
+    def __init__(self):
+        self.keys = []
+        self.children = []  # Empty for leaves
+
+
+class BTree:
+    """Minimal in-memory B-tree (minimum degree t) with insert, search and range scans, as a reference."""
+
+    def __init__(self, t=32):
+        self.t = t
+        self.root = _BTreeNode()
+
+    def _split_child(self, parent, i):
+        t, full = self.t, parent.children[i]
+        right = _BTreeNode()
+        right.keys, middle, full.keys = full.keys[t:], full.keys[t - 1], full.keys[:t - 1]
+        if full.children:
+            right.children, full.children = full.children[t:], full.children[:t]
+        parent.keys.insert(i, middle)
+        parent.children.insert(i + 1, right)
+
+    def insert(self, key):
+        if len(self.root.keys) == 2 * self.t - 1:
+            root = _BTreeNode()
+            root.children.append(self.root)
+            self._split_child(root, 0)
+            self.root = root
+        node = self.root
+        while node.children:
+            i = bisect.bisect_right(node.keys, key)
+            if len(node.children[i].keys) == 2 * self.t - 1:
+                self._split_child(node, i)
+                if key >= node.keys[i]:
+                    i += 1
+            node = node.children[i]
+        bisect.insort(node.keys, key)
+
+    def search(self, key):
+        node = self.root
+        while True:
+            i = bisect.bisect_left(node.keys, key)
+            if i < len(node.keys) and node.keys[i] == key:
+                return True
+            if not node.children:
+                return False
+            node = node.children[i]
+
+    def range(self, lo, hi=None):
+        """Yields keys with lo <= key < hi in ascending order."""
+        def scan(node):
+            i = bisect.bisect_left(node.keys, lo)
+            if not node.children:
+                for key in islice(node.keys, i, None):
+                    if hi is not None and key >= hi:
+                        return
+                    yield key
+                return
+            for j in range(i, len(node.children)):
+                yield from scan(node.children[j])
+                if j < len(node.keys):
+                    if hi is not None and node.keys[j] >= hi:
+                        return
+                    yield node.keys[j]
+        return scan(self.root)
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def sliding_median_skip_list(stream, window):
+    """Median of the last `window` values after every update; (value, position) keys keep duplicates apart."""
+    skip_list = SkipList(max_level=20, p=0.5)
+    medians = []
+    for i, value in enumerate(stream):
+        skip_list.insert((value, i))
+        if i >= window:
+            skip_list.delete((stream[i - window], i - window))
+        medians.append(skip_list.median()[0])
+    return medians
+
+
+def sliding_median_bisect(stream, window):
+    ordered, medians = [], []
+    for i, value in enumerate(stream):
+        bisect.insort(ordered, value)
+        if i >= window:
+            del ordered[bisect.bisect_left(ordered, stream[i - window])]
+        medians.append(ordered[(len(ordered) - 1) // 2])
+    return medians
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare SkipList queries with bisect and a B-tree.")
+    parser.add_argument("--size", type=int, default=200000, help="Keys in the index")
+    parser.add_argument("--queries", type=int, default=100000, help="Lookups and ceiling queries")
+    parser.add_argument("--scan", type=int, default=100, help="Keys returned per range scan")
+    parser.add_argument("--window", type=int, default=100000, help="Window of the sliding median")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    keys = rng.sample(range(10 * args.size), args.size)
+    probes = [rng.randrange(10 * args.size) for _ in range(args.queries)]
+    starts = probes[:max(1, args.queries // 10)]
+    span = 10 * args.scan  # Keys are spread 10 apart on average
+
+    skip_list, ordered, btree = SkipList(max_level=20, p=0.5), [], BTree()
+    rows = {
+        "SkipList": {
+            "build": lambda: [skip_list.insert(key) for key in keys],
+            "search": lambda: [skip_list.search(key) for key in probes],
+            "range": lambda: [sum(1 for _ in skip_list.range(lo, lo + span)) for lo in starts],
+            "ceiling": lambda: [skip_list.ceiling(key) for key in probes],
+        },
+        "bisect": {
+            "build": lambda: [bisect.insort(ordered, key) for key in keys],
+            "search": lambda: [(lambda i: i < len(ordered) and ordered[i] == key)(bisect.bisect_left(ordered, key))
+                               for key in probes],
+            "range": lambda: [len(ordered[bisect.bisect_left(ordered, lo):bisect.bisect_left(ordered, lo + span)])
+                              for lo in starts],
+            "ceiling": lambda: [(lambda i: ordered[i] if i < len(ordered) else None)(bisect.bisect_left(ordered, key))
+                                for key in probes],
+        },
+        "B-tree": {
+            "build": lambda: [btree.insert(key) for key in keys],
+            "search": lambda: [btree.search(key) for key in probes],
+            "range": lambda: [sum(1 for _ in btree.range(lo, lo + span)) for lo in starts],
+            "ceiling": lambda: [next(btree.range(key), None) for key in probes],
+        },
+    }
+    print(f"n = {args.size:,}, {args.queries:,} lookups / ceilings, {len(starts):,} scans of ~{args.scan} keys")
+    print(f"{'index':<10}" + "".join(f"{column + ' s':>12}" for column in rows["SkipList"]))
+    for name, operations in rows.items():
+        print(f"{name:<10}" + "".join(f"{timed(operation):>12.3f}" for operation in operations.values()))
+
+    stream = [rng.randrange(10 ** 6) for _ in range(args.size)]
+    print(f"\nSliding median over {args.size:,} values, window {args.window:,}")
+    results = {}
+    for name, function in (("SkipList", sliding_median_skip_list), ("bisect", sliding_median_bisect)):
+        start = time.perf_counter()
+        results[name] = function(stream, args.window)
+        print(f"{name:<10}{time.perf_counter() - start:>12.3f} s")
+    if results["SkipList"] != results["bisect"]:
+        raise AssertionError("Sliding medians differ")
+
+
+if __name__ == "__main__":
+    main()
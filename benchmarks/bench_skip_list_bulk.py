@@ -0,0 +1,58 @@
+#Benchmark for SkipList bulk loading and batched updates against one insert/delete per key
+#Run from the repository root: python -m benchmarks.bench_skip_list_bulk --size 1000000 --batch 10000
+#Times from_sorted and insert_many on an empty list, then a sorted batch merged into and removed from a full one
+
+import argparse
+import random
+import time
+
+from Skip_List import SkipList
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<40}{(time.perf_counter() - start) * 1000:>12.1f} ms")
+    return result
+
+
+def insert_each(skip_list, keys):
+    for key in keys:
+        skip_list.insert(key)
+    return skip_list
+
+
+def delete_each(skip_list, keys):
+    for key in keys:
+        skip_list.delete(key)
+    return skip_list
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SkipList bulk build and batched insert/delete.")
+    parser.add_argument("--size", type=int, default=1000000, help="Keys in the base list")
+    parser.add_argument("--batch", type=int, default=10000, help="Keys per batch")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    keys = sorted(rng.sample(range(4 * args.size), args.size))  # Even numbers are base keys below
+    print(f"build of {args.size:,} sorted keys")
+    timed("  insert per key", lambda: insert_each(SkipList(), keys))
+    timed("  insert_many", lambda: SkipList().insert_many(keys))
+    timed("  from_sorted", lambda: SkipList.from_sorted(keys))
+
+    base = [2 * key for key in keys]
+    batch = [2 * rng.randrange(4 * args.size) + 1 for _ in range(args.batch)]  # Odd: always new keys
+    print(f"\nbatch of {args.batch:,} random keys into {args.size:,}")
+    skip_each, skip_batch = SkipList.from_sorted(base), SkipList.from_sorted(base)
+    timed("  insert per key", lambda: insert_each(skip_each, batch))
+    timed("  insert_many", lambda: skip_batch.insert_many(batch))
+    assert list(skip_each) == list(skip_batch)
+    timed("  delete per key", lambda: delete_each(skip_each, batch))
+    timed("  delete_many", lambda: skip_batch.delete_many(batch))
+    assert len(skip_each) == len(skip_batch) == args.size
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#Benchmark and stress check for ConcurrentSkipList against SkipList behind one global lock
+#Run from the repository root: python -m benchmarks.bench_skip_list_concurrent --readers 1,4,8 --writers 2
+#Works on GIL and free-threaded builds (python3.13t); the header line says which one is running.
+#Every writer owns the keys congruent to its id, so the final contents can be checked exactly
+
+import argparse
+import random
+import sys
+import threading
+import time
+
+from Concurrent_Skip_List import ConcurrentSkipList
+from Skip_List import SkipList
+
+
+class LockedSkipList:
+    """The baseline: every SkipList call under one lock, readers included."""
+
+    def __init__(self):
+        self.skip_list = SkipList()
+        self.lock = threading.Lock()
+
+    def insert(self, key, value=None):
+        with self.lock:
+            return self.skip_list.insert(key, value)
+
+    def delete(self, key):
+        with self.lock:
+            return self.skip_list.delete(key)
+
+    def get(self, key):
+        with self.lock:
+            return self.skip_list.get(key)
+
+    def range(self, lo, hi):
+        with self.lock:
+            return list(self.skip_list.range(lo, hi))  # The scan has to finish before the lock is released
+
+    def __iter__(self):
+        return iter(self.skip_list)
+
+
+def run(structure, initial, readers, writers, key_space, duration):
+    """
+    Runs reader and writer threads for duration seconds on a structure already holding the initial keys.
+    :return: (reads/s, writes/s, errors)
+    """
+    stop = threading.Event()
+    counts, owned, errors = {}, {}, []
+
+    def writer(w):
+        rng, mine, done = random.Random(w), {key for key in initial if key % writers == w}, 0
+        while not stop.is_set():
+            key = rng.randrange(key_space // writers) * writers + w
+            if rng.random() < 0.6:
+                structure.insert(key, w)
+                mine.add(key)
+            else:
+                structure.delete(key)
+                mine.discard(key)
+            done += 1
+        counts["w", w], owned[w] = done, mine
+
+    def reader(r):
+        rng, done = random.Random(-1 - r), 0
+        while not stop.is_set():
+            lo = rng.randrange(key_space)
+            if done % 8:
+                value = structure.get(lo)
+                if value is not None and lo % writers != value:
+                    errors.append(f"key {lo} holds value {value}")
+            else:
+                keys = list(structure.range(lo, lo + 64))
+                if any(a >= b for a, b in zip(keys, keys[1:])) or any(not lo <= key < lo + 64 for key in keys):
+                    errors.append(f"bad scan from {lo}: {keys}")
+            done += 1
+        counts["r", r] = done
+
+    threads = [threading.Thread(target=writer, args=(w,)) for w in range(writers)]
+    threads += [threading.Thread(target=reader, args=(r,)) for r in range(readers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    expected = sorted(set().union(*owned.values()))
+    if list(structure) != expected:
+        errors.append("final contents differ from what the writers left")
+    reads = sum(n for (kind, _), n in counts.items() if kind == "r")
+    writes = sum(n for (kind, _), n in counts.items() if kind == "w")
+    return reads / duration, writes / duration, errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Concurrent vs globally locked SkipList throughput.")
+    parser.add_argument("--readers", default="1,2,4,8", help="Comma-separated reader thread counts")
+    parser.add_argument("--writers", type=int, default=2, help="Writer threads")
+    parser.add_argument("--keys", type=int, default=100000, help="Key space")
+    parser.add_argument("--duration", type=float, default=3.0, help="Seconds per run")
+    args = parser.parse_args(argv)
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    print(f"{'structure':<14}{'readers':>8}{'writers':>8}{'reads/s':>12}{'writes/s':>12}  check")
+    failed = False
+    for readers in map(int, args.readers.split(",")):
+        for name, factory in (("global lock", LockedSkipList), ("concurrent", ConcurrentSkipList)):
+            structure = factory()
+            initial = random.Random(0).sample(range(args.keys), args.keys // 2)  # Start half full
+            for key in initial:
+                structure.insert(key, key % args.writers)
+            reads, writes, errors = run(structure, initial, readers, args.writers, args.keys, args.duration)
+            failed = failed or bool(errors)
+            print(f"{name:<14}{readers:>8}{args.writers:>8}{reads:>12,.0f}{writes:>12,.0f}  "
+                  f"{errors[0] if errors else 'ok'}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
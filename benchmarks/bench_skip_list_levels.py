@@ -0,0 +1,71 @@
+#Benchmark for SkipList level scaling: search length and insert throughput as n grows
+#Run from the repository root: python -m benchmarks.bench_skip_list_levels --sizes 1000,100000,1000000,10000000
+#Compares the old fixed cap (max_level=4) with the auto-scaling cap, and the two level generators
+
+import argparse
+import random
+import time
+
+from Skip_List import SkipList
+
+CONFIGS = {
+    "fixed 4, p=1/2": dict(max_level=4, p=0.5, auto_level=False),  # What SkipListGUI used to build
+    "auto, p=1/2": dict(p=0.5),
+    "auto, p=1/4": dict(p=0.25),
+}
+
+
+def search_length(skip_list, key):
+    """Nodes visited (key comparisons) by the top-down search for key."""
+    current, steps = skip_list.header, 0
+    for i in range(skip_list.level, -1, -1):
+        while current.forward[i]:
+            steps += 1
+            if current.forward[i].key >= key:
+                break
+            current = current.forward[i]
+    return steps
+
+
+def loop_level(skip_list):
+    """The original generator: one random.random() call per level."""
+    lvl = 0
+    while random.random() < skip_list.p and lvl < skip_list.max_level:
+        lvl += 1
+    return lvl
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Search length and insert throughput of SkipList level caps.")
+    parser.add_argument("--sizes", default="1000,10000,100000,1000000,10000000", help="Comma-separated key counts")
+    parser.add_argument("--fixed-limit", type=int, default=100000, help="Largest n for the fixed cap (it is O(n))")
+    parser.add_argument("--probes", type=int, default=2000, help="Searches averaged per row")
+    args = parser.parse_args(argv)
+
+    skip_list = SkipList(max_level=20)
+    for name, generator in (("random() loop", loop_level), ("getrandbits", SkipList.random_level)):
+        start = time.perf_counter()
+        for _ in range(10 ** 6):
+            generator(skip_list)
+        print(f"level generator {name:<16}{(time.perf_counter() - start) * 1000:>8.1f} ns / call")
+
+    print(f"\n{'config':<16}{'n':>12}{'max_level':>10}{'inserts/s':>12}{'avg search':>12}")
+    for size in map(int, args.sizes.split(",")):
+        rng = random.Random(size)
+        keys = rng.sample(range(10 * size), size)
+        probes = [rng.randrange(10 * size) for _ in range(args.probes)]
+        for name, config in CONFIGS.items():
+            if not config.get("auto_level", True) and size > args.fixed_limit:
+                continue
+            skip_list = SkipList(**config)
+            start = time.perf_counter()
+            for key in keys:
+                skip_list.insert(key)
+            rate = size / (time.perf_counter() - start)
+            steps = sum(search_length(skip_list, key) for key in probes) / len(probes)
+            print(f"{name:<16}{size:>12,}{skip_list.max_level:>10}{rate:>12,.0f}{steps:>12.1f}")
+            del skip_list
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#Benchmark for SkipList restart paths: re-inserting every key, from_sorted, and loading a memory-mapped snapshot
+#Run from the repository root: python -m benchmarks.bench_skip_list_snapshot --size 1000000
+#Also times write-ahead log appends and replay, and reports snapshot size and read bandwidth
+
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from Skip_List import SkipList
+from Skip_List_Storage import SNAPSHOT_NAME, DurableSkipList, load_snapshot, save_snapshot
+
+
+def timed(label, func, size=None):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    rate = f"{size / elapsed / 2 ** 20:>10.1f} MiB/s" if size else ""
+    print(f"{label:<36}{elapsed * 1000:>12.1f} ms{rate}")
+    return result
+
+
+def insert_each(keys):
+    skip_list = SkipList()
+    for key in keys:
+        skip_list.insert(key)
+    return skip_list
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SkipList snapshot, load and write-ahead log timings.")
+    parser.add_argument("--size", type=int, default=1000000, help="Keys in the list")
+    parser.add_argument("--log", type=int, default=100000, help="Write-ahead log records")
+    parser.add_argument("--directory", default=None, help="Where to write files (default: a temporary directory)")
+    args = parser.parse_args(argv)
+
+    directory = args.directory or tempfile.mkdtemp(prefix="skiplist-")
+    path = os.path.join(directory, SNAPSHOT_NAME)
+    try:
+        keys = random.Random(1).sample(range(10 * args.size), args.size)
+        skip_list = insert_each(keys)
+        size = timed("save_snapshot", lambda: save_snapshot(skip_list, path))
+        print(f"{'  snapshot size':<36}{size / 2 ** 20:>12.1f} MiB ({size / args.size:.1f} bytes/key)")
+
+        print(f"\nrestart with {args.size:,} keys")
+        timed("  insert every key", lambda: insert_each(keys))
+        ordered = sorted(keys)
+        timed("  from_sorted (keys in memory)", lambda: SkipList.from_sorted(ordered))
+        loaded = timed("  load_snapshot", lambda: load_snapshot(path), size)
+        timed("  load_snapshot, no checksum", lambda: load_snapshot(path, verify=False), size)
+        assert list(loaded) == ordered
+
+        print(f"\nwrite-ahead log, {args.log:,} records")
+        log_directory = os.path.join(directory, "durable")
+        rng = random.Random(2)
+        with DurableSkipList(log_directory) as durable:
+            timed("  append (flush per record)", lambda: [durable.insert(rng.randrange(10 * args.size))
+                                                         for _ in range(args.log)] and None)
+        reopened = timed("  open and replay", lambda: DurableSkipList(log_directory))
+        reopened.close()
+    finally:
+        if args.directory is None:
+            shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#Benchmark for nearest-neighbour tour construction: the original O(n²) scan against the PointGrid index
+#Run from the repository root: python -m benchmarks.bench_tsp --sizes 1000,10000,100000,1000000
+#Uniform and clustered points; the scan is only run up to --scan-limit points.
+#Each grid tour is then improved by local_search (2-opt + Or-opt) within --budget seconds
+
+import argparse
+import math
+import random
+import time
+
+from TSP_Solver import local_search, nearest_neighbour_tour, tour_length
+
+
+def scan_tour(points):
+    """The original greedy_tsp loop: min() over the remaining points with a sqrt per comparison."""
+    remaining = list(range(1, len(points)))
+    order = [0]
+    current = points[0]
+    while remaining:
+        closest = min(remaining, key=lambda i: math.dist(current, points[i]))
+        remaining.remove(closest)
+        order.append(closest)
+        current = points[closest]
+    return order
+
+
+def uniform(size, rng):
+    return [(rng.random() * 1000, rng.random() * 1000) for _ in range(size)]
+
+
+def clustered(size, rng):
+    centres = [(rng.random() * 1000, rng.random() * 1000) for _ in range(max(size // 1000, 1))]
+    return [(rng.gauss(cx, 5), rng.gauss(cy, 5)) for cx, cy in (rng.choice(centres) for _ in range(size))]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Nearest-neighbour tour construction times.")
+    parser.add_argument("--sizes", default="1000,10000,100000,1000000", help="Comma-separated point counts")
+    parser.add_argument("--scan-limit", type=int, default=10000, help="Largest size for the O(n²) scan")
+    parser.add_argument("--budget", type=float, default=30.0, help="Local search seconds per tour (0: skip)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    print(f"{'points':<12}{'n':>10}{'builder':>10}{'seconds':>10}{'length':>14}")
+    for size in map(int, args.sizes.split(",")):
+        for name, generate in (("uniform", uniform), ("clustered", clustered)):
+            points = generate(size, random.Random(args.seed))
+            builders = [("grid", nearest_neighbour_tour)] + ([("scan", scan_tour)] if size <= args.scan_limit else [])
+            for builder, build in builders:
+                start = time.perf_counter()
+                order = build(points)
+                elapsed = time.perf_counter() - start
+                print(f"{name:<12}{size:>10,}{builder:>10}{elapsed:>10.2f}{tour_length(points, order):>14.1f}")
+            if args.budget > 0:
+                start = time.perf_counter()
+                result = local_search(points, nearest_neighbour_tour(points), time_budget=args.budget)
+                elapsed = time.perf_counter() - start
+                state = "" if result.converged else "  (budget hit)"
+                print(f"{name:<12}{size:>10,}{'+2opt/or':>10}{elapsed:>10.2f}{result.length:>14.1f}"
+                      f"  {len(result.log)} passes{state}")
+
+
+if __name__ == "__main__":
+    main()
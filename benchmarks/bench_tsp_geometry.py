@@ -0,0 +1,55 @@
+#Benchmark for the NumPy Geometry kernels against the pure Python TSP helpers
+#Run from the repository root: python -m benchmarks.bench_tsp_geometry --size 1000000 --tours 1000
+#Tour length, batched scoring of random tours, blocked distance matrix, k-nearest candidates and greedy tours
+
+import argparse
+import math
+import random
+import time
+
+from TSP_Solver import Geometry, nearest_neighbour_tour, tour_length
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<44}{(time.perf_counter() - start) * 1000:>12.1f} ms")
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Vectorized TSP geometry timings.")
+    parser.add_argument("--size", type=int, default=1000000, help="Points for tour length")
+    parser.add_argument("--tours", type=int, default=1000, help="Random tours scored in one batch")
+    parser.add_argument("--tour-size", type=int, default=1000, help="Points per batched tour")
+    parser.add_argument("--matrix", type=int, default=5000, help="Points for the distance matrix and candidates")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+    rng = random.Random(args.seed)
+
+    points = [(rng.random() * 1000, rng.random() * 1000) for _ in range(args.size)]
+    order = list(range(args.size))
+    geometry = timed(f"Geometry of {args.size:,} points", lambda: Geometry(points))
+    timed("  tour_length, math.dist per edge", lambda: tour_length(points, order))
+    timed("  Geometry.tour_length", lambda: geometry.tour_length(order))
+
+    points = points[:args.tour_size]
+    geometry = Geometry(points)
+    tours = [rng.sample(range(args.tour_size), args.tour_size) for _ in range(args.tours)]
+    print(f"\n{args.tours:,} tours of {args.tour_size:,} points")
+    timed("  tour_length per tour", lambda: [tour_length(points, tour) for tour in tours])
+    timed("  Geometry.tour_lengths (one batch)", lambda: geometry.tour_lengths(tours))
+
+    points = [(rng.random() * 1000, rng.random() * 1000) for _ in range(args.matrix)]
+    geometry = Geometry(points)
+    print(f"\n{args.matrix:,} points")
+    if args.matrix <= 3000:
+        timed("  distance matrix, math.dist per pair", lambda: [[math.dist(a, b) for b in points] for a in points])
+    timed("  Geometry.distance_matrix (blocked)", lambda: geometry.distance_matrix(memory=2 ** 31))
+    timed("  Geometry.nearest_candidates(k=8)", lambda: geometry.nearest_candidates(8))
+    timed("  nearest_neighbour_tour (grid)", lambda: nearest_neighbour_tour(points))
+    timed("  Geometry.nearest_neighbour_tour", lambda: geometry.nearest_neighbour_tour())
+
+
+if __name__ == "__main__":
+    main()
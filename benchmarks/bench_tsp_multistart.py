@@ -0,0 +1,43 @@
+#Scaling benchmark for multi_start_tsp: the same starts solved with 1, 2, ... N worker processes
+#Run from the repository root: python -m benchmarks.bench_tsp_multistart --size 20000 --starts 16 --workers 1,2,4,8
+#The 1-worker row runs in-process; the others share coordinates and neighbour lists through shared memory
+
+import argparse
+import os
+import random
+import time
+
+from TSP_Solver import multi_start_tsp, nearest_neighbour_tour, tour_length
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Multi-start TSP scaling across worker processes.")
+    parser.add_argument("--size", type=int, default=20000, help="Points")
+    parser.add_argument("--starts", type=int, default=16, help="Start points per run")
+    parser.add_argument("--workers", default=None, help="Comma-separated worker counts (default: 1, 2, 4, ... cpus)")
+    parser.add_argument("--budget", type=float, default=None, help="Local search seconds per start (default: none)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    cpus = os.cpu_count() or 1
+    if args.workers:
+        counts = [int(count) for count in args.workers.split(",")]
+    else:
+        counts = sorted({min(2 ** i, cpus) for i in range(cpus.bit_length() + 1)})
+    rng = random.Random(args.seed)
+    points = [(rng.random() * 1000, rng.random() * 1000) for _ in range(args.size)]
+    greedy = tour_length(points, nearest_neighbour_tour(points))
+    print(f"{args.size:,} points, {args.starts} starts, {cpus} CPUs; greedy tour from point 0: {greedy:.1f}")
+    print(f"{'workers':>8}{'seconds':>10}{'speedup':>10}{'best length':>14}{'worst start':>14}")
+    baseline = None
+    for workers in counts:
+        start = time.perf_counter()
+        result = multi_start_tsp(points, args.starts, workers, args.budget, seed=args.seed)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        worst = max(length for _, length, _, _ in result.runs)
+        print(f"{workers:>8}{elapsed:>10.2f}{baseline / elapsed:>10.2f}{result.length:>14.1f}{worst:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#Bellman_Ford_Solver checked against the original GUI's |V| - 1 pass relaxation loop
+
+import io
+import math
+import random
+import sys
+
+import pytest
+
+from Bellman_Ford_Solver import STRATEGIES, bellman_ford, format_result, main, parse_edge_lines
+
+
+def reference(vertices, edges, source):
+    """The original run_bellman_ford: |V| - 1 full passes, then one pass to detect a negative cycle."""
+    distance = {vertex: math.inf for vertex in vertices}
+    distance[source] = 0
+    for _ in range(len(vertices) - 1):
+        for u, v, weight in edges:
+            if distance[u] != math.inf and distance[u] + weight < distance[v]:
+                distance[v] = distance[u] + weight
+    negative = any(distance[u] != math.inf and distance[u] + weight < distance[v] for u, v, weight in edges)
+    return distance, negative
+
+
+def random_graph(seed, num_vertices=25, num_edges=70, low=-2):
+    rng = random.Random(seed)
+    vertices = [f"v{i}" for i in range(num_vertices)]
+    edges = [(rng.choice(vertices), rng.choice(vertices), rng.randint(low, 15)) for _ in range(num_edges)]
+    return vertices, edges
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES)
+@pytest.mark.parametrize("seed", range(20))
+def test_strategies_match_reference(strategy, seed):
+    vertices, edges = random_graph(seed)
+    distance, negative = reference(vertices, edges, "v0")
+    result = bellman_ford(vertices, edges, "v0", strategy=strategy)
+    assert result.has_negative_cycle == negative
+    if not negative:
+        assert result.distances == distance
+        for vertex in vertices:
+            path = result.path_to(vertex)
+            if path:
+                weights = {(u, v): min(w for a, b, w in edges if (a, b) == (u, v)) for u, v in zip(path, path[1:])}
+                assert sum(weights.values()) == distance[vertex]
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_vectorized_matches_reference(seed):
+    np = pytest.importorskip("numpy")
+    from Bellman_Ford_Solver import EdgeArrays, bellman_ford_vectorized
+    vertices, edges = random_graph(seed)
+    sources = vertices[:7]
+    result = bellman_ford_vectorized(EdgeArrays.from_edges(vertices, edges), sources, chunk_size=3)
+    for row, source in enumerate(sources):
+        distance, negative = reference(vertices, edges, source)
+        assert bool(result.negative_cycle[row]) == negative
+        if not negative:
+            assert result.distances_from(source) == distance
+    assert isinstance(result.distances, np.ndarray)
+
+
+@pytest.mark.parametrize("find_all_cycles", [False, True])
+def test_reported_cycles_are_negative_cycles(find_all_cycles):
+    for seed in range(20):
+        vertices, edges = random_graph(seed)
+        result = bellman_ford(vertices, edges, "v0", find_all_cycles=find_all_cycles)
+        assert result.has_negative_cycle == reference(vertices, edges, "v0")[1]
+        for cycle, weight in result.negative_cycles:
+            steps = list(zip(cycle, cycle[1:] + cycle[:1]))
+            cheapest = [min(w for a, b, w in edges if (a, b) == step) for step in steps]
+            assert weight == sum(cheapest) < 0
+            assert set(cycle) <= result.unbounded
+
+
+def test_incremental_updates_match_full_solve():
+    from Bellman_Ford_Solver import IncrementalBellmanFord
+    rng = random.Random(6)
+    vertices, edges = random_graph(6, low=0)
+    solver = IncrementalBellmanFord(vertices, edges, "v0")
+    for _ in range(60):
+        action = rng.random()
+        if action < 0.5:
+            solver.add_edge(rng.choice(vertices), rng.choice(vertices), rng.randint(-1, 15))
+        elif action < 0.8:
+            u, v, _ = rng.choice(solver.edges)
+            solver.update_edge(u, v, rng.randint(-1, 15))
+        else:
+            u, v, _ = rng.choice(solver.edges)
+            solver.remove_edge(u, v)
+        distance, negative = reference(vertices, solver.edges, "v0")
+        assert solver.result.has_negative_cycle == negative
+        if not negative:
+            assert solver.result.distances == distance
+
+
+def test_parse_edge_lines():
+    lines = ["# u v weight", "A B 4", "", "  A C -2.5  ", "C B 1"]
+    assert parse_edge_lines(lines) == [("A", "B", 4), ("A", "C", -2.5), ("C", "B", 1)]
+    with pytest.raises(ValueError, match="Line 2"):
+        parse_edge_lines(["A B 4", "A B"])
+    with pytest.raises(ValueError, match="Line 1"):
+        parse_edge_lines(["A B x"])
+
+
+def test_main_prints_shortest_paths(tmp_path, capsys):
+    path = tmp_path / "graph.txt"
+    path.write_text("A B 4\nA C 2\nC B -1\nE A 1\n")
+    assert main([str(path), "--source", "A"]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        "Final Shortest Paths from Source:", "A → A: 0", "A → B: 1", "A → C: 2", "A → E: ∞ (No Path)"]
+    result = bellman_ford(["A", "B", "C", "E"], parse_edge_lines(path.read_text().splitlines()), "A")
+    assert result.path_to("B") == ["A", "C", "B"] and result.path_to("E") == []
+
+
+def test_main_reports_negative_cycle(tmp_path, capsys):
+    path = tmp_path / "graph.txt"
+    path.write_text("A B 1\nB C -3\nC B 1\n")
+    assert main([str(path), "--source", "A"]) == 1
+    assert capsys.readouterr().out == "Graph contains a negative weight cycle!\nB → C → B (weight -2)\n"
+    result = bellman_ford("ABC", [("A", "B", 1), ("B", "C", -3), ("C", "B", 1)], "A")
+    assert format_result(result, "ABC").startswith("Graph contains a negative weight cycle!")
+    with pytest.raises(ValueError):
+        result.path_to("C")
+
+
+@pytest.mark.parametrize("text", ["A B 4\nB C x\n", "A B 4\nA B 1 2\n"])
+def test_main_rejects_malformed_lines(tmp_path, monkeypatch, capsys, text):
+    path = tmp_path / "graph.txt"
+    path.write_text(text)
+    with pytest.raises(SystemExit) as exit_info:
+        main([str(path), "--source", "A"])
+    assert exit_info.value.code == 2 and "Could not load" in capsys.readouterr().err
+    monkeypatch.setattr(sys, "stdin", io.StringIO(text))  # '-' reads the edge list from stdin
+    with pytest.raises(SystemExit) as exit_info:
+        main(["-", "--source", "A"])
+    assert exit_info.value.code == 2 and "Line 2" in capsys.readouterr().err
@@ -0,0 +1,78 @@
+#ConcurrentSkipList checked against SkipList single-threaded, and against per-thread key sets under contention
+
+import random
+import sys
+import threading
+
+from Concurrent_Skip_List import ConcurrentSkipList
+from Skip_List import SkipList
+
+
+def test_matches_skip_list():
+    rng = random.Random(1)
+    concurrent, reference = ConcurrentSkipList(), SkipList()
+    for step in range(4000):
+        key = rng.randrange(500)
+        if rng.random() < 0.6:
+            assert concurrent.insert(key, step) == reference.insert(key, step)
+        else:
+            assert (concurrent.delete(key) is None) == (reference.delete(key) is None)
+        assert len(concurrent) == len(reference)
+    assert list(concurrent.items()) == list(reference.items())
+    assert list(concurrent.range(100, 200)) == list(reference.range(100, 200))
+    assert all(concurrent.get(key) == reference.get(key) for key in range(-1, 501))
+
+
+def level_keys(skip_list, level):
+    keys, node = [], skip_list.header.forward[level]
+    while node is not None:
+        keys.append(node.key)
+        node = node.forward[level]
+    return keys
+
+
+def test_concurrent_writers_and_readers():
+    skip_list = ConcurrentSkipList(max_level=16)
+    writers, rounds = 4, 3000
+    expected = [set() for _ in range(writers)]
+    errors = []
+    done = threading.Event()
+
+    def write(index):
+        rng = random.Random(index)
+        for _ in range(rounds):
+            key = rng.randrange(2000) * writers + index  # Keys are disjoint between writers
+            if rng.random() < 0.65:
+                skip_list.insert(key, index)
+                expected[index].add(key)
+            else:
+                skip_list.delete(key)
+                expected[index].discard(key)
+
+    def read():
+        while not done.is_set():
+            keys = list(skip_list)
+            if keys != sorted(set(keys)):
+                errors.append(keys)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # Switch threads as often as possible
+    try:
+        threads = [threading.Thread(target=write, args=(i,)) for i in range(writers)]
+        readers = [threading.Thread(target=read) for _ in range(2)]
+        for thread in threads + readers:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        done.set()
+        for thread in readers:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert not errors
+    union = sorted(set().union(*expected))
+    assert list(skip_list) == union and len(skip_list) == len(union)
+    for level in range(skip_list.max_level + 1):  # No marked node is left linked on any level
+        keys = level_keys(skip_list, level)
+        assert keys == sorted(keys) and set(keys) <= set(union)
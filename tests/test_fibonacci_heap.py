@@ -0,0 +1,177 @@
+#FibonacciHeap operations replayed against a dict model, and its Dijkstra against a heapq Dijkstra
+
+import heapq
+import math
+import random
+
+import pytest
+
+from Fibonacci_Heap import FibonacciHeap, dijkstra
+
+
+def replay(heap, key_of, extract, steps=3000, seed=1):
+    """Random insert/extract/decrease_key/delete/merge sequence checked against a dict of live keys."""
+    rng, model = random.Random(seed), {}
+    for _ in range(steps):
+        action = rng.random()
+        if action < 0.4 or not model:
+            key = rng.randrange(10000)
+            model[heap.insert(key)] = key
+        elif action < 0.6:
+            handle = rng.choice(list(model))
+            model[handle] = max(model[handle] - rng.randrange(500), -1000)
+            heap.decrease_key(handle, model[handle])
+        elif action < 0.7:
+            handle = rng.choice(list(model))
+            assert heap.delete(handle) == model.pop(handle)
+        else:
+            key, handle = extract(heap)
+            assert key == min(model.values()) == model.pop(handle)
+        assert len(heap) == len(model)
+        assert heap.find_min() == (min(model.values()) if model else None)
+        assert all(key_of(heap, handle) == key for handle, key in model.items())
+    return model
+
+
+def extract_node(heap):
+    node = heap.extract_min_node()
+    return node.key, node
+
+
+def test_operations_match_model():
+    heap = FibonacciHeap()
+    model = replay(heap, lambda heap, node: node.key, extract_node)
+    assert sorted(model.values()) == [heap.extract_min() for _ in range(len(model))]
+    assert heap.extract_min() is None and heap.min_node is None
+
+
+def test_decrease_key_rejects_larger_key():
+    heap = FibonacciHeap()
+    node = heap.insert(5)
+    with pytest.raises(ValueError):
+        heap.decrease_key(node, 6)
+
+
+def test_merge():
+    rng = random.Random(2)
+    first, second = FibonacciHeap(), FibonacciHeap()
+    keys = [rng.randrange(1000) for _ in range(300)]
+    for key in keys[:100]:
+        first.insert(key)
+    for key in keys[100:]:
+        second.insert(key)
+    first.extract_min()  # Give both heaps some structure before merging
+    second.extract_min()
+    expected = sorted(keys[:100])[1:] + sorted(keys[100:])[1:]
+    first.merge(second)
+    assert len(second) == 0 and second.min_node is None
+    assert [first.extract_min() for _ in range(len(first))] == sorted(expected)
+
+
+def reference_dijkstra(adjacency, source):
+    distances = [math.inf] * len(adjacency)
+    distances[source] = 0
+    heap = [(0, source)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d <= distances[u]:
+            for v, weight in adjacency[u]:
+                if d + weight < distances[v]:
+                    distances[v] = d + weight
+                    heapq.heappush(heap, (d + weight, v))
+    return distances
+
+
+def test_dijkstra_matches_heapq():
+    rng = random.Random(3)
+    adjacency = [[(rng.randrange(300), rng.random() * 10) for _ in range(5)] for _ in range(300)]
+    distances, predecessors = dijkstra(adjacency, 0)
+    assert distances == reference_dijkstra(adjacency, 0)
+    for v, u in enumerate(predecessors):
+        if u is not None:
+            assert any(t == v and distances[u] + w == distances[v] for t, w in adjacency[u])
+
+
+def extract_slot(heap):
+    slot = heap.min_node
+    return heap.extract_min(), slot
+
+
+def test_pooled_matches_model():
+    from Fibonacci_Heap import PooledFibonacciHeap
+    heap = PooledFibonacciHeap()
+    model = replay(heap, lambda heap, slot: heap.keys[slot], extract_slot)
+    assert len(heap.keys) < 3000  # Extracted slots were reused
+    assert sorted(model.values()) == [heap.extract_min() for _ in range(len(model))]
+
+
+def test_pooled_merge_shifts_handles():
+    from Fibonacci_Heap import PooledFibonacciHeap
+    first, second = PooledFibonacciHeap(), PooledFibonacciHeap()
+    for key in (5, 3, 8):
+        first.insert(key, int(key))
+    handles = [second.insert(key, int(key)) for key in (7, 1, 4)]
+    second.extract_min()  # Leaves a free slot in second
+    offset = first.merge(second)
+    assert len(second) == 0
+    first.decrease_key(handles[2] + offset, 2)
+    assert [first.extract_min_item() for _ in range(len(first))] == [(2, 4), (3, 3), (5, 5), (7, 7), (8, 8)]
+    slots = len(first.keys)
+    first.insert(9)
+    assert len(first.keys) == slots  # A recycled slot, not a new one
+
+
+@pytest.mark.parametrize("pooled", [False, True])
+def test_batch_operations_match_sorted(pooled):
+    from Fibonacci_Heap import PooledFibonacciHeap
+    rng = random.Random(4)
+    heap = PooledFibonacciHeap() if pooled else FibonacciHeap()
+    keys = [rng.randrange(500) for _ in range(1000)]
+    heap.insert_many(keys[:600])
+    heap.extract_min()  # Consolidate, so iteration walks real trees
+    for key in keys[600:]:
+        heap.insert(key)
+    expected = sorted(keys)[1:]
+    assert list(heap) == expected
+    assert heap.nsmallest(25) == expected[:25]
+    assert heap.extract_many(0) == []
+    assert heap.extract_many(100) == expected[:100]
+    assert len(heap) == len(expected) - 100
+    assert heap.extract_many(300) == expected[100:400]
+    assert [heap.extract_min() for _ in range(len(heap))] == expected[400:]
+    assert heap.extract_many(5) == []
+
+
+def test_insert_many_handles_and_values():
+    heap = FibonacciHeap()
+    nodes = heap.insert_many([3, 1, 2], values="abc")
+    assert [node.value for node in nodes] == ["a", "b", "c"]
+    heap.decrease_key(nodes[0], 0)
+    assert [node.value for node in heap.extract_many_nodes(3)] == ["a", "b", "c"]
+
+
+def subtree_size(heap, node):
+    return 1 + sum(subtree_size(heap, child) for child in heap._siblings(node.child))
+
+
+def test_consolidation_degree_bound():
+    from Fibonacci_Heap import LOG_PHI, _degree_table_size
+    rng = random.Random(5)
+    heap = FibonacciHeap()
+    nodes = [heap.insert(rng.random()) for _ in range(5000)]
+    peak = len(heap)
+    for step in range(2000):
+        if step % 3 == 0:
+            heap.extract_min()
+        else:
+            node = rng.choice(nodes)
+            if node.parent is not None or node is heap.min_node:
+                heap.decrease_key(node, node.key - rng.random())
+        if step % 250 == 0 and len(heap):
+            roots = heap._siblings(heap.min_node)
+            if step % 3 == 0:  # Right after a consolidation every root degree is distinct
+                assert len({root.degree for root in roots}) == len(roots)
+            for root in roots:  # A degree-k tree holds at least φ^k nodes
+                assert root.degree <= math.log(subtree_size(heap, root)) / LOG_PHI + 1e-9
+    assert len(heap._degree_table) <= _degree_table_size(peak)
+    assert all(slot is None for slot in heap._degree_table)
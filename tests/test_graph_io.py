@@ -0,0 +1,84 @@
+#Graph_IO round trips, checked against the edges written and against the original whitespace parser
+
+import os
+
+import pytest
+
+from Graph_IO import load_binary, load_graph, read_edges, save_graph
+from Graph_Representations import build_graph
+
+EDGES = [("a", "b", 4), ("a", "c", 2), ("c", "b", -1), ("b", "d", 2.5), ("d", "a", 7)]
+
+
+def reference_edges(text):
+    """The original GUI parser: one 'u v weight' edge per line."""
+    return [(u, v, int(w)) for u, v, w in (line.split() for line in text.splitlines() if line.strip())]
+
+
+def edge_set(graph):
+    names = graph.vertices
+    return sorted((names[u], names[v], w) for u, v, w in graph.edges())
+
+
+def test_edge_list_matches_reference(tmp_path):
+    text = "a b 4\na c 2\nc b -1\n\nb d 3\n"
+    path = tmp_path / "graph.txt"
+    path.write_text("# comment\n" + text)
+    assert read_edges(str(path))[1] == reference_edges(text)
+
+
+@pytest.mark.parametrize("name", ["graph.txt", "graph.csv", "graph.gr", "graph.bin"])
+def test_round_trip(tmp_path, name):
+    graph = build_graph("abcd", EDGES, backend="csr")
+    path = str(tmp_path / name)
+    save_graph(graph, path)
+    loaded = load_graph(path)
+    if name.endswith(".gr"):  # DIMACS renumbers vertices 1..n
+        assert sorted(loaded.edges()) == sorted(graph.edges())
+    else:
+        assert edge_set(loaded) == edge_set(graph)
+
+
+@pytest.mark.parametrize("text", [
+    "source,target,weight\na,b,4\n",
+    "# exported graph\nsource,target,weight\na,b,4\n",
+    "\n# exported graph\n\nsource,target,weight\na,b,4\n",
+    "source,target\na,b\n",
+    "# exported graph\nFrom, To\na,b\n",
+])
+def test_csv_header_after_comments(tmp_path, text):
+    path = tmp_path / "graph.csv"
+    path.write_text(text)
+    assert read_edges(str(path))[1] == [("a", "b", 4 if "weight" in text else 1)]
+
+
+def test_csv_without_header(tmp_path):
+    path = tmp_path / "graph.csv"
+    path.write_text("# comment\na,b,4\nb,c\n")
+    assert read_edges(str(path))[1] == [("a", "b", 4), ("b", "c", 1)]
+    path.write_text("u,x\nv,u\n")  # Only one name is a column name, so the first row is an edge
+    assert read_edges(str(path))[1] == [("u", "x", 1), ("v", "u", 1)]
+
+
+@pytest.mark.parametrize("text", ["p sp 3 2\na 1 2\n", "p sp\na 1 2 4\n", "p sp 3 1\na 1 2 4 5\n"])
+def test_short_dimacs_lines_are_rejected(tmp_path, text):
+    path = tmp_path / "graph.gr"
+    path.write_text(text)
+    with pytest.raises(ValueError, match="Invalid DIMACS line"):
+        read_edges(str(path))
+
+
+def test_truncated_binary_is_rejected(tmp_path):
+    path = str(tmp_path / "graph.bin")
+    save_graph(build_graph("abcd", EDGES, backend="csr"), path)
+    size = os.path.getsize(path)
+    for cut in (1, 12, size - 20, size - 1):
+        with open(path, "r+b") as handle:
+            handle.truncate(size - cut)
+        with pytest.raises(ValueError):
+            load_binary(path)
+        save_graph(build_graph("abcd", EDGES, backend="csr"), path)
+    with open(path, "ab") as handle:
+        handle.write(b"\0")
+    with pytest.raises(ValueError):
+        load_binary(path)
@@ -0,0 +1,74 @@
+#Graph backends checked against the original adjacency-matrix construction and against each other
+
+import math
+import random
+
+import pytest
+
+from Graph_Representations import (BACKENDS, DENSE_MAX_VERTICES, build_graph, choose_backend, convert,
+                                   estimated_nbytes, memory_report)
+
+
+def reference_matrix(vertices, edges):
+    """The original GraphApp.display_matrix: ∞ off the diagonal, 0 on it, then each edge's weight."""
+    matrix = [[math.inf] * len(vertices) for _ in vertices]
+    for i in range(len(vertices)):
+        matrix[i][i] = 0
+    for u, v, weight in edges:
+        matrix[vertices.index(u)][vertices.index(v)] = weight
+    return matrix
+
+
+def random_graph(seed, num_vertices=12, num_edges=40):
+    rng = random.Random(seed)
+    vertices = [f"v{i}" for i in range(num_vertices)]
+    pairs = {(rng.choice(vertices), rng.choice(vertices)) for _ in range(num_edges)}
+    return vertices, [(u, v, float(rng.randint(-5, 20))) for u, v in sorted(pairs) if u != v]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_dense_matches_reference(seed):
+    vertices, edges = random_graph(seed)
+    graph = build_graph(vertices, edges, backend="dense")
+    assert [list(row) for row in graph.matrix] == reference_matrix(vertices, edges)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backends_hold_the_same_edges(backend):
+    vertices, edges = random_graph(7)
+    graph = build_graph(vertices, edges, backend=backend)
+    names = graph.vertices
+    assert sorted((names[u], names[v], w) for u, v, w in graph.edges()) == sorted(edges)
+    for other in BACKENDS:
+        assert sorted(convert(graph, other).edges()) == sorted(graph.edges())
+
+
+def test_neighbors_match_edges():
+    vertices, edges = random_graph(3)
+    for backend in BACKENDS:
+        graph = build_graph(vertices, edges, backend=backend)
+        for u in range(len(vertices)):
+            assert sorted(graph.neighbors(u)) == sorted((v, w) for a, v, w in graph.edges() if a == u)
+
+
+def test_dense_collapses_parallel_edges_and_self_loops():
+    edges = [("a", "b", 3.0), ("a", "b", 1.0), ("b", "b", 2.0), ("c", "c", -1.0)]
+    dense = build_graph("abc", edges, backend="dense")
+    assert sorted(dense.edges()) == [(0, 1, 1.0), (2, 2, -1.0)]
+    assert sorted(build_graph("abc", edges, backend="csr").edges()) == sorted(
+        (ord(u) - 97, ord(v) - 97, w) for u, v, w in edges)
+
+
+def test_choose_backend():
+    assert choose_backend(10, 25) == "dense"
+    assert choose_backend(10, 24) == "csr"
+    assert choose_backend(DENSE_MAX_VERTICES + 1, (DENSE_MAX_VERTICES + 1) ** 2) == "csr"
+
+
+def test_memory_report_estimates_large_dense():
+    num_vertices = DENSE_MAX_VERTICES + 1
+    graph = build_graph(range(num_vertices), [(i, (i + 1) % num_vertices, 1.0) for i in range(num_vertices)],
+                        backend="csr")
+    report = memory_report(graph)
+    assert report["dense"] == estimated_nbytes("dense", num_vertices, num_vertices)
+    assert report["csr"] == graph.nbytes()
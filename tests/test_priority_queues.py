@@ -0,0 +1,80 @@
+#Every priority-queue backend replayed against a sorted-list model and a plain heapq Dijkstra
+
+import heapq
+import math
+import random
+
+import pytest
+
+from Priority_Queues import QUEUES, PriorityQueue, RadixHeapQueue, dijkstra, make_queue
+
+
+@pytest.mark.parametrize("backend", QUEUES)
+def test_matches_model(backend):
+    rng, queue, model, handles = random.Random(4), make_queue(backend), {}, {}
+    for step in range(3000):
+        action = rng.random()
+        if action < 0.5 or not model:
+            key = rng.randrange(1000) if backend != "radix" or not model else rng.randrange(1000) + queue.peek()[0]
+            handles[step] = queue.push(key, step)
+            model[step] = key
+        elif action < 0.75:
+            item = rng.choice(list(model))
+            new = max(model[item] - rng.randrange(50), queue.peek()[0] if backend == "radix" else -math.inf)
+            queue.decrease_key(handles[item], new)
+            model[item] = new
+        else:
+            key, item = queue.pop()
+            assert key == min(model.values()) == model.pop(item)
+        assert len(queue) == len(model)
+    while model:
+        key, item = queue.pop()
+        assert key == model.pop(item)
+    assert queue.peek() is None
+    with pytest.raises(IndexError):
+        queue.pop()
+
+
+@pytest.mark.parametrize("backend", QUEUES)
+def test_decrease_key_rejects_larger_key(backend):
+    queue = make_queue(backend)
+    handle = queue.push(5, "a")
+    with pytest.raises(ValueError):
+        queue.decrease_key(handle, 6)
+
+
+def reference_dijkstra(adjacency, source):
+    distances = [math.inf] * len(adjacency)
+    distances[source] = 0
+    heap = [(0, source)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > distances[u]:
+            continue
+        for v, weight in adjacency[u]:
+            if d + weight < distances[v]:
+                distances[v] = d + weight
+                heapq.heappush(heap, (d + weight, v))
+    return distances
+
+
+@pytest.mark.parametrize("backend", QUEUES)
+def test_dijkstra_matches_reference(backend):
+    rng = random.Random(9)
+    adjacency = [[(rng.randrange(200), rng.randrange(1, 30)) for _ in range(4)] for _ in range(200)]
+    assert dijkstra(adjacency, 0, backend)[0] == reference_dijkstra(adjacency, 0)
+
+
+def test_incomplete_backend_cannot_be_created():
+    class PushOnly(PriorityQueue):
+        def push(self, key, value=None):
+            return None
+
+    with pytest.raises(TypeError):
+        PushOnly()
+
+
+@pytest.mark.parametrize("key", [math.inf, math.nan, 1.5, -1, "1"])
+def test_radix_rejects_bad_keys(key):
+    with pytest.raises(ValueError):
+        RadixHeapQueue().push(key)
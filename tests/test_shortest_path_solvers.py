@@ -0,0 +1,82 @@
+#Dijkstra, blocked Floyd-Warshall and Johnson checked against the textbook triple-loop Floyd-Warshall
+
+import math
+import random
+
+import pytest
+
+import Shortest_Path_Solvers
+from Graph_Representations import build_graph
+from Shortest_Path_Solvers import (HEAPS, all_pairs_shortest_paths, dijkstra, floyd_warshall, johnson,
+                                   repeated_dijkstra, shortest_paths)
+
+
+def random_graph(seed, num_vertices=20, num_edges=60, low=0):
+    rng = random.Random(seed)
+    edges = [(rng.randrange(num_vertices), rng.randrange(num_vertices), rng.randint(low, 20))
+             for _ in range(num_edges)]
+    if low < 0:  # Keep negative edges off cycles: they only run from lower to higher ids
+        edges = [(u, v, w) if w >= 0 or u < v else (u, v, -w) for u, v, w in edges]
+    return build_graph(range(num_vertices), edges, backend="csr")
+
+
+def reference(graph):
+    """Plain O(V³) Floyd-Warshall over the edges (cheapest parallel edge wins)."""
+    n = len(graph.vertices)
+    matrix = [[0 if i == j else math.inf for j in range(n)] for i in range(n)]
+    for u, v, weight in graph.edges():
+        matrix[u][v] = min(matrix[u][v], weight)
+    for k in range(n):
+        for i in range(n):
+            for j in range(n):
+                if matrix[i][k] + matrix[k][j] < matrix[i][j]:
+                    matrix[i][j] = matrix[i][k] + matrix[k][j]
+    return matrix
+
+
+def rows(result):
+    return [list(row) for row in result.matrix]
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 7, 128])
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_floyd_warshall_blocks(monkeypatch, block_size, use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(Shortest_Path_Solvers, "np", None)
+    for seed in range(3):
+        graph = random_graph(seed, low=-5)
+        assert rows(floyd_warshall(graph, block_size)) == reference(graph)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_johnson_and_repeated_dijkstra(seed):
+    negative = random_graph(seed, low=-5)
+    assert rows(johnson(negative)) == reference(negative)
+    positive = random_graph(seed)
+    assert rows(repeated_dijkstra(positive)) == reference(positive)
+
+
+@pytest.mark.parametrize("heap", HEAPS)
+def test_dijkstra_heaps(heap):
+    graph = random_graph(8)
+    expected = reference(graph)
+    for source in range(len(graph.vertices)):
+        result = dijkstra(graph, source, heap)
+        assert result.distances == expected[source]
+        for target in range(len(graph.vertices)):
+            path = result.path_to(target)
+            assert bool(path) == (expected[source][target] != math.inf)
+
+
+def test_auto_methods_and_negative_cycles():
+    graph = random_graph(2, low=-5)
+    assert rows(all_pairs_shortest_paths(graph)) == reference(graph)
+    assert shortest_paths(graph, 0).distances == reference(graph)[0]
+    cyclic = build_graph("abc", [("a", "b", 1), ("b", "c", -3), ("c", "a", 1)])
+    for method in ("floyd-warshall", "johnson"):
+        with pytest.raises(ValueError):
+            all_pairs_shortest_paths(cyclic, method)
+    with pytest.raises(ValueError):
+        shortest_paths(cyclic, "a", "bellman-ford")
@@ -0,0 +1,224 @@
+#SkipList queries, map operations, rank/select, levels and bulk operations checked against sorted lists and dicts
+
+import bisect
+import math
+import random
+
+import pytest
+
+from Skip_List import SkipList
+
+
+def check_levels(skip_list):
+    """Every level is sorted and a subsequence of the level below it."""
+    below = None
+    for i in range(skip_list.level + 1):
+        keys, node = [], skip_list.header.forward[i]
+        while node:
+            keys.append(node.key)
+            node = node.forward[i]
+        assert keys == sorted(set(keys))
+        if below is None:
+            assert len(keys) == len(skip_list)
+        else:
+            assert set(keys) <= set(below)
+        below = keys
+
+
+def random_list(seed, count=500, universe=2000):
+    rng = random.Random(seed)
+    keys = rng.sample(range(universe), count)
+    skip_list = SkipList()
+    for key in keys:
+        skip_list.insert(key)
+    return skip_list, sorted(keys)
+
+
+def test_ordered_queries_match_bisect():
+    skip_list, keys = random_list(1)
+    check_levels(skip_list)
+    assert list(skip_list) == keys
+    for probe in range(-5, 2010, 7):
+        i, j = bisect.bisect_left(keys, probe), bisect.bisect_right(keys, probe)
+        assert skip_list.search(probe) == (probe in keys) == (probe in skip_list)
+        assert skip_list.ceiling(probe) == (keys[i] if i < len(keys) else None)
+        assert skip_list.successor(probe) == (keys[j] if j < len(keys) else None)
+        assert skip_list.floor(probe) == (keys[j - 1] if j else None)
+        assert skip_list.predecessor(probe) == (keys[i - 1] if i else None)
+        assert list(skip_list.seek(probe)) == keys[i:]
+        assert list(skip_list.range(probe, probe + 100)) == keys[i:bisect.bisect_left(keys, probe + 100)]
+    assert list(skip_list.range()) == keys
+
+
+def test_prefix():
+    words = ["app", "apple", "apply", "banana", "band", "bandana", "can"]
+    skip_list = SkipList()
+    for word in random.Random(2).sample(words, len(words)):
+        skip_list.insert(word)
+    assert list(skip_list.prefix("ap")) == ["app", "apple", "apply"]
+    assert list(skip_list.prefix("band")) == ["band", "bandana"]
+    assert list(skip_list.prefix("x")) == []
+
+
+def test_delete_matches_set():
+    skip_list, keys = random_list(3)
+    remaining = set(keys)
+    for key in random.Random(3).sample(range(2000), 800):
+        node = skip_list.delete(key)
+        assert (node is not None) == (key in remaining)
+        remaining.discard(key)
+    check_levels(skip_list)
+    assert list(skip_list) == sorted(remaining)
+
+
+def test_map_matches_dict():
+    rng, skip_list, expected = random.Random(4), SkipList(), {}
+    for step in range(3000):
+        key = rng.randrange(400)
+        if rng.random() < 0.7:
+            assert skip_list.insert(key, step) == (key not in expected)
+            expected[key] = step
+        else:
+            assert skip_list.pop(key, None) == expected.pop(key, None)
+    assert list(skip_list.items()) == sorted(expected.items())
+    assert all(skip_list[key] == value and skip_list.get(key) == value for key, value in expected.items())
+    assert skip_list.get(-1, "missing") == "missing"
+    with pytest.raises(KeyError):
+        skip_list[-1]
+    with pytest.raises(KeyError):
+        del skip_list[-1]
+    with pytest.raises(KeyError):
+        skip_list.pop(-1)
+    skip_list[-1] = "x"
+    assert skip_list.get(-1) == "x" and len(skip_list) == len(expected) + 1
+
+
+def test_multi_value_mode():
+    skip_list = SkipList(multi=True)
+    for key, value in [(2, "a"), (1, "b"), (2, "c"), (2, "a")]:
+        skip_list.insert(key, value)
+    assert list(skip_list.items()) == [(1, ["b"]), (2, ["a", "c", "a"])]
+    skip_list.remove(2, "a")
+    assert skip_list.get(2) == ["c", "a"]
+    skip_list.remove(1, "b")
+    assert 1 not in skip_list and len(skip_list) == 1
+    with pytest.raises(ValueError):
+        skip_list.remove(2, "z")
+    with pytest.raises(KeyError):
+        skip_list.remove(5, "a")
+
+
+def check_spans(skip_list):
+    """span[i] of every node (and the header) is the number of level-0 steps its level-i pointer covers."""
+    position, node = {}, skip_list.header.forward[0]
+    while node:
+        position[id(node)] = len(position) + 1
+        node = node.forward[0]
+    node, here = skip_list.header, 0
+    while node:
+        for i, target in enumerate(node.forward[:skip_list.level + 1]):
+            if target is not None:
+                assert node.span[i] == position[id(target)] - here
+        node = node.forward[0]
+        here += 1
+
+
+def test_rank_and_select_match_sorted_list():
+    skip_list, keys = random_list(5)
+    rng = random.Random(5)
+    for key in rng.sample(keys, 200):
+        skip_list.delete(key)
+        keys.remove(key)
+    for key in rng.sample(range(2000, 3000), 100):
+        skip_list.insert(key)
+        bisect.insort(keys, key)
+    check_spans(skip_list)
+    assert [skip_list.select(i) for i in range(len(keys))] == keys
+    assert skip_list.select(-1) == keys[-1]
+    for probe in range(-5, 3005, 11):
+        assert skip_list.rank(probe) == bisect.bisect_left(keys, probe)
+    assert list(skip_list.islice(10, 20)) == keys[10:20] == skip_list[10:20]
+    assert skip_list[::-3] == keys[::-3]
+    assert skip_list.median() == keys[(len(keys) + 1) // 2 - 1]
+    assert skip_list.percentile(100) == keys[-1] and skip_list.percentile(0) == keys[0]
+    with pytest.raises(IndexError):
+        skip_list.select(len(keys))
+    with pytest.raises(ValueError):
+        skip_list.percentile(101)
+
+
+@pytest.mark.parametrize("p", [0.5, 0.25, 0.3])
+def test_level_distribution_is_geometric(p):
+    """Levels drawn from random bits (p = 1/2, 1/4) or the original random() loop follow P(level >= k) = p^k."""
+    state = random.getstate()
+    random.seed(6)
+    skip_list = SkipList(max_level=12, p=p, auto_level=False)
+    draws = 40000
+    try:
+        levels = [skip_list.random_level() for _ in range(draws)]
+    finally:
+        random.setstate(state)
+    assert max(levels) <= 12
+    for k in range(1, 4):
+        observed = sum(level >= k for level in levels) / draws
+        assert observed == pytest.approx(p ** k, rel=0.1)
+
+
+def test_level_spanning_several_random_bytes(monkeypatch):
+    """An all-zero byte carries its 8 zeros into the next one, also when log2(1/p) does not divide 8."""
+    cases = [(0.125, [0, 0b100], 3), (0.125, [0, 0, 1], 5), (2 ** -8, [0, 1], 1),
+             (0.5, [0, 0, 0], 12), (0.5, [0b1000], 3)]
+    for p, stream, expected in cases:
+        draws = iter(stream)
+        monkeypatch.setattr(random, "getrandbits", lambda k: next(draws))
+        assert SkipList(max_level=12, p=p, auto_level=False).random_level() == expected
+
+
+def test_level_cap_grows_with_size():
+    grown, fixed = SkipList(), SkipList(auto_level=False)
+    for key in random.Random(7).sample(range(100000), 5000):
+        grown.insert(key)
+        fixed.insert(key)
+    assert grown.max_level == math.ceil(math.log2(5000)) == len(grown.header.forward) - 1
+    assert fixed.max_level == 4
+    check_levels(grown)
+    check_spans(grown)
+    assert list(grown) == list(fixed)
+
+
+@pytest.mark.parametrize("p", [0, 1, -0.5, 1.5])
+def test_invalid_p(p):
+    with pytest.raises(ValueError):
+        SkipList(p=p)
+
+
+def test_from_sorted_matches_repeated_insert():
+    keys = sorted(random.Random(8).sample(range(10000), 3000))
+    built = SkipList.from_sorted(keys, [key * 2 for key in keys])
+    check_levels(built)
+    check_spans(built)
+    assert list(built.items()) == [(key, key * 2) for key in keys]
+    assert [built.select(i) for i in range(0, 3000, 97)] == keys[::97]
+    assert list(SkipList.from_sorted([1, 1, 2])) == [1, 2]
+    levels = [0, 3, 1]
+    tall = SkipList.from_sorted([1, 2, 3], levels=levels)
+    assert [len(tall._select_node(i).forward) - 1 for i in range(3)] == levels
+    with pytest.raises(ValueError):
+        SkipList.from_sorted([2, 1])
+
+
+def test_bulk_insert_and_delete_match_set():
+    rng = random.Random(9)
+    skip_list, expected = SkipList(), {}
+    for _ in range(5):
+        batch = [rng.randrange(3000) for _ in range(700)]
+        added = skip_list.insert_many(batch, range(len(batch)))
+        assert added == len(set(batch) - set(expected))
+        expected.update(zip(batch, range(len(batch))))  # Duplicates in a batch: the last value wins
+        doomed = [rng.randrange(3000) for _ in range(300)]
+        assert skip_list.delete_many(doomed) == len(set(doomed) & set(expected))
+        for key in doomed:
+            expected.pop(key, None)
+        check_levels(skip_list)
+        check_spans(skip_list)
+    assert list(skip_list.items()) == sorted(expected.items())
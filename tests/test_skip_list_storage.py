@@ -0,0 +1,84 @@
+#Snapshot round trips and write-ahead log recovery of Skip_List_Storage, checked against a plain dict
+
+import os
+import random
+
+import pytest
+
+from Skip_List import SkipList
+from Skip_List_Storage import LOG_NAME, SNAPSHOT_NAME, DurableSkipList, load_snapshot, save_snapshot
+
+
+@pytest.mark.parametrize("keys", [list(range(0, 3000, 3)), [k / 7 for k in range(500)], [str(k) for k in range(300)]])
+def test_snapshot_round_trip(tmp_path, keys):
+    skip_list = SkipList()
+    for key in random.Random(1).sample(keys, len(keys)):
+        skip_list.insert(key, key * 2)
+    path = str(tmp_path / SNAPSHOT_NAME)
+    save_snapshot(skip_list, path)
+    loaded = load_snapshot(path)
+    assert list(loaded) == sorted(keys)
+    assert all(loaded.get(key) == key * 2 for key in keys)
+
+
+def test_truncated_snapshot_is_rejected(tmp_path):
+    skip_list = SkipList()
+    for key in range(100):
+        skip_list.insert(key)
+    path = str(tmp_path / SNAPSHOT_NAME)
+    save_snapshot(skip_list, path)
+    with open(path, "r+b") as file:
+        file.truncate(os.path.getsize(path) - 5)
+    with pytest.raises(ValueError):
+        load_snapshot(path)
+
+
+def test_log_replay_matches_dict(tmp_path):
+    rng, expected = random.Random(2), {}
+    with DurableSkipList(str(tmp_path)) as durable:
+        for step in range(2000):
+            key = rng.randrange(300)
+            if rng.random() < 0.3:
+                durable.delete(key)
+                expected.pop(key, None)
+            else:
+                durable.insert(key, step)
+                expected[key] = step
+            if step == 1000:
+                durable.checkpoint()
+    reopened = DurableSkipList(str(tmp_path))
+    assert list(reopened) == sorted(expected)
+    assert all(reopened.get(key) == value for key, value in expected.items())
+    reopened.close()
+
+
+def test_rejected_insert_is_not_logged(tmp_path):
+    with DurableSkipList(str(tmp_path)) as durable:
+        durable.insert(1)
+        with pytest.raises(TypeError):
+            durable.insert("a")  # Does not compare with 1
+        durable.insert(2)
+    with DurableSkipList(str(tmp_path)) as reopened:
+        assert list(reopened) == [1, 2]
+        assert reopened.replayed == 2
+
+
+def test_bad_record_does_not_block_opening(tmp_path):
+    with DurableSkipList(str(tmp_path)) as durable:
+        durable.insert(1)
+        durable.log.append(1, ("a", None))  # Written straight to the log, as an older version could
+        durable.log.append(1, (3, None))
+    with DurableSkipList(str(tmp_path)) as reopened:
+        assert list(reopened) == [1, 3]
+        assert reopened.log.skipped == 1
+
+
+def test_torn_tail_is_cut_off(tmp_path):
+    with DurableSkipList(str(tmp_path)) as durable:
+        for key in range(10):
+            durable.insert(key)
+    path = tmp_path / LOG_NAME
+    with open(path, "r+b") as file:
+        file.truncate(os.path.getsize(path) - 3)
+    with DurableSkipList(str(tmp_path)) as reopened:
+        assert list(reopened) == list(range(9))
@@ -0,0 +1,191 @@
+#TSP_Solver tour builders checked against the original brute-force greedy scan
+
+import math
+import random
+
+import pytest
+
+from TSP_Solver import PointGrid, greedy_tsp, nearest_neighbour_tour, tour_length
+
+
+def scan_tour(points, start=0):
+    """Reference greedy tour: lowest-index nearest unvisited point by squared distance."""
+    remaining = set(range(len(points))) - {start}
+    order = [start]
+    while remaining:
+        x, y = points[order[-1]]
+        closest = min(remaining, key=lambda i: ((points[i][0] - x) ** 2 + (points[i][1] - y) ** 2, i))
+        remaining.remove(closest)
+        order.append(closest)
+    return order
+
+
+def integer_points(rng, count, side):
+    return [(rng.randrange(side), rng.randrange(side)) for _ in range(count)]
+
+
+@pytest.mark.parametrize("side, seed, start", [(6, 0, 0), (10, 10, 13), (11, 2, 0), (14, 5, 3)])
+def test_grid_tie_on_ring_boundary(side, seed, start):
+    # Ties at exactly the ring distance, which rounding in the stop test used to skip
+    points = integer_points(random.Random(seed), 72, side)
+    assert nearest_neighbour_tour(points, start) == scan_tour(points, start)
+
+
+def test_integer_grids_match_scan():
+    for seed in range(1000):
+        rng = random.Random(seed)
+        count, side = rng.randrange(2, 120), rng.randrange(1, 12)
+        points = integer_points(rng, count, side)
+        start = rng.randrange(count)
+        assert nearest_neighbour_tour(points, start) == scan_tour(points, start), seed
+
+
+@pytest.mark.parametrize("layout", ["uniform", "collinear", "coincident"])
+def test_layouts_match_scan(layout):
+    rng = random.Random(3)
+    if layout == "uniform":
+        points = [(rng.random() * 100, rng.random() * 100) for _ in range(400)]
+    elif layout == "collinear":
+        points = [(rng.random() * 100, 5.0) for _ in range(200)]
+    else:
+        points = [(1.5, 2.5)] * 50
+    assert nearest_neighbour_tour(points) == scan_tour(points)
+
+
+def test_nearest_k_matches_sort():
+    points = integer_points(random.Random(5), 80, 9) + [(0.5, 0.5), (3.25, 7.75)]
+    grid = PointGrid(points)
+    for i, (x, y) in enumerate(points):
+        expected = sorted((j for j in range(len(points)) if j != i),
+                          key=lambda j: ((points[j][0] - x) ** 2 + (points[j][1] - y) ** 2, j))[:6]
+        assert grid.nearest_k(x, y, 6, exclude=i) == expected
+
+
+def test_greedy_tsp_result():
+    points = [(0, 0), (3, 0), (3, 4), (0, 4)]
+    visited, total = greedy_tsp(points[:])
+    assert visited == points + [points[0]]
+    assert total == pytest.approx(14.0) == tour_length(points, range(4))
+    with pytest.raises(ValueError):
+        greedy_tsp([])
+
+
+def test_nearest_k_without_neighbours():
+    grid = PointGrid([(0, 0), (1, 1), (2, 0)])
+    assert grid.nearest_k(0, 0, 0) == []
+    assert grid.nearest_k(0, 0, -1) == []
+    assert grid.nearest_k(0, 0, 5, exclude=0) == [1, 2]
+
+
+def random_points(seed, count):
+    rng = random.Random(seed)
+    return [(rng.random() * 100, rng.random() * 100) for _ in range(count)]
+
+
+def test_geometry_matches_math_dist():
+    pytest.importorskip("numpy")
+    from TSP_Solver import Geometry
+    points = random_points(6, 150)
+    geometry = Geometry(points)
+    rng = random.Random(6)
+    tours = [rng.sample(range(150), 150) for _ in range(9)]
+    for closed in (True, False):
+        expected = [tour_length(points, tour, closed) for tour in tours]
+        assert geometry.tour_lengths(tours, closed, max_bytes=4000) == pytest.approx(expected)
+        assert geometry.tour_length(tours[0], closed) == pytest.approx(expected[0])
+    matrix = geometry.distance_matrix(max_bytes=8 * 150 * 3 * 7)  # Blocks of 7 rows
+    for i in (0, 17, 149):
+        assert matrix[i].tolist() == pytest.approx([math.dist(points[i], q) for q in points])
+        assert geometry.distances_from(i).tolist() == pytest.approx(matrix[i].tolist())
+    with pytest.raises(ValueError):
+        geometry.distance_matrix(memory=1000)
+
+
+def test_geometry_candidates_and_tour():
+    pytest.importorskip("numpy")
+    from TSP_Solver import Geometry
+    points = random_points(7, 300)
+    geometry = Geometry(points)
+    candidates = geometry.nearest_candidates(5, max_bytes=8 * 300 * 3 * 11).tolist()
+    grid = PointGrid(points)
+    assert candidates == [grid.nearest_k(x, y, 5, exclude=i) for i, (x, y) in enumerate(points)]
+    assert geometry.nearest_neighbour_tour(4) == nearest_neighbour_tour(points, 4) == scan_tour(points, 4)
+    tied = integer_points(random.Random(35), 60, 6)
+    assert Geometry(tied).nearest_neighbour_tour(2) == scan_tour(tied, 2)
+
+
+def two_opt_gain(points, tour):
+    """Best gain of any 2-opt move on the closed tour, by brute force."""
+    n, best = len(tour), 0.0
+    for i in range(n - 1):
+        for j in range(i + 2, n if i else n - 1):
+            a, b, c, d = (points[k] for k in (tour[i], tour[i + 1], tour[j], tour[(j + 1) % n]))
+            best = max(best, math.dist(a, b) + math.dist(c, d) - math.dist(a, c) - math.dist(b, d))
+    return best
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_local_search_reaches_a_two_opt_optimum(monkeypatch, use_numpy):
+    import TSP_Solver
+    from TSP_Solver import local_search
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(TSP_Solver, "np", None)
+    points = random_points(8, 120)
+    start = nearest_neighbour_tour(points)
+    result = local_search(points, start, neighbours=len(points) - 1)
+    assert result.converged and sorted(result.order) == list(range(120)) and result.order[0] == start[0]
+    assert result.length == pytest.approx(tour_length(points, result.order))
+    assert result.length < tour_length(points, start)
+    assert two_opt_gain(points, result.order) < 1e-6
+    lengths = [tour_length(points, start)] + [entry.length for entry in result.log]
+    assert all(a >= b - 1e-9 for a, b in zip(lengths, lengths[1:]))
+
+
+@pytest.mark.parametrize("seed", [30, 86, 98, 225, 226])
+def test_local_search_confirms_convergence(seed):
+    # A reversal flips cities that were never queued again; these tours once stopped with a 2-opt move left
+    from TSP_Solver import local_search
+    rng = random.Random(seed)
+    points = [(rng.random() * 100, rng.random() * 100) for _ in range(rng.randrange(5, 60))]
+    start = nearest_neighbour_tour(points) if seed == 98 else rng.sample(range(len(points)), len(points))
+    result = local_search(points, start, neighbours=len(points) - 1)
+    assert result.converged and two_opt_gain(points, result.order) < 1e-6
+    assert local_search(points, result.order, neighbours=len(points) - 1).length == pytest.approx(result.length)
+
+
+def test_local_search_options():
+    from TSP_Solver import improve_tsp, local_search
+    points = random_points(9, 400)
+    start = nearest_neighbour_tour(points)
+    idle = local_search(points, start, neighbours=0)  # No candidates, so no move to try
+    assert idle.order == start and idle.converged
+    for result in (local_search(points, start, or_opt=False, max_reversal=20), local_search(points, start, time_budget=0)):
+        assert sorted(result.order) == list(range(400)) and result.length <= tour_length(points, start) + 1e-9
+    with pytest.raises(ValueError):
+        local_search(points, start[:-1])
+    visited, greedy_length = greedy_tsp(points[:])
+    improved, length, _ = improve_tsp(visited, time_budget=None)
+    assert improved[0] == improved[-1] == points[0] and sorted(improved[:-1]) == sorted(points)
+    assert length == pytest.approx(tour_length(improved, range(len(improved) - 1))) and length < greedy_length
+
+
+def test_multi_start_matches_single_runs():
+    from TSP_Solver import local_search, multi_start_tsp, neighbour_lists
+    points = random_points(10, 300)
+    serial = multi_start_tsp(points, starts=4, workers=1, seed=3)
+    starts = [run[0] for run in serial.runs]
+    assert starts[0] == 0 and len(set(starts)) == 4
+    near = neighbour_lists(points, 8)
+    lengths = [local_search(points, nearest_neighbour_tour(points, start), near).length for start in starts]
+    assert [run[1] for run in serial.runs] == pytest.approx(lengths)
+    assert serial.length == pytest.approx(min(lengths)) == pytest.approx(tour_length(points, serial.order))
+    assert serial.order[0] == serial.start and sorted(serial.order) == list(range(300))
+
+    pooled = multi_start_tsp(points, starts=starts, workers=2)
+    assert [run[0] for run in pooled.runs] == starts
+    assert [run[1] for run in pooled.runs] == pytest.approx([run[1] for run in serial.runs])
+    assert pooled.order == serial.order
+    with pytest.raises(ValueError):
+        multi_start_tsp([])
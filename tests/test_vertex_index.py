@@ -0,0 +1,39 @@
+#VertexIndex checked against the list.index lookups the GUIs used before it
+
+import pytest
+
+from Vertex_Index import VertexIndex
+
+
+def test_ids_match_list_index():
+    names = ["C", "A", "B", "A", "D", "C"]
+    index = VertexIndex(names)
+    unique = list(dict.fromkeys(names))
+    assert list(index) == unique and len(index) == len(unique)
+    for name in unique:
+        assert index.id_of(name) == unique.index(name)
+        assert index.name_of(index.id_of(name)) == index[index.id_of(name)] == name
+
+
+def test_add_keeps_first_id():
+    index = VertexIndex("ab")
+    assert index.add("b") == 1
+    assert index.add("c") == 2
+    assert "c" in index and "d" not in index
+
+
+def test_of_reuses_an_index():
+    index = VertexIndex("ab")
+    assert VertexIndex.of(index) is index
+    assert list(VertexIndex.of(["x", "y"])) == ["x", "y"]
+
+
+def test_intern_edges():
+    index = VertexIndex("ab")
+    src, dst, weights = index.intern_edges([("a", "b", 2), ("b", "c", 3.5)], add_missing=True)
+    assert (list(src), list(dst), list(weights)) == ([0, 1], [1, 2], [2.0, 3.5])
+    assert list(index) == ["a", "b", "c"]
+    with pytest.raises(ValueError):
+        index.intern_edges([("a", "z", 1)])
+    with pytest.raises(ValueError):
+        index.id_of("z")